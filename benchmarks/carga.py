@@ -0,0 +1,296 @@
+"""
+Prueba de carga de app2.py con sesiones concurrentes y una hoja de Google Sheets simulada.
+
+Cada sesión simulada recorre el flujo completo con `streamlit.testing.v1.AppTest`: abre la aplicación,
+acepta el tratamiento de datos, llena el formulario con respuestas sintéticas (`sat.sinteticos`), presiona
+"Cargar Datos" y luego "Calcular Puntaje". Si el envío falla (por ejemplo, por la cuota de la API), la
+sesión lo reintenta como lo haría un estudiante, hasta `--reintentos` veces.
+
+Todas las sesiones de un nivel empiezan a la vez, como una cohorte de inducción, y comparten el
+almacenamiento de la aplicación (`st.cache_resource`), que escribe en una `ConexionSimulada` en lugar de
+la API real (ver `hoja_simulada.py`). Para cada número de sesiones se reporta:
+
+    - rendimiento: envíos guardados por segundo (con la cola de envíos, confirmados por segundo; el JSON
+      incluye además el tiempo que tardó la cola en vaciarse después de la última sesión);
+    - latencia del flujo completo y del envío ("Cargar Datos"), p50/p90/p99 y máximo;
+    - filas perdidas (sesiones cuyo documento no quedó en la hoja), duplicadas (filas de más de un mismo
+      documento) e incorrectas (filas distintas de las respuestas y riesgos esperados);
+    - solicitudes a la hoja, errores de cuota y tiempos agotados;
+    - en el JSON, el tiempo acumulado de cada etapa medida por `sat.metricas`.
+
+Uso:
+    python benchmarks/carga.py --sesiones 1 5 10 20
+    python benchmarks/carga.py --sesiones 40 --cuota 30 --ventana 10 --tiempo-agotado 0.05 --json carga.json
+    python benchmarks/carga.py --sesiones 20 --sin-cola   # cada envío escribe directamente en la hoja
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import streamlit as st
+from streamlit import config, logger
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.secrets import Secrets
+from streamlit.testing.v1 import AppTest
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+import sat.almacenamiento  # noqa: E402
+from hoja_simulada import ConexionSimulada  # noqa: E402
+from sat.almacenamiento import COLUMNA_DOCUMENTO, COLUMNAS_REGISTRO, valor_celda  # noqa: E402
+from sat.cola import contar_pendientes  # noqa: E402
+from sat.cuestionario import PREGUNTAS_CUESTIONARIO  # noqa: E402
+from sat.metricas import metricas  # noqa: E402
+from sat.puntaje import clasificar_respuestas  # noqa: E402
+from sat.sinteticos import DOCUMENTO_INICIAL, generar_indices  # noqa: E402
+from sat.validacion import armar_fila  # noqa: E402
+
+APLICACION = str(RAIZ / "app2.py")
+MENSAJE_GUARDADO = "Respuestas guardadas exitosamente."
+MENSAJE_REGISTRADO = "Este número de documento ya está registrado. No se puede volver a cargar."
+
+
+def permitir_sesiones_concurrentes():
+    """
+    AppTest está pensado para una sesión a la vez: cada ejecución instala su propio Runtime simulado y una
+    opción de configuración global, y los retira al terminar, lo que interrumpe a las demás sesiones en
+    curso. Aquí todas las sesiones comparten un único Runtime simulado, como en un servidor real, y la opción
+    queda activa durante toda la prueba.
+    """
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime.instance = classmethod(lambda cls: runtime)
+    Runtime.exists = classmethod(lambda cls: True)
+    config.set_option("global.appTest", True)
+    # Secretos de la conexión, fijados una sola vez: AppTest los reemplaza y restaura en cada ejecución, lo
+    # que interrumpiría a las demás sesiones
+    secretos = Secrets()
+    secretos._secrets = {"connections": {"gsheets": {"type": "service_account", "spreadsheet": "hoja simulada"}}}
+    st.secrets = secretos
+    # Las excepciones de la aplicación se cuentan en el reporte en lugar de escribirse en la consola
+    logger.set_log_level("CRITICAL")
+
+
+def llenar_formulario(at, nombre, documento, indices):
+    """Asigna los valores de identificación y de las respuestas a los widgets de la aplicación."""
+    at.checkbox[0].check()  # autorización de tratamiento de datos
+    at.text_input(key="Nombre Completo").input(nombre)
+    at.text_input[1].input(str(documento))
+    for pregunta, indice in zip(PREGUNTAS_CUESTIONARIO, indices):
+        if pregunta.tipo in ("radio", "seleccion_multiple"):
+            widget = at.radio if pregunta.tipo == "radio" else at.multiselect
+            widget(key=pregunta.columna).set_value(indice)
+        elif pregunta.tipo == "casilla":
+            at.checkbox(key=pregunta.columna).set_value(pregunta.opciones[indice].texto == "Sí")
+        else:
+            widget = at.slider if pregunta.tipo == "deslizador" else at.number_input
+            widget(key=pregunta.columna).set_value(int(pregunta.opciones[indice].texto))
+
+
+def boton(at, etiqueta):
+    return next((b for b in at.button if b.label == etiqueta), None)
+
+
+def sesion(numero, indices, reintentos, espera_reintento, timeout, inicio):
+    """Recorre el flujo de una sesión; retorna un diccionario con su resultado y tiempos."""
+    nombre, documento = f"Estudiante {numero}", DOCUMENTO_INICIAL + numero
+    resultado = {"documento": documento, "estado": "fallido", "intentos": 0, "errores": [], "riesgos": None}
+    inicio.wait()
+    comienzo = time.perf_counter()
+
+    at = AppTest.from_file(APLICACION, default_timeout=timeout).run()
+    llenar_formulario(at, nombre, documento, indices)
+    at.run()
+    while resultado["intentos"] <= reintentos:
+        resultado["intentos"] += 1
+        cargar = boton(at, "Cargar Datos")
+        if cargar is None:
+            # La aplicación falló antes de mostrar el botón: el estudiante recarga la página
+            resultado["errores"].extend(str(excepcion.message) for excepcion in at.exception)
+            time.sleep(espera_reintento)
+            at.run()
+            continue
+        inicio_envio = time.perf_counter()
+        cargar.click().run()
+        resultado["segundos_envio"] = time.perf_counter() - inicio_envio
+        exitos = [elemento.value for elemento in at.success]
+        errores = [elemento.value for elemento in at.error]
+        if MENSAJE_GUARDADO in exitos:
+            resultado["estado"] = "guardado"
+            break
+        if MENSAJE_REGISTRADO in errores:
+            # Un intento anterior se guardó aunque la sesión recibió un error
+            resultado["estado"] = "rechazado_como_registrado"
+            break
+        resultado["errores"].extend([str(excepcion.message) for excepcion in at.exception] + errores)
+        time.sleep(espera_reintento)
+
+    if resultado["estado"] == "guardado":
+        boton(at, "Calcular Puntaje").click().run()
+        resultado["riesgos"] = list(at.session_state["riesgos"])
+    resultado["segundos"] = time.perf_counter() - comienzo
+    return resultado
+
+
+def resumen_tiempos(segundos):
+    if not segundos:
+        return None
+    milisegundos = np.array(segundos) * 1000
+    return {
+        "p50_ms": float(np.percentile(milisegundos, 50)),
+        "p90_ms": float(np.percentile(milisegundos, 90)),
+        "p99_ms": float(np.percentile(milisegundos, 99)),
+        "max_ms": float(milisegundos.max()),
+    }
+
+
+def verificar_hoja(conexion, resultados, esperadas):
+    """Compara las filas de la hoja simulada con las esperadas por documento."""
+    filas = conexion.hoja("Datos").filas
+    posicion = COLUMNAS_REGISTRO.index(COLUMNA_DOCUMENTO)
+    conteo = Counter(int(fila[posicion]) for fila in filas)
+    incorrectas = sum(
+        1 for fila in filas if fila != esperadas.get(int(fila[posicion]))
+    )
+    return {
+        "filas": len(filas),
+        "perdidas": sum(1 for resultado in resultados if conteo[resultado["documento"]] == 0),
+        "duplicadas": sum(cantidad - 1 for cantidad in conteo.values() if cantidad > 1),
+        "incorrectas": incorrectas,
+        "confirmadas_sin_fila": sum(
+            1 for resultado in resultados if resultado["estado"] == "guardado" and conteo[resultado["documento"]] == 0
+        ),
+    }
+
+
+def nivel(sesiones, args, semilla, directorio):
+    """Ejecuta `sesiones` sesiones simultáneas contra una hoja simulada nueva."""
+    conexion = ConexionSimulada(
+        COLUMNAS_REGISTRO, latencia_lectura=args.latencia_lectura, latencia_escritura=args.latencia_escritura,
+        cuota=args.cuota, ventana=args.ventana, probabilidad_tiempo_agotado=args.tiempo_agotado, semilla=semilla,
+    )
+    # La aplicación obtiene la conexión con st.connection("gsheets", ...) dentro de un cache_resource:
+    # se limpia la caché para que este nivel cree un almacenamiento nuevo sobre la hoja simulada
+    st.connection = lambda nombre, type=None, **opciones: conexion
+    # Las escrituras usan la hoja simulada en lugar de abrir la real con gspread y la cuenta de servicio
+    sat.almacenamiento.abrir_hoja_gspread = lambda secretos, worksheet: conexion.hoja(worksheet)
+    st.cache_resource.clear()
+    # Cola de envíos (sat.cola) nueva para cada nivel, salvo con --sin-cola
+    cola = "" if args.sin_cola else str(Path(directorio) / f"cola_{semilla}.sqlite")
+    os.environ["SAT_COLA_ENVIOS"] = cola
+
+    respuestas = generar_indices(sesiones, semilla=semilla)
+    esperadas = {}
+    for numero, indices in enumerate(respuestas):
+        documento = DOCUMENTO_INICIAL + numero
+        fila = armar_fila(documento, f"Estudiante {numero}", indices)
+        riesgos = clasificar_respuestas([indices]).iloc[0].tolist()
+        esperadas[documento] = [valor_celda(valor) for valor in fila + riesgos]
+
+    metricas.reiniciar()
+    inicio = threading.Barrier(sesiones)
+    comienzo = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sesiones) as ejecutor:
+        futuros = [
+            ejecutor.submit(sesion, numero, indices, args.reintentos, args.espera_reintento, args.timeout, inicio)
+            for numero, indices in enumerate(respuestas)
+        ]
+        resultados = [futuro.result() for futuro in futuros]
+    segundos = time.perf_counter() - comienzo
+
+    # Con la cola, las sesiones terminan antes de que las filas lleguen a la hoja: se espera a que se vacíe
+    segundos_vaciado = 0.0
+    if cola:
+        while contar_pendientes(cola) and time.perf_counter() - comienzo < segundos + args.espera_cola:
+            time.sleep(0.1)
+        segundos_vaciado = time.perf_counter() - comienzo - segundos
+
+    hoja = verificar_hoja(conexion, resultados, esperadas)
+    riesgos_distintos = sum(
+        1 for resultado in resultados
+        if resultado["riesgos"] is not None and resultado["riesgos"] != esperadas[resultado["documento"]][-4:]
+    )
+    estados = Counter(resultado["estado"] for resultado in resultados)
+    return {
+        "sesiones": sesiones,
+        "segundos": segundos,
+        "segundos_vaciado_cola": segundos_vaciado,
+        "guardados_por_segundo": estados["guardado"] / segundos,
+        "estados": dict(estados),
+        "reintentos": sum(resultado["intentos"] - 1 for resultado in resultados),
+        "flujo": resumen_tiempos([resultado["segundos"] for resultado in resultados]),
+        "envio": resumen_tiempos([resultado["segundos_envio"] for resultado in resultados if "segundos_envio" in resultado]),
+        "hoja": hoja,
+        "riesgos_mostrados_distintos": riesgos_distintos,
+        "api": dict(conexion.estadisticas),
+        "etapas": metricas.resumen()["etapas"],
+        "errores": dict(Counter(error for resultado in resultados for error in resultado["errores"]).most_common(5)),
+    }
+
+
+def imprimir(resultado):
+    hoja, api = resultado["hoja"], resultado["api"]
+    flujo, envio = resultado["flujo"], resultado["envio"] or {"p50_ms": float("nan"), "p99_ms": float("nan")}
+    print(f"{resultado['sesiones']:>8} {resultado['guardados_por_segundo']:>9.2f} "
+          f"{flujo['p50_ms']:>9.0f} {flujo['p99_ms']:>9.0f} {envio['p50_ms']:>9.0f} {envio['p99_ms']:>9.0f} "
+          f"{hoja['perdidas']:>8} {hoja['duplicadas']:>8} {hoja['incorrectas']:>8} "
+          f"{resultado['reintentos']:>9} {api['errores_cuota']:>7} {api['tiempos_agotados']:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba de carga de app2.py con una hoja de Google Sheets simulada.")
+    parser.add_argument("--sesiones", type=int, nargs="+", default=[1, 5, 10, 20], help="Sesiones simultáneas por nivel")
+    parser.add_argument("--latencia-lectura", type=float, default=0.3, help="Latencia base de una lectura (s)")
+    parser.add_argument("--latencia-escritura", type=float, default=0.5, help="Latencia base de una escritura (s)")
+    parser.add_argument("--cuota", type=int, default=60, help="Solicitudes admitidas por ventana (0 = sin cuota)")
+    parser.add_argument("--ventana", type=float, default=60.0, help="Duración de la ventana de cuota (s)")
+    parser.add_argument("--tiempo-agotado", type=float, default=0.0,
+                        help="Probabilidad de que una escritura se aplique sin respuesta")
+    parser.add_argument("--reintentos", type=int, default=2, help="Reintentos de 'Cargar Datos' tras un error")
+    parser.add_argument("--espera-reintento", type=float, default=1.0, help="Espera antes de reintentar (s)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Tiempo máximo de cada ejecución de AppTest (s)")
+    parser.add_argument("--sin-cola", action="store_true", help="Escribir cada envío directamente en la hoja")
+    parser.add_argument("--espera-cola", type=float, default=300.0,
+                        help="Tiempo máximo de espera para que la cola se vacíe al final de cada nivel (s)")
+    parser.add_argument("--json", type=Path, help="Archivo donde escribir los resultados")
+    args = parser.parse_args(argv)
+    args.cuota = args.cuota or None
+
+    # La aplicación usa Google Sheets; la conexión real se reemplaza por la simulada en cada nivel.
+    # Las imágenes del cuestionario tienen rutas relativas a la raíz del repositorio.
+    os.environ["SAT_ALMACENAMIENTO"] = "gsheets"
+    os.chdir(RAIZ)
+    permitir_sesiones_concurrentes()
+
+    print(f"{'sesiones':>8} {'guard/s':>9} {'flujo p50':>9} {'flujo p99':>9} {'envío p50':>9} {'envío p99':>9} "
+          f"{'perdidas':>8} {'duplic.':>8} {'incorr.':>8} {'reintentos':>9} {'cuota':>7} {'agotados':>8}")
+    resultados = []
+    with tempfile.TemporaryDirectory() as directorio:
+        for semilla, sesiones in enumerate(args.sesiones):
+            resultado = nivel(sesiones, args, semilla, directorio)
+            imprimir(resultado)
+            resultados.append(resultado)
+
+    if args.json:
+        args.json.write_text(json.dumps(resultados, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
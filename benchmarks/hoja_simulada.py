@@ -0,0 +1,120 @@
+"""
+Hoja de Google Sheets simulada en memoria, para pruebas de carga sin la API real.
+
+`ConexionSimulada` reemplaza a `st.connection("gsheets", type=GSheetsConnection)` (`read`) y, con `hoja`, a la
+hoja de gspread que abre `sat.almacenamiento.abrir_hoja_gspread` (`append_row`/`append_rows`): es lo que usa
+`sat.almacenamiento.AlmacenamientoGSheets`.
+Modela los tres comportamientos de la API que importan bajo carga:
+
+    - Latencia: cada llamada espera un tiempo base más una parte aleatoria; las lecturas además crecen con
+      el número de filas descargadas.
+    - Cuota: como la API de Sheets, admite un número máximo de solicitudes por ventana de tiempo; las que la
+      exceden fallan con `ErrorCuota` (HTTP 429) sin modificar la hoja.
+    - Tiempo agotado: con probabilidad `probabilidad_tiempo_agotado`, una escritura se aplica en la hoja pero
+      la respuesta se pierde y el cliente recibe `ErrorTiempoAgotado`, de modo que un reintento la duplica.
+
+Las esperas usan `time.sleep`, que libera el GIL, así varias sesiones simuladas esperan a la vez como lo
+harían contra el servidor real.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+
+
+class ErrorCuota(Exception):
+    """La solicitud excedió la cuota de la API (HTTP 429: RESOURCE_EXHAUSTED)."""
+
+
+class ErrorTiempoAgotado(Exception):
+    """La solicitud no recibió respuesta a tiempo; la escritura pudo haberse aplicado."""
+
+
+class HojaSimulada:
+    """Hoja de cálculo: filas en memoria, con los encabezados de `columnas`."""
+
+    def __init__(self, conexion, columnas):
+        self._conexion = conexion
+        self.columnas = list(columnas)
+        self.filas = []
+
+    def append_row(self, fila, **opciones):
+        self.append_rows([fila], **opciones)
+
+    def append_rows(self, filas, **opciones):
+        self._conexion._solicitud(escritura=True, aplicar=lambda: self.filas.extend(list(fila) for fila in filas))
+
+
+class ConexionSimulada:
+    """
+    Conexión con la interfaz de GSheetsConnection que usa la aplicación.
+
+    Parámetros (tiempos en segundos):
+        columnas: encabezados de las hojas (por ejemplo, COLUMNAS_REGISTRO).
+        latencia_lectura, latencia_escritura: tiempo base de cada llamada.
+        latencia_por_fila: tiempo adicional de una lectura por cada fila descargada.
+        variacion: fracción aleatoria adicional de la latencia (0.5 = hasta 50 % más).
+        cuota: solicitudes admitidas por `ventana`; None desactiva la cuota.
+        probabilidad_tiempo_agotado: probabilidad de que una escritura aplicada no reciba respuesta.
+    """
+
+    def __init__(self, columnas, latencia_lectura=0.3, latencia_escritura=0.5, latencia_por_fila=0.00005,
+                 variacion=0.5, cuota=60, ventana=60.0, probabilidad_tiempo_agotado=0.0, semilla=0):
+        self.columnas = list(columnas)
+        self.latencia_lectura = latencia_lectura
+        self.latencia_escritura = latencia_escritura
+        self.latencia_por_fila = latencia_por_fila
+        self.variacion = variacion
+        self.cuota = cuota
+        self.ventana = ventana
+        self.probabilidad_tiempo_agotado = probabilidad_tiempo_agotado
+        self._hojas = {}
+        self._solicitudes = deque()  # instantes de las solicitudes admitidas dentro de la ventana
+        self._aleatorio = random.Random(semilla)
+        self._lock = threading.Lock()
+        self.estadisticas = {"lecturas": 0, "escrituras": 0, "errores_cuota": 0, "tiempos_agotados": 0}
+
+    def hoja(self, nombre="Datos"):
+        with self._lock:
+            if nombre not in self._hojas:
+                self._hojas[nombre] = HojaSimulada(self, self.columnas)
+            return self._hojas[nombre]
+
+    def _admitir(self):
+        # Ventana deslizante: la solicitud se rechaza si ya hay `cuota` solicitudes en los últimos `ventana` s
+        if self.cuota is None:
+            return True
+        ahora = time.monotonic()
+        while self._solicitudes and ahora - self._solicitudes[0] > self.ventana:
+            self._solicitudes.popleft()
+        if len(self._solicitudes) >= self.cuota:
+            return False
+        self._solicitudes.append(ahora)
+        return True
+
+    def _solicitud(self, escritura, aplicar, filas=0):
+        base = self.latencia_escritura if escritura else self.latencia_lectura + self.latencia_por_fila * filas
+        with self._lock:
+            admitida = self._admitir()
+            espera = base * (1 + self.variacion * self._aleatorio.random())
+            perdida = escritura and self._aleatorio.random() < self.probabilidad_tiempo_agotado
+        time.sleep(espera)
+        with self._lock:
+            if not admitida:
+                self.estadisticas["errores_cuota"] += 1
+                raise ErrorCuota("Quota exceeded for quota metric 'Requests' (429 RESOURCE_EXHAUSTED)")
+            resultado = aplicar()
+            self.estadisticas["escrituras" if escritura else "lecturas"] += 1
+            if perdida:
+                self.estadisticas["tiempos_agotados"] += 1
+        if perdida:
+            raise ErrorTiempoAgotado("La escritura se aplicó pero la respuesta no llegó a tiempo")
+        return resultado
+
+    def read(self, worksheet="Datos", ttl=None, **opciones):
+        hoja = self.hoja(worksheet)
+        return self._solicitud(escritura=False, filas=len(hoja.filas),
+                               aplicar=lambda: pd.DataFrame([list(fila) for fila in hoja.filas], columns=hoja.columnas))
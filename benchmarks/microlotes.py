@@ -0,0 +1,98 @@
+"""
+Benchmark del servicio de clasificación en micro-lotes (`sat.servicio`) con sesiones concurrentes.
+
+Cada hilo simula una sesión que clasifica respuestas sintéticas de a una. Se compara la clasificación
+directa (`clasificar_respuestas` con una fila por llamada) con la clasificación a través del servicio, y se
+reporta el rendimiento, la latencia por solicitud y el tamaño medio de los lotes. También verifica que ambas
+produzcan los mismos niveles.
+
+Uso:
+    python benchmarks/microlotes.py
+    python benchmarks/microlotes.py --hilos 1 8 32 --solicitudes 200 --json microlotes.json
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sat.puntaje import clasificar_respuestas  # noqa: E402
+from sat.servicio import ServicioClasificacion  # noqa: E402
+from sat.sinteticos import generar_indices  # noqa: E402
+
+
+def correr(clasificar, respuestas, hilos):
+    """Reparte `respuestas` entre `hilos` que las clasifican de a una; retorna resultados, tiempos y segundos."""
+    resultados = [None] * len(respuestas)
+    tiempos = [0.0] * len(respuestas)
+    inicio = threading.Barrier(hilos + 1)
+
+    def sesion(desde):
+        inicio.wait()
+        for i in range(desde, len(respuestas), hilos):
+            comienzo = time.perf_counter()
+            resultados[i] = clasificar(respuestas[i])
+            tiempos[i] = time.perf_counter() - comienzo
+
+    trabajadores = [threading.Thread(target=sesion, args=(desde,)) for desde in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    inicio.wait()
+    comienzo = time.perf_counter()
+    for trabajador in trabajadores:
+        trabajador.join()
+    return resultados, tiempos, time.perf_counter() - comienzo
+
+
+def resumen(tiempos, segundos):
+    milisegundos = np.array(tiempos) * 1000
+    return {
+        "solicitudes_por_segundo": len(tiempos) / segundos,
+        "p50_ms": float(np.percentile(milisegundos, 50)),
+        "p99_ms": float(np.percentile(milisegundos, 99)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del servicio de clasificación en micro-lotes.")
+    parser.add_argument("--hilos", type=int, nargs="+", default=[1, 4, 16, 64], help="Sesiones concurrentes")
+    parser.add_argument("--solicitudes", type=int, default=100, help="Solicitudes por sesión")
+    parser.add_argument("--espera-maxima", type=float, default=0.0, help="Espera máxima del servicio (s)")
+    parser.add_argument("--json", type=Path, help="Archivo donde escribir los resultados")
+    args = parser.parse_args(argv)
+
+    clasificar_respuestas(generar_indices(10))  # calentamiento: carga de modelos y tablas
+    resultados = []
+    print(f"{'hilos':>6} {'directo sol/s':>14} {'p99 ms':>8} {'servicio sol/s':>15} {'p99 ms':>8} {'lote medio':>11}")
+    for hilos in args.hilos:
+        respuestas = generar_indices(hilos * args.solicitudes, semilla=hilos)
+        directo, tiempos_directo, segundos_directo = correr(
+            lambda respuesta: clasificar_respuestas([respuesta]).iloc[0].tolist(), respuestas, hilos)
+        servicio = ServicioClasificacion(espera_maxima=args.espera_maxima)
+        agrupado, tiempos_servicio, segundos_servicio = correr(servicio.clasificar, respuestas, hilos)
+        if directo != agrupado:
+            print(f"Resultados distintos con {hilos} hilos", file=sys.stderr)
+            return 1
+        fila = {
+            "hilos": hilos,
+            "directo": resumen(tiempos_directo, segundos_directo),
+            "servicio": {**resumen(tiempos_servicio, segundos_servicio), **servicio.estadisticas()},
+        }
+        resultados.append(fila)
+        print(f"{hilos:>6} {fila['directo']['solicitudes_por_segundo']:>14.0f} {fila['directo']['p99_ms']:>8.2f} "
+              f"{fila['servicio']['solicitudes_por_segundo']:>15.0f} {fila['servicio']['p99_ms']:>8.2f} "
+              f"{fila['servicio']['tamano_medio']:>11.1f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(resultados, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Benchmark de la expansión de la pregunta de selección múltiple "situaciones familiares".
+
+Compara, para varios tamaños de lote, la expansión fila por fila anterior (split + apply(pd.Series) + map)
+con `sat.puntaje.codificar_situaciones`, y verifica que ambas produzcan las mismas 9 columnas.
+
+Uso:
+    python benchmarks/situaciones.py
+    python benchmarks/situaciones.py --tamanos 1000 100000 --json situaciones.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sat.cuestionario import DIAGNOSTICO  # noqa: E402
+from sat.puntaje import PREGUNTA_SITUACIONES, codificar_situaciones  # noqa: E402
+
+OPCIONES = next(pregunta for pregunta in DIAGNOSTICO.preguntas if pregunta.columna == PREGUNTA_SITUACIONES).textos
+
+
+def situaciones_fila_por_fila(valores):
+    """Implementación anterior, celda por celda, usada como referencia."""
+    def dividir(texto, max_splits=9):
+        frases = [frase.strip() for frase in texto.split(',')]
+        while len(frases) < max_splits:
+            frases.append(None)
+        return frases[:max_splits]
+
+    def asignar(valor):
+        if pd.isna(valor) or valor == '':
+            return 0
+        elif valor == 'Ninguna':
+            return 1
+        else:
+            return 5
+
+    columnas = pd.Series(valores, dtype=object).astype(str).apply(dividir).apply(pd.Series)
+    return columnas.apply(lambda col: col.map(asignar)).to_numpy(dtype=float)
+
+
+def generar_valores(n, semilla=0):
+    """Respuestas como las guarda la hoja: de 0 a 4 situaciones separadas por ", ", o "Ninguna"."""
+    rng = np.random.default_rng(semilla)
+    situaciones = [opcion for opcion in OPCIONES if opcion != "Ninguna"]
+    valores = []
+    for cantidad in rng.integers(0, 5, size=n):
+        valores.append("Ninguna" if cantidad == 0 else ", ".join(rng.choice(situaciones, size=cantidad, replace=False)))
+    return valores
+
+
+def medir(funcion, valores, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(valores)
+        tiempos.append(time.perf_counter() - inicio)
+    return resultado, min(tiempos)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de la expansión de situaciones familiares.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[1, 100, 1000, 10000, 100000])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="Archivo donde escribir los resultados")
+    args = parser.parse_args(argv)
+
+    # Casos límite además de las respuestas habituales
+    especiales = ["", "Ninguna", np.nan, "Texto desconocido", ", ".join(OPCIONES), "Violencia intrafamiliar,,Ninguna"]
+    esperado = situaciones_fila_por_fila(especiales)
+    if not np.array_equal(esperado, codificar_situaciones(especiales)):
+        print("Los casos límite no coinciden con la implementación anterior", file=sys.stderr)
+        return 1
+
+    resultados = []
+    print(f"{'filas':>8} {'fila por fila (s)':>18} {'vectorizado (s)':>16} {'aceleración':>12}")
+    for tamano in args.tamanos:
+        valores = generar_valores(tamano)
+        anterior, segundos_anterior = medir(situaciones_fila_por_fila, valores, args.repeticiones)
+        nuevo, segundos_nuevo = medir(codificar_situaciones, valores, args.repeticiones)
+        if not np.array_equal(anterior, nuevo):
+            print(f"Resultados distintos con {tamano} filas", file=sys.stderr)
+            return 1
+        resultados.append({"filas": tamano, "segundos_fila_por_fila": segundos_anterior,
+                           "segundos_vectorizado": segundos_nuevo, "aceleracion": segundos_anterior / segundos_nuevo})
+        print(f"{tamano:>8} {segundos_anterior:>18.4f} {segundos_nuevo:>16.4f} {segundos_anterior / segundos_nuevo:>11.1f}x")
+
+    if args.json:
+        args.json.write_text(json.dumps(resultados, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Suite de benchmarks del cálculo de riesgo SAT con datos sintéticos (`sat.sinteticos`).
+
+Escenarios:
+    - Latencia de una sola fila (percentiles p50, p90, p99): Asignacion_SAT, df_numeric, clasificar_respuestas
+      (lo que usa la aplicación), validar_entrada y el envío completo (validar, armar la fila, clasificar y
+      guardar en un almacenamiento SQLite temporal).
+    - Rendimiento por lotes de clasificar_lote con 1k, 10k y 100k filas (filas por segundo).
+    - Memoria máxima de cada escenario, medida con tracemalloc en una ejecución aparte, y memoria residente
+      máxima del proceso.
+
+Los resultados se escriben en JSON junto con la versión del código y de las librerías, para comparar
+ejecuciones antes y después de un cambio.
+
+Uso:
+    python benchmarks/suite.py --json antes.json
+    python benchmarks/suite.py --json despues.json --comparar antes.json
+    python benchmarks/suite.py --rapido        # lotes de 1k y 10k y menos repeticiones
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from sat.almacenamiento import AlmacenamientoSQLite  # noqa: E402
+from sat.modelos import registro  # noqa: E402
+from sat.puntaje import (  # noqa: E402
+    MAXIMO_FILAS_COMPILADO,
+    Asignacion_SAT,
+    clasificar_lote,
+    clasificar_respuestas,
+    df_numeric,
+)
+from sat.sinteticos import generar_filas, generar_indices  # noqa: E402
+from sat.validacion import armar_fila, validar_entrada  # noqa: E402
+
+TAMANOS_LOTE = (1_000, 10_000, 100_000)
+
+
+def percentiles(tiempos):
+    milisegundos = np.array(tiempos) * 1000
+    return {
+        "repeticiones": len(tiempos),
+        "p50_ms": float(np.percentile(milisegundos, 50)),
+        "p90_ms": float(np.percentile(milisegundos, 90)),
+        "p99_ms": float(np.percentile(milisegundos, 99)),
+        "media_ms": float(milisegundos.mean()),
+    }
+
+
+def memoria_maxima(funcion):
+    """Bytes máximos asignados durante una ejecución de `funcion`."""
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def latencia(funcion, argumentos, calentamiento=5):
+    """Ejecuta `funcion` una vez por cada elemento de `argumentos` y retorna la lista de tiempos."""
+    for argumento in argumentos[:calentamiento]:
+        funcion(argumento)
+    tiempos = []
+    for argumento in argumentos:
+        inicio = time.perf_counter()
+        funcion(argumento)
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def escenarios_una_fila(repeticiones, directorio):
+    # Una fila extra para medir la memoria del envío con un documento que aún no está guardado
+    filas = generar_filas(repeticiones + 1, semilla=1)
+    indices = generar_indices(repeticiones + 1, semilla=1)
+    documentos = filas.iloc[:, 1].tolist()
+    nombres = filas.iloc[:, 0].tolist()
+    filas_df = [filas.iloc[[i]] for i in range(repeticiones + 1)]
+
+    # Almacenamiento con respuestas previas, para que la verificación de duplicados consulte un índice real
+    almacenamiento = AlmacenamientoSQLite(Path(directorio) / "benchmark.sqlite")
+    for fila in generar_filas(1000, semilla=2, documento_inicial=1).itertuples(index=False):
+        almacenamiento.agregar(list(fila) + [""] * 4)
+
+    def enviar(i):
+        valido, _ = validar_entrada(documentos[i], nombres[i], True, indices[i], almacenamiento)
+        fila = armar_fila(documentos[i], nombres[i], indices[i])
+        riesgos = clasificar_respuestas([indices[i]]).iloc[0].tolist()
+        almacenamiento.agregar_nuevo(fila + riesgos)
+        return valido
+
+    casos = {
+        "Asignacion_SAT": (Asignacion_SAT, filas_df),
+        "df_numeric": (df_numeric, filas_df),
+        "clasificar_respuestas": (lambda fila: clasificar_respuestas([fila]), indices),
+        "validar_entrada": (lambda i: validar_entrada(documentos[i], nombres[i], True, indices[i], almacenamiento),
+                            list(range(repeticiones + 1))),
+    }
+    resultados = {}
+    for nombre, (funcion, argumentos) in casos.items():
+        resultados[nombre] = percentiles(latencia(funcion, argumentos))
+        resultados[nombre]["memoria_maxima_bytes"] = memoria_maxima(lambda: funcion(argumentos[0]))
+
+    # El envío guarda cada documento una sola vez, por lo que no tiene calentamiento
+    resultados["envio"] = percentiles(latencia(enviar, list(range(repeticiones)), calentamiento=0))
+    resultados["envio"]["memoria_maxima_bytes"] = memoria_maxima(lambda: enviar(repeticiones))
+    return resultados
+
+
+def escenarios_lote(tamanos):
+    # Calentamiento: los lotes grandes usan los modelos de sklearn, que los escenarios de una fila no cargan
+    # (usan los bosques compilados); sin esto, el primer tamaño incluiría la deserialización de los .pkl
+    for nombre in registro.nombres():
+        registro.obtener(nombre)
+    clasificar_lote(generar_filas(MAXIMO_FILAS_COMPILADO + 1, semilla=4))
+    resultados = {}
+    for tamano in tamanos:
+        filas = generar_filas(tamano, semilla=3)
+        inicio = time.perf_counter()
+        clasificar_lote(filas)
+        segundos = time.perf_counter() - inicio
+        resultados[f"clasificar_lote_{tamano}"] = {
+            "filas": tamano,
+            "segundos": segundos,
+            "filas_por_segundo": tamano / segundos,
+            "memoria_maxima_bytes": memoria_maxima(lambda: clasificar_lote(filas)),
+        }
+    return resultados
+
+
+def metadatos():
+    import pandas as pd
+    import sklearn
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+def comparar(actual, anterior):
+    """Imprime la razón actual/anterior de las métricas principales de cada escenario."""
+    print(f"\n{'escenario':<28} {'métrica':<18} {'anterior':>12} {'actual':>12} {'razón':>8}")
+    for nombre, resultado in actual["resultados"].items():
+        previo = anterior["resultados"].get(nombre)
+        if previo is None:
+            continue
+        metrica = "filas_por_segundo" if "filas_por_segundo" in resultado else "p50_ms"
+        for clave in (metrica, "memoria_maxima_bytes"):
+            if clave in resultado and clave in previo and previo[clave]:
+                print(f"{nombre:<28} {clave:<18} {previo[clave]:>12.3f} {resultado[clave]:>12.3f} "
+                      f"{resultado[clave] / previo[clave]:>7.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del cálculo de riesgo SAT.")
+    parser.add_argument("--repeticiones", type=int, default=300, help="Repeticiones de los escenarios de una fila")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS_LOTE), help="Tamaños de lote")
+    parser.add_argument("--rapido", action="store_true", help="Lotes de 1k y 10k y 100 repeticiones")
+    parser.add_argument("--json", type=Path, help="Archivo donde escribir los resultados")
+    parser.add_argument("--comparar", type=Path, help="Resultados JSON de una ejecución anterior")
+    args = parser.parse_args(argv)
+    if args.rapido:
+        args.repeticiones, args.tamanos = 100, [1_000, 10_000]
+
+    with tempfile.TemporaryDirectory() as directorio:
+        resultados = escenarios_una_fila(args.repeticiones, directorio)
+    resultados.update(escenarios_lote(args.tamanos))
+    datos = {"metadatos": metadatos(), "resultados": resultados}
+    try:
+        import resource
+
+        # Memoria residente máxima de todo el proceso (KiB en Linux)
+        datos["metadatos"]["memoria_residente_maxima_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        pass
+
+    for nombre, resultado in resultados.items():
+        memoria = resultado["memoria_maxima_bytes"] / 2**10
+        if "p50_ms" in resultado:
+            print(f"{nombre:<28} p50 {resultado['p50_ms']:8.2f} ms  p90 {resultado['p90_ms']:8.2f} ms  "
+                  f"p99 {resultado['p99_ms']:8.2f} ms  memoria {memoria:10.0f} KiB")
+        else:
+            print(f"{nombre:<28} {resultado['filas_por_segundo']:10.0f} filas/s  {resultado['segundos']:7.2f} s  "
+                  f"memoria {memoria:10.0f} KiB")
+
+    if args.json:
+        args.json.write_text(json.dumps(datos, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.comparar:
+        comparar(datos, json.loads(args.comparar.read_text(encoding="utf-8")))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
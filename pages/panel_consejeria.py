@@ -0,0 +1,68 @@
+"""
+Panel de consejería: número de estudiantes por componente y nivel de riesgo, por cohorte.
+
+Lee los conteos agregados de `sat.agregados`, que la aplicación actualiza con cada envío, por lo que abre en
+tiempo constante sin descargar la hoja "Datos". El acceso requiere la clave de SAT_CLAVE_PANEL o de
+`st.secrets["panel"]["clave"]`; sin clave configurada el panel queda deshabilitado.
+"""
+
+import hmac
+import os
+
+import streamlit as st
+
+from sat.agregados import SIN_CALCULAR, AgregadosRiesgo
+
+st.title("PANEL DE CONSEJERÍA")
+
+
+def clave_panel():
+    clave = os.environ.get("SAT_CLAVE_PANEL")
+    if clave:
+        return clave
+    try:
+        return st.secrets["panel"]["clave"]
+    except (KeyError, FileNotFoundError):
+        return None
+
+
+@st.cache_resource
+def obtener_agregados():
+    return AgregadosRiesgo(os.environ.get("SAT_AGREGADOS", "agregados_sat.sqlite"))
+
+
+clave = clave_panel()
+if clave is None:
+    st.error("El panel no está habilitado: configure la clave en SAT_CLAVE_PANEL o en st.secrets['panel']['clave'].")
+    st.stop()
+if not st.session_state.get("panel_autorizado"):
+    ingresada = st.text_input("Clave del panel", type="password")
+    if not ingresada:
+        st.stop()
+    # En bytes: compare_digest no admite cadenas con caracteres no ASCII (por ejemplo, "contraseña")
+    if not hmac.compare_digest(ingresada.encode(), str(clave).encode()):
+        st.error("Clave incorrecta.")
+        st.stop()
+    st.session_state.panel_autorizado = True
+    st.rerun()
+
+agregados = obtener_agregados()
+cohortes = agregados.cohortes()
+seleccion = st.selectbox("Cohorte", ["Todas"] + cohortes)
+cohorte = None if seleccion == "Todas" else seleccion
+conteos = agregados.conteos(cohorte)
+if SIN_CALCULAR in conteos.columns and not conteos[SIN_CALCULAR].any():
+    conteos = conteos.drop(columns=SIN_CALCULAR)
+
+st.metric("Estudiantes", agregados.total(cohorte))
+
+columnas = st.columns(len(conteos.index))
+for columna, (componente, niveles) in zip(columnas, conteos.iterrows()):
+    with columna:
+        st.markdown(f"**{componente}**")
+        for nivel, cantidad in niveles.items():
+            st.metric(nivel, int(cantidad))
+
+st.subheader("Estudiantes por nivel de riesgo", divider=True)
+st.bar_chart(conteos)
+st.dataframe(conteos)
@@ -0,0 +1,6 @@
+"""
+Paquete de apoyo del cuestionario SAT (alertas tempranas, intervención y seguimiento).
+
+Contiene la lógica que no depende de la interfaz de Streamlit en app2.py, de modo que pueda
+reutilizarse desde la aplicación, scripts de línea de comandos y procesos por lotes.
+"""
@@ -0,0 +1,164 @@
+"""
+Conteos agregados de estudiantes por cohorte, componente y nivel de riesgo, para el panel de consejería.
+
+Cada envío clasificado suma 1 al conteo de su nivel en cada componente (`AgregadosRiesgo.registrar`), dentro
+de una transacción SQLite, en lugar de recalcular todo desde la hoja "Datos". Los documentos ya contados se
+guardan aparte, de modo que registrar dos veces el mismo envío (por ejemplo, en una reconstrucción) no
+altera los conteos. Consultar los conteos lee como máximo cohortes × componentes × niveles filas, sin
+importar cuántas respuestas existan.
+
+La cohorte es el semestre del envío ("2024-1" de enero a junio, "2024-2" de julio a diciembre).
+
+Uso:
+    python -m sat.agregados mostrar [--cohorte 2024-2]
+    python -m sat.agregados reconstruir respuestas.csv --cohorte 2024-2   # a partir de una exportación
+"""
+
+import argparse
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from datetime import date
+
+import pandas as pd
+
+from sat.metricas import metricas
+from sat.puntaje import COLUMNAS_RIESGO, mapa_etiquetas
+
+# Nivel registrado para un componente que no se pudo clasificar
+SIN_CALCULAR = "SIN CALCULAR"
+
+NIVELES = [mapa_etiquetas[clase] for clase in sorted(mapa_etiquetas)] + [SIN_CALCULAR]
+
+
+def cohorte_de(fecha=None):
+    """Semestre académico de `fecha` (por defecto, hoy) en la forma "AAAA-1" o "AAAA-2"."""
+    fecha = fecha or date.today()
+    return f"{fecha.year}-{1 if fecha.month <= 6 else 2}"
+
+
+class AgregadosRiesgo:
+    """Conteos por (cohorte, componente, nivel) en una base SQLite, actualizados con cada envío."""
+
+    def __init__(self, ruta="agregados_sat.sqlite"):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False, isolation_level=None)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS conteos (cohorte TEXT NOT NULL, componente TEXT NOT NULL, "
+            "nivel TEXT NOT NULL, cantidad INTEGER NOT NULL, PRIMARY KEY (cohorte, componente, nivel))"
+        )
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS contados (documento INTEGER PRIMARY KEY, cohorte TEXT NOT NULL)"
+        )
+
+    def registrar_lote(self, documentos, riesgos, cohorte=None):
+        """
+        Suma a los conteos los envíos de `documentos`, cuyos niveles son las filas de `riesgos` (listas en el
+        orden de COLUMNAS_RIESGO). Los documentos ya contados se omiten. Retorna cuántos envíos se sumaron.
+        """
+        cohorte = cohorte or cohorte_de()
+        suma = Counter()
+        with self._lock, metricas.medir("actualizar_agregados"):
+            self._conexion.execute("BEGIN IMMEDIATE")
+            try:
+                for documento, niveles in zip(documentos, riesgos):
+                    cursor = self._conexion.execute(
+                        "INSERT OR IGNORE INTO contados (documento, cohorte) VALUES (?, ?)", (int(documento), cohorte)
+                    )
+                    if cursor.rowcount:
+                        suma.update(zip(COLUMNAS_RIESGO, (nivel or SIN_CALCULAR for nivel in niveles)))
+                self._conexion.executemany(
+                    "INSERT INTO conteos (cohorte, componente, nivel, cantidad) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (cohorte, componente, nivel) DO UPDATE SET cantidad = cantidad + excluded.cantidad",
+                    [(cohorte, componente, nivel, cantidad) for (componente, nivel), cantidad in suma.items()],
+                )
+                self._conexion.execute("COMMIT")
+            except BaseException:
+                self._conexion.execute("ROLLBACK")
+                raise
+        return sum(suma.values()) // len(COLUMNAS_RIESGO)
+
+    def registrar(self, documento, riesgos, cohorte=None):
+        """Suma un envío clasificado. Retorna False si el documento ya estaba contado."""
+        return self.registrar_lote([documento], [riesgos], cohorte) == 1
+
+    def cohortes(self):
+        """Cohortes con al menos un envío, de la más reciente a la más antigua."""
+        with self._lock:
+            return [cohorte for (cohorte,) in
+                    self._conexion.execute("SELECT DISTINCT cohorte FROM conteos ORDER BY cohorte DESC")]
+
+    def conteos(self, cohorte=None):
+        """
+        DataFrame con una fila por componente (COLUMNAS_RIESGO) y una columna por nivel (NIVELES), con el
+        número de estudiantes de `cohorte`, o de todas las cohortes si es None.
+        """
+        consulta = "SELECT componente, nivel, SUM(cantidad) FROM conteos"
+        parametros = ()
+        if cohorte is not None:
+            consulta += " WHERE cohorte = ?"
+            parametros = (cohorte,)
+        with self._lock:
+            filas = self._conexion.execute(consulta + " GROUP BY componente, nivel", parametros).fetchall()
+        tabla = pd.DataFrame(0, index=COLUMNAS_RIESGO, columns=NIVELES)
+        for componente, nivel, cantidad in filas:
+            tabla.loc[componente, nivel] = cantidad
+        return tabla
+
+    def total(self, cohorte=None):
+        """Número de estudiantes contados en `cohorte` (o en todas)."""
+        return int(self.conteos(cohorte).iloc[0].sum())
+
+
+def reconstruir(agregados, ruta, cohorte, tamano_bloque=10000):
+    """
+    Suma a `agregados` todas las respuestas de una exportación CSV o Parquet de la hoja "Datos".
+    Retorna (envíos sumados, filas omitidas por no tener un número de documento válido).
+    """
+    from sat.almacenamiento import COLUMNA_DOCUMENTO
+    from sat.clasificar import leer_bloques
+    from sat.puntaje import clasificar_lote
+
+    sumados = omitidos = 0
+    for bloque in leer_bloques(ruta, tamano_bloque, columnas_id=(COLUMNA_DOCUMENTO,)):
+        # Filas sin documento (celdas vacías o texto): no se pueden asociar a un estudiante
+        documentos = pd.to_numeric(bloque[COLUMNA_DOCUMENTO], errors="coerce")
+        validas = documentos.notna()
+        omitidos += int((~validas).sum())
+        if not validas.any():
+            continue
+        bloque = bloque[validas]
+        riesgos = clasificar_lote(bloque, estricto=False)
+        sumados += agregados.registrar_lote(documentos[validas].astype("int64"), riesgos.itertuples(index=False), cohorte)
+    return sumados, omitidos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sat.agregados",
+                                     description="Conteos de riesgo SAT por cohorte para el panel de consejería.")
+    parser.add_argument("--ruta", default="agregados_sat.sqlite", help="Base SQLite de los conteos")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    mostrar = subcomandos.add_parser("mostrar", help="Muestra los conteos de una cohorte o de todas")
+    mostrar.add_argument("--cohorte", help="Cohorte, por ejemplo 2024-2 (por defecto, todas)")
+    desde = subcomandos.add_parser("reconstruir", help="Suma los envíos de una exportación CSV o Parquet")
+    desde.add_argument("entrada", help="Archivo .csv o .parquet con las respuestas")
+    desde.add_argument("--cohorte", default=cohorte_de(), help="Cohorte asignada a esas respuestas")
+    args = parser.parse_args(argv)
+
+    agregados = AgregadosRiesgo(args.ruta)
+    if args.comando == "reconstruir":
+        sumados, omitidos = reconstruir(agregados, args.entrada, args.cohorte)
+        print(f"{sumados} envíos sumados a la cohorte {args.cohorte}")
+        if omitidos:
+            print(f"{omitidos} filas sin número de documento válido omitidas")
+    else:
+        print(f"Cohorte: {args.cohorte or 'todas'} ({agregados.total(args.cohorte)} estudiantes)")
+        print(agregados.conteos(args.cohorte).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
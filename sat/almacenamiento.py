@@ -0,0 +1,563 @@
+"""
+Almacenamiento de las respuestas del cuestionario SAT.
+
+Todos los almacenamientos implementan la interfaz `Almacenamiento`: leer todas las respuestas, agregar una
+fila, verificar si un documento ya está registrado y obtener las respuestas de un documento. Cada envío se
+guarda agregando una sola fila, de modo que el costo de escritura es constante sin importar cuántas
+respuestas existan y dos envíos simultáneos no se sobrescriben entre sí. Los documentos registrados se
+mantienen en un `IndiceDocumentos` en memoria, así la verificación de duplicados no recorre los datos.
+
+    - AlmacenamientoGSheets: hoja "Datos" de Google Sheets (lecturas con GSheetsConnection, append_row de gspread).
+    - AlmacenamientoSQLite: tabla SQLite local con índice sobre el número de documento.
+    - AlmacenamientoParquet: archivo columnar en un directorio de archivos Parquet, para análisis.
+    - AlmacenamientoEnCola (sat.cola): envuelve a cualquiera de los anteriores con una cola local durable.
+
+`crear_almacenamiento` construye cualquiera de ellos a partir de su nombre.
+"""
+
+import contextvars
+import functools
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from sat.cuestionario import PREGUNTAS_CUESTIONARIO
+from sat.metricas import metricas
+from sat.puntaje import COLUMNAS_RIESGO
+
+_log = logging.getLogger(__name__)
+
+# Estadísticas de lectura de la sesión en curso (ver `atribuir_lecturas`)
+_estadisticas_sesion = contextvars.ContextVar("estadisticas_sesion", default=None)
+
+COLUMNA_NOMBRE = "Nombre y apellidos completos."
+COLUMNA_DOCUMENTO = "Número de documento de identidad."
+
+# Encabezados de las 136 columnas de la hoja "Datos", en el orden en que la aplicación arma cada fila:
+# datos básicos seguidos de las preguntas del cuestionario en el orden de sus secciones.
+COLUMNAS_DATOS = [COLUMNA_NOMBRE, COLUMNA_DOCUMENTO] + [pregunta.columna for pregunta in PREGUNTAS_CUESTIONARIO]
+
+# Columnas del registro guardado: las respuestas seguidas de los riesgos calculados para cada componente.
+# En Google Sheets, la hoja "Datos" debe tener estos cuatro encabezados adicionales después de las respuestas.
+COLUMNAS_REGISTRO = COLUMNAS_DATOS + COLUMNAS_RIESGO
+
+
+def valor_celda(valor):
+    """Convierte una respuesta del formulario en el valor que se guarda en una celda."""
+    # Las preguntas de selección múltiple se guardan separadas por comas, como en la exportación del formulario
+    if isinstance(valor, (list, tuple)):
+        return ", ".join(str(opcion) for opcion in valor)
+    return valor
+
+
+def normalizar_documento(documento):
+    """Número de documento como entero; None si no es un número válido."""
+    try:
+        return int(float(documento))
+    except (TypeError, ValueError):
+        return None
+
+
+class DocumentoDuplicado(Exception):
+    """El número de documento ya tiene respuestas guardadas."""
+
+
+class IndiceDocumentos:
+    """
+    Conjunto de números de documento registrados, compartido por todas las sesiones del proceso.
+
+    Se carga con `cargar` (una función que retorna los documentos guardados) y luego se actualiza con cada
+    envío aceptado, de modo que la verificación de duplicados toma tiempo constante. Si `vigencia` no es None,
+    se vuelve a cargar cuando han pasado `vigencia` segundos, para incorporar los documentos que otros procesos
+    guardaron; la recarga se une a los documentos ya conocidos, así no se pierden las reservas de este proceso
+    que aún no son visibles en el almacenamiento. `reservar` verifica y agrega el documento de forma atómica,
+    así dos sesiones simultáneas con el mismo documento no pueden ser aceptadas ambas.
+    """
+
+    def __init__(self, cargar, vigencia=None):
+        self._cargar = cargar
+        self.vigencia = vigencia
+        self._documentos = None
+        self._cargado_en = 0.0
+        self._lock = threading.Lock()
+        self._lock_carga = threading.Lock()  # una sola carga a la vez, sin bloquear las consultas
+
+    def _vigente(self):
+        return self._documentos is not None and (
+            self.vigencia is None or time.monotonic() - self._cargado_en < self.vigencia)
+
+    def _asegurar_cargado(self):
+        if self._vigente():
+            return
+        with self._lock_carga:
+            if self._vigente():
+                return
+            documentos = (normalizar_documento(documento) for documento in self._cargar())
+            documentos = {documento for documento in documentos if documento is not None}
+            with self._lock:
+                self._documentos = documentos if self._documentos is None else self._documentos | documentos
+                self._cargado_en = time.monotonic()
+
+    def __contains__(self, documento):
+        self._asegurar_cargado()
+        return normalizar_documento(documento) in self._documentos
+
+    def __len__(self):
+        self._asegurar_cargado()
+        return len(self._documentos)
+
+    def reservar(self, documento):
+        """Agrega el documento y retorna True; retorna False si ya estaba registrado."""
+        self._asegurar_cargado()
+        documento = normalizar_documento(documento)
+        with self._lock:
+            if documento in self._documentos:
+                return False
+            self._documentos.add(documento)
+            return True
+
+    def liberar(self, documento):
+        """Deshace una reserva cuyo envío no pudo guardarse."""
+        self._asegurar_cargado()
+        with self._lock:
+            self._documentos.discard(normalizar_documento(documento))
+
+
+class Almacenamiento(ABC):
+    """Interfaz común de los almacenamientos de respuestas."""
+
+    _indice = None
+    # Segundos tras los cuales el índice de documentos se vuelve a cargar; None: solo al primer uso
+    vigencia_indice = None
+
+    @abstractmethod
+    def leer(self, estadisticas=None):
+        """
+        DataFrame con todas las respuestas guardadas, con las columnas de la hoja "Datos".
+
+        `estadisticas` es un diccionario opcional (por ejemplo, uno por sesión) donde los almacenamientos
+        remotos acumulan cuántas lecturas fueron descargas ("remotas") y cuántas se sirvieron de la caché.
+        """
+
+    @abstractmethod
+    def agregar(self, fila):
+        """Guarda un registro: lista de valores en el orden de COLUMNAS_REGISTRO (respuestas y riesgos)."""
+
+    def agregar_filas(self, filas):
+        """Guarda varios registros; los almacenamientos remotos lo hacen en una sola llamada."""
+        for fila in filas:
+            self.agregar(fila)
+
+    def invalidar_cache(self):
+        """Descarta las lecturas en caché, para que la siguiente lectura refleje el estado real."""
+
+    def documentos(self):
+        """Números de documento de todas las respuestas guardadas."""
+        return self.leer()[COLUMNA_DOCUMENTO]
+
+    @property
+    def indice(self):
+        """Índice de documentos registrados de este almacenamiento, creado en el primer uso."""
+        if self._indice is None:
+            self._indice = IndiceDocumentos(self.documentos, vigencia=self.vigencia_indice)
+        return self._indice
+
+    def existe_documento(self, documento):
+        """True si el número de documento ya tiene respuestas guardadas."""
+        return documento in self.indice
+
+    def agregar_nuevo(self, fila):
+        """
+        Guarda la fila solo si su número de documento (segunda columna) no está registrado.
+        Retorna True si la fila se guardó y False si el documento ya existía.
+        """
+        documento = fila[COLUMNAS_DATOS.index(COLUMNA_DOCUMENTO)]
+        if not self.indice.reservar(documento):
+            return False
+        try:
+            with metricas.medir("guardar_fila", almacenamiento=type(self).__name__):
+                self.agregar(fila)
+        except DocumentoDuplicado:
+            # Otro proceso registró el documento; queda marcado como registrado también en este índice
+            return False
+        except Exception:
+            self.indice.liberar(documento)
+            raise
+        return True
+
+    def obtener_por_documento(self, documento):
+        """DataFrame con las respuestas guardadas para el número de documento."""
+        datos = self.leer()
+        documentos = datos[COLUMNA_DOCUMENTO].map(normalizar_documento)
+        return datos[documentos == normalizar_documento(documento)]
+
+
+@contextmanager
+def atribuir_lecturas(estadisticas):
+    """
+    Atribuye a `estadisticas` (un diccionario por sesión) las lecturas hechas dentro del bloque que no reciben
+    estadísticas propias, como la carga o la recarga del índice de documentos al validar un envío.
+    """
+    token = _estadisticas_sesion.set(estadisticas)
+    try:
+        yield estadisticas
+    finally:
+        _estadisticas_sesion.reset(token)
+
+
+class CacheLectura:
+    """
+    Caché compartida de una lectura remota, con vencimiento `ttl` e invalidación explícita.
+
+    Solo una sesión a la vez descarga los datos; las demás esperan y reutilizan el resultado.
+    """
+
+    def __init__(self, leer_remoto, ttl=60):
+        self._leer_remoto = leer_remoto
+        self.ttl = ttl
+        self._datos = None
+        self._leido_en = 0.0
+        self._lock = threading.Lock()
+        self.lecturas_remotas = 0
+        self.lecturas_cache = 0
+
+    def obtener(self, estadisticas=None):
+        with self._lock:
+            if self._datos is None or time.monotonic() - self._leido_en > self.ttl:
+                self._datos = self._leer_remoto()
+                self._leido_en = time.monotonic()
+                self.lecturas_remotas += 1
+                origen = "remotas"
+            else:
+                self.lecturas_cache += 1
+                origen = "cache"
+            datos = self._datos
+        metricas.contar("lecturas_hoja", origen=origen)
+        if estadisticas is None:
+            estadisticas = _estadisticas_sesion.get()
+        if estadisticas is not None:
+            estadisticas[origen] = estadisticas.get(origen, 0) + 1
+        return datos.copy()
+
+    def invalidar(self):
+        with self._lock:
+            self._datos = None
+
+
+def abrir_hoja_gspread(secretos, worksheet):
+    """
+    Abre la hoja `worksheet` (`gspread.Worksheet`) con la API pública de gspread, a partir de la misma
+    configuración `[connections.gsheets]` de secrets.toml que usa GSheetsConnection: `spreadsheet` (URL o
+    nombre del libro) y las credenciales de la cuenta de servicio.
+    """
+    credenciales = dict(secretos)
+    libro = credenciales.pop("spreadsheet", None)
+    credenciales.pop("worksheet", None)
+    if credenciales.get("type") != "service_account" or not libro:
+        raise RuntimeError(
+            "La conexión de Google Sheets no permite agregar filas: configure [connections.gsheets] con "
+            'type = "service_account", las credenciales de la cuenta de servicio y spreadsheet en secrets.toml.'
+        )
+    import gspread
+
+    cliente = gspread.service_account_from_dict(credenciales)
+    if libro.startswith(("https://", "http://")):
+        return cliente.open_by_url(libro).worksheet(worksheet)
+    return cliente.open(libro).worksheet(worksheet)
+
+
+class AlmacenamientoGSheets(Almacenamiento):
+    """
+    Hoja de Google Sheets accedida a través de `st.connection("gsheets", type=GSheetsConnection)`.
+
+    Las lecturas pasan por una `CacheLectura` compartida por todas las sesiones, que se invalida después
+    de cada escritura propia; `lecturas_remotas` y `escrituras_remotas` cuentan las llamadas a la API. El
+    índice de documentos se recarga con la misma vigencia `ttl`, para ver los envíos de otros procesos.
+
+    GSheetsConnection no ofrece agregar filas (`update` reescribe la hoja completa): las escrituras usan la
+    hoja que retorna `abrir_hoja(worksheet)`, normalmente `abrir_hoja_gspread` con los secretos de la conexión.
+    """
+
+    def __init__(self, conn, worksheet="Datos", ttl=60, abrir_hoja=None):
+        self.conn = conn
+        self.worksheet = worksheet
+        self.abrir_hoja = abrir_hoja
+        self.cache = CacheLectura(self._leer_remoto, ttl=ttl)
+        self.vigencia_indice = ttl
+        self.escrituras_remotas = 0
+        self._hoja = None  # gspread.Worksheet, abierta con la primera escritura
+
+    @property
+    def lecturas_remotas(self):
+        return self.cache.lecturas_remotas
+
+    def _leer_remoto(self):
+        # ttl=0: la caché de esta clase reemplaza la de st.connection, para poder invalidarla
+        with metricas.medir("lectura_hoja"):
+            return self.conn.read(worksheet=self.worksheet, ttl=0).dropna(how="all")
+
+    def leer(self, estadisticas=None):
+        return self.cache.obtener(estadisticas)
+
+    def _hoja_escritura(self):
+        """
+        Hoja de gspread (`gspread.Worksheet`) donde se agregan las filas. Se abre una vez y se reutiliza, así
+        cada escritura es una sola solicitud a la API.
+        """
+        if self._hoja is None:
+            if self.abrir_hoja is None:
+                raise RuntimeError(
+                    "La conexión de Google Sheets no permite agregar filas: cree el almacenamiento con los "
+                    "secretos de [connections.gsheets] (crear_almacenamiento(..., secretos=...))."
+                )
+            self._hoja = self.abrir_hoja(self.worksheet)
+        return self._hoja
+
+    def _escribir(self, escribir):
+        try:
+            with metricas.medir("escritura_hoja"):
+                escribir(self._hoja_escritura())
+        except Exception as error:
+            # Una hoja renombrada o eliminada (HTTP 400 o 404) se vuelve a abrir en el siguiente intento; los
+            # errores transitorios (cuota, red) la conservan, para no gastar solicitudes en reabrirla
+            if getattr(getattr(error, "response", None), "status_code", None) in (400, 404):
+                self._hoja = None
+            raise
+        self.escrituras_remotas += 1
+        metricas.contar("escrituras_hoja")
+        self.cache.invalidar()
+
+    def agregar(self, fila):
+        # Agrega una fila al final de la hoja en una sola llamada, sin descargar ni reescribir el resto
+        self._escribir(lambda hoja: hoja.append_row([valor_celda(valor) for valor in fila],
+                                                    value_input_option="USER_ENTERED", insert_data_option="INSERT_ROWS"))
+
+    def agregar_filas(self, filas):
+        # Todas las filas en una sola llamada append_rows: una solicitud de la cuota de la API por lote
+        self._escribir(lambda hoja: hoja.append_rows([[valor_celda(valor) for valor in fila] for fila in filas],
+                                                     value_input_option="USER_ENTERED", insert_data_option="INSERT_ROWS"))
+
+    def invalidar_cache(self):
+        self.cache.invalidar()
+
+
+def _identificador(nombre):
+    return '"' + nombre.replace('"', '""') + '"'
+
+
+class AlmacenamientoSQLite(Almacenamiento):
+    """
+    Tabla SQLite con una columna por pregunta y un índice único sobre el número de documento.
+
+    El índice único garantiza que no haya documentos duplicados aun entre varios procesos. Si la tabla ya
+    tiene documentos repetidos (por ejemplo, importados de la hoja), el índice no se puede crear: se registra
+    una advertencia, los documentos quedan en `documentos_duplicados` y cada inserción verifica el documento
+    dentro de su propia transacción. El índice de documentos en memoria se recarga cada `vigencia_indice`
+    segundos, para ver los envíos de otros procesos.
+    """
+
+    vigencia_indice = 60
+
+    def __init__(self, ruta="datos_sat.sqlite", columnas=COLUMNAS_REGISTRO, tabla="datos"):
+        self.ruta = ruta
+        self.columnas = list(columnas)
+        self.tabla = _identificador(tabla)
+        self._documento = _identificador(COLUMNA_DOCUMENTO)
+        self._lock = threading.Lock()
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False, isolation_level=None)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        definicion = ", ".join(_identificador(columna) for columna in self.columnas)
+        self._conexion.execute(f"CREATE TABLE IF NOT EXISTS {self.tabla} (_id INTEGER PRIMARY KEY AUTOINCREMENT, {definicion})")
+        # Tablas creadas con versiones anteriores: agregar las columnas que falten (p. ej. las de riesgo)
+        existentes = {columna for _, columna, *_ in self._conexion.execute(f"PRAGMA table_info({self.tabla})")}
+        for columna in self.columnas:
+            if columna not in existentes:
+                self._conexion.execute(f"ALTER TABLE {self.tabla} ADD COLUMN {_identificador(columna)}")
+        # El índice no único de esas versiones queda reemplazado por el índice único
+        self._conexion.execute(f"DROP INDEX IF EXISTS {_identificador(tabla + '_documento')}")
+        self.documentos_duplicados = self._documentos_repetidos()
+        if self.documentos_duplicados:
+            _log.warning(
+                "%s: %d números de documento repetidos en la tabla %s (%s); no se crea el índice único.",
+                ruta, len(self.documentos_duplicados), tabla, ", ".join(map(str, self.documentos_duplicados[:10])))
+        else:
+            self._conexion.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {_identificador(tabla + '_documento_unico')} "
+                                   f"ON {self.tabla} ({self._documento})")
+        self._columnas_sql = ", ".join(_identificador(columna) for columna in self.columnas)
+        self._insertar = (f"INSERT INTO {self.tabla} ({self._columnas_sql}) "
+                          f"VALUES ({', '.join('?' for _ in self.columnas)})")
+
+    def leer(self, estadisticas=None):
+        with self._lock:
+            return pd.read_sql_query(f"SELECT {self._columnas_sql} FROM {self.tabla} ORDER BY _id", self._conexion)
+
+    def _documentos_repetidos(self):
+        cursor = self._conexion.execute(
+            f"SELECT {self._documento} FROM {self.tabla} WHERE {self._documento} IS NOT NULL "
+            f"GROUP BY {self._documento} HAVING COUNT(*) > 1 ORDER BY MIN(_id)")
+        return [documento for (documento,) in cursor]
+
+    def agregar(self, fila):
+        if len(fila) != len(self.columnas):
+            raise ValueError(f"La fila tiene {len(fila)} valores y la tabla {len(self.columnas)} columnas.")
+        valores = [valor_celda(valor) for valor in fila]
+        with self._lock:
+            if not self.documentos_duplicados:
+                try:
+                    self._conexion.execute(self._insertar, valores)
+                except sqlite3.IntegrityError as error:
+                    raise DocumentoDuplicado(str(error)) from error
+                return
+            # Sin índice único: la verificación y la inserción en una misma transacción de escritura
+            documento = valores[self.columnas.index(COLUMNA_DOCUMENTO)]
+            self._conexion.execute("BEGIN IMMEDIATE")
+            try:
+                if self._conexion.execute(f"SELECT 1 FROM {self.tabla} WHERE {self._documento} = ? LIMIT 1",
+                                          (documento,)).fetchone():
+                    raise DocumentoDuplicado(f"El documento {documento} ya está registrado.")
+                self._conexion.execute(self._insertar, valores)
+            except BaseException:
+                self._conexion.execute("ROLLBACK")
+                raise
+            self._conexion.execute("COMMIT")
+
+    def documentos(self):
+        with self._lock:
+            cursor = self._conexion.execute(f"SELECT {self._documento} FROM {self.tabla}")
+            return [documento for (documento,) in cursor]
+
+    def obtener_por_documento(self, documento):
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {self._columnas_sql} FROM {self.tabla} WHERE {self._documento} = ? ORDER BY _id",
+                self._conexion, params=(normalizar_documento(documento),))
+
+
+class AlmacenamientoParquet(Almacenamiento):
+    """
+    Archivo columnar: cada envío se escribe como un archivo Parquet pequeño dentro de `directorio`, y
+    `compactar` une periódicamente esos archivos en uno solo. Todas las columnas se guardan como texto,
+    igual que en la hoja de cálculo, para que el esquema sea el mismo en todos los archivos; las columnas
+    que no existan en archivos anteriores se leen como vacías.
+
+    Varios procesos pueden escribir en el mismo directorio: cada escritura toma un bloqueo exclusivo del
+    archivo `.bloqueo` (fcntl.flock, solo POSIX), verifica en disco que el documento no esté registrado y
+    numera su archivo a partir de los que existen en ese momento, de modo que ningún proceso sobrescribe el
+    archivo de otro ni acepta un documento que otro ya guardó.
+    """
+
+    vigencia_indice = 60
+
+    def __init__(self, directorio="datos_sat_parquet", columnas=COLUMNAS_REGISTRO):
+        self.directorio = Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        self.columnas = list(columnas)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _bloqueo(self):
+        # Exclusión entre hilos (self._lock) y entre procesos (flock sobre el archivo de bloqueo)
+        import fcntl
+
+        with self._lock, open(self.directorio / ".bloqueo", "a") as archivo:
+            fcntl.flock(archivo, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(archivo, fcntl.LOCK_UN)
+
+    def _partes(self):
+        return sorted(self.directorio.glob("parte-*.parquet"))
+
+    def _esquema(self):
+        import pyarrow as pa
+
+        return pa.schema([(columna, pa.string()) for columna in self.columnas])
+
+    def _dataset(self):
+        import pyarrow.dataset as ds
+
+        return ds.dataset([str(ruta) for ruta in self._partes()], schema=self._esquema(), format="parquet")
+
+    def _filtrar(self, documento):
+        import pyarrow.dataset as ds
+
+        filtro = ds.field(COLUMNA_DOCUMENTO) == str(normalizar_documento(documento))
+        return self._dataset().to_table(filter=filtro).to_pandas()
+
+    def leer(self, estadisticas=None, columnas=None):
+        with self._lock:
+            return self._dataset().to_table(columns=columnas).to_pandas()
+
+    def agregar(self, fila):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if len(fila) != len(self.columnas):
+            raise ValueError(f"La fila tiene {len(fila)} valores y el archivo {len(self.columnas)} columnas.")
+        valores = [None if valor is None else str(valor_celda(valor)) for valor in fila]
+        tabla = pa.Table.from_pylist([dict(zip(self.columnas, valores))], schema=self._esquema())
+        documento = fila[self.columnas.index(COLUMNA_DOCUMENTO)]
+        with self._bloqueo():
+            # Verificación en disco: el índice en memoria de este proceso no ve los envíos de otros procesos
+            if normalizar_documento(documento) is not None and len(self._filtrar(documento)):
+                raise DocumentoDuplicado(f"El documento {documento} ya está registrado.")
+            partes = self._partes()
+            consecutivo = int(partes[-1].stem.split("-")[1]) + 1 if partes else 1
+            ruta = self.directorio / f"parte-{consecutivo:08d}.parquet"
+            pq.write_table(tabla, ruta.with_suffix(".tmp"))
+            ruta.with_suffix(".tmp").replace(ruta)  # Escritura atómica: los lectores nunca ven archivos a medias
+
+    def documentos(self):
+        return self.leer(columnas=[COLUMNA_DOCUMENTO])[COLUMNA_DOCUMENTO]
+
+    def obtener_por_documento(self, documento):
+        with self._lock:
+            return self._filtrar(documento)
+
+    def compactar(self):
+        """Une todos los archivos del directorio en uno solo, conservando el orden de llegada."""
+        import pyarrow.parquet as pq
+
+        with self._bloqueo():
+            partes = self._partes()
+            if len(partes) <= 1:
+                return
+            tabla = self._dataset().to_table()
+            ruta = partes[-1].with_suffix(".tmp")
+            pq.write_table(tabla, ruta)
+            ruta.replace(partes[-1])
+            for parte in partes[:-1]:
+                parte.unlink()
+
+
+def crear_almacenamiento(tipo="gsheets", conn=None, ruta=None, cola=None, secretos=None):
+    """
+    Construye el almacenamiento `tipo` ("gsheets", "sqlite" o "parquet").
+    Para "gsheets" se requiere `conn` y, para poder escribir, `secretos` (la sección `[connections.gsheets]`
+    de secrets.toml, con la cuenta de servicio); para los almacenamientos locales `ruta` es opcional.
+    Si `cola` es la ruta de un archivo, los envíos pasan por una cola local durable (`sat.cola`) que los
+    escribe en el almacenamiento por lotes, en segundo plano.
+    """
+    if tipo == "gsheets":
+        if conn is None:
+            raise ValueError("El almacenamiento 'gsheets' requiere una conexión GSheetsConnection.")
+        abrir_hoja = None if secretos is None else functools.partial(abrir_hoja_gspread, secretos)
+        almacenamiento = AlmacenamientoGSheets(conn, abrir_hoja=abrir_hoja)
+    elif tipo == "sqlite":
+        almacenamiento = AlmacenamientoSQLite(ruta or "datos_sat.sqlite")
+    elif tipo == "parquet":
+        almacenamiento = AlmacenamientoParquet(ruta or "datos_sat_parquet")
+    else:
+        raise ValueError(f"Almacenamiento desconocido: {tipo!r}. Opciones: gsheets, sqlite, parquet")
+    if cola:
+        from sat.cola import AlmacenamientoEnCola
+
+        return AlmacenamientoEnCola(almacenamiento, cola)
+    return almacenamiento
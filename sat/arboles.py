@@ -0,0 +1,300 @@
+"""
+Bosques aleatorios compilados en arreglos planos de NumPy.
+
+`compilar_bosque` convierte un RandomForestClassifier de sklearn en arreglos contiguos con los nodos de todos
+sus árboles (variable, umbral, hijos y probabilidades de clase en las hojas). `BosqueCompilado` recorre todos
+los árboles a la vez con operaciones vectorizadas, de modo que una predicción de una sola fila no paga la
+validación ni el despacho árbol por árbol de sklearn, y entrega las mismas predicciones que el modelo original.
+
+Formato compacto: `guardar_compacto` escribe cada arreglo en su propio archivo .npy dentro de un directorio por
+modelo, con un `manifiesto.json` (versión del formato, suma SHA-256 del .pkl de origen, si el bosque está
+comprimido, huella SHA-256 de los arreglos, tipos y formas de los arreglos y resultado de la validación). `abrir_compacto` abre esos arreglos con `mmap_mode="r"`: abrir un
+modelo no deserializa nada y todos los procesos del servidor comparten las mismas páginas físicas del archivo.
+Opcionalmente los umbrales se guardan en float32, el tipo en que sklearn evalúa las variables.
+
+Un bosque comprimido (`sat.compresion`, `comprimido=True`) no reproduce exactamente las predicciones del .pkl
+del que proviene: su identidad es la huella de sus arreglos y no la suma del .pkl (ver `sat.modelos`).
+
+Uso:
+    python -m sat.arboles exportar            # escribe modelo_<nombre>.npz junto a cada .pkl
+    python -m sat.arboles verificar           # compara las predicciones con los .pkl originales
+    python -m sat.arboles compactar           # escribe modelos_compactos/<nombre>/ y valida las predicciones
+    python -m sat.arboles compactar --float32
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+# Nombres de los arreglos de un bosque compilado, tal como se guardan en disco
+CAMPOS = ("variable", "umbral", "izquierdo", "derecho", "valor", "raices", "clases", "nombres_variables")
+
+# Versión del formato compacto; `abrir_compacto` rechaza directorios de otra versión. La versión 1 no
+# distinguía los bosques comprimidos de los exactos.
+FORMATO_COMPACTO = 2
+
+
+@dataclass
+class BosqueCompilado:
+    variable: np.ndarray           # (nodos,) índice de la variable evaluada; 0 en las hojas
+    umbral: np.ndarray             # (nodos,) umbral del nodo; +inf en las hojas
+    izquierdo: np.ndarray          # (nodos,) hijo si variable <= umbral; la misma hoja en las hojas
+    derecho: np.ndarray            # (nodos,) hijo si variable > umbral; la misma hoja en las hojas
+    valor: np.ndarray              # (nodos, clases) probabilidad de cada clase en el nodo
+    raices: np.ndarray             # (árboles,) índice del nodo raíz de cada árbol
+    clases: np.ndarray             # (clases,) etiquetas de clase del modelo original
+    nombres_variables: np.ndarray  # (variables,) nombres de las columnas de entrada
+    comprimido: bool = False       # True si sus predicciones pueden diferir de las del modelo original
+
+    @property
+    def profundidad(self):
+        # Número de pasos necesarios para que todas las filas lleguen a una hoja en todos los árboles
+        profundidad = getattr(self, "_profundidad", None)
+        if profundidad is None:
+            profundidad = _profundidad_maxima(self.izquierdo, self.derecho, self.raices)
+            self._profundidad = profundidad
+        return profundidad
+
+    def hojas(self, X):
+        """Índice de la hoja alcanzada por cada fila en cada árbol, matriz (filas, árboles)."""
+        # Igual que sklearn, las variables se evalúan en float32
+        X = np.asarray(X, dtype=np.float32)
+        filas = np.arange(X.shape[0])[:, None]
+        nodos = np.broadcast_to(self.raices, (X.shape[0], self.raices.shape[0])).copy()
+        for _ in range(self.profundidad):
+            a_la_izquierda = X[filas, self.variable[nodos]] <= self.umbral[nodos]
+            nodos = np.where(a_la_izquierda, self.izquierdo[nodos], self.derecho[nodos])
+        return nodos
+
+    def predict_proba(self, X, filas_por_bloque=4096):
+        X = np.asarray(X, dtype=np.float32)
+        proba = np.empty((X.shape[0], self.valor.shape[1]))
+        # Por bloques de filas, para acotar la memoria de la matriz (filas, árboles, clases)
+        for inicio in range(0, X.shape[0], filas_por_bloque):
+            hojas = self.hojas(X[inicio:inicio + filas_por_bloque])
+            # La suma sobre el eje de los árboles se acumula árbol por árbol, en el mismo orden que sklearn,
+            # por lo que los empates se resuelven exactamente igual
+            proba[inicio:inicio + filas_por_bloque] = self.valor[hojas].sum(axis=1) / hojas.shape[1]
+        return proba
+
+    def predict(self, X):
+        return self.clases.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def arreglos(self):
+        return {campo: getattr(self, campo) for campo in CAMPOS}
+
+
+def _profundidad_maxima(izquierdo, derecho, raices):
+    profundidad = 0
+    nodos = np.asarray(raices)
+    while True:
+        siguientes = np.concatenate([izquierdo[nodos], derecho[nodos]])
+        siguientes = np.unique(siguientes[siguientes != np.concatenate([nodos, nodos])])
+        if siguientes.size == 0:
+            return profundidad
+        nodos = siguientes
+        profundidad += 1
+
+
+def compilar_bosque(modelo):
+    """Convierte un RandomForestClassifier entrenado (una sola salida) en un BosqueCompilado."""
+    variables, umbrales, izquierdos, derechos, valores, raices = [], [], [], [], [], []
+    desplazamiento = 0
+    for estimador in modelo.estimators_:
+        arbol = estimador.tree_
+        n = arbol.node_count
+        hoja = arbol.children_left == -1
+        indices = np.arange(n) + desplazamiento
+
+        variables.append(np.where(hoja, 0, arbol.feature))
+        umbrales.append(np.where(hoja, np.inf, arbol.threshold))
+        izquierdos.append(np.where(hoja, indices, arbol.children_left + desplazamiento))
+        derechos.append(np.where(hoja, indices, arbol.children_right + desplazamiento))
+
+        # Probabilidades normalizadas por nodo, como DecisionTreeClassifier.predict_proba
+        valor = arbol.value[:, 0, :].astype(np.float64)
+        normalizador = valor.sum(axis=1, keepdims=True)
+        normalizador[normalizador == 0.0] = 1.0
+        valores.append(valor / normalizador)
+
+        raices.append(desplazamiento)
+        desplazamiento += n
+
+    nombres = getattr(modelo, "feature_names_in_", np.array([f"x{i}" for i in range(modelo.n_features_in_)]))
+    return BosqueCompilado(
+        variable=np.concatenate(variables).astype(np.int32),
+        umbral=np.concatenate(umbrales).astype(np.float64),
+        izquierdo=np.concatenate(izquierdos).astype(np.int32),
+        derecho=np.concatenate(derechos).astype(np.int32),
+        valor=np.ascontiguousarray(np.concatenate(valores)),
+        raices=np.array(raices, dtype=np.int32),
+        clases=np.asarray(modelo.classes_),
+        nombres_variables=np.asarray(nombres, dtype=str),
+    )
+
+
+def guardar_bosque(bosque, ruta):
+    np.savez(ruta, **bosque.arreglos())
+
+
+def cargar_bosque(ruta):
+    with np.load(ruta, allow_pickle=False) as datos:
+        return BosqueCompilado(**{campo: datos[campo] for campo in CAMPOS})
+
+
+def huella(bosque):
+    """Suma SHA-256 de los arreglos del bosque (tipos, formas y contenido), en el orden de CAMPOS."""
+    sha = hashlib.sha256()
+    for campo, arreglo in bosque.arreglos().items():
+        arreglo = np.ascontiguousarray(arreglo)
+        sha.update(f"{campo}:{arreglo.dtype.str}:{arreglo.shape};".encode())
+        sha.update(arreglo.tobytes())
+    return sha.hexdigest()
+
+
+def guardar_compacto(bosque, directorio, checksum_origen, validacion=None):
+    """
+    Escribe `bosque` en formato compacto en `directorio`. `checksum_origen` es la suma SHA-256 del .pkl de
+    origen. El manifiesto se escribe al final, de modo que un directorio a medio escribir no se puede abrir.
+    """
+    directorio = Path(directorio)
+    directorio.mkdir(parents=True, exist_ok=True)
+    (directorio / "manifiesto.json").unlink(missing_ok=True)
+    arreglos = {campo: np.ascontiguousarray(arreglo) for campo, arreglo in bosque.arreglos().items()}
+    for campo, arreglo in arreglos.items():
+        np.save(directorio / f"{campo}.npy", arreglo, allow_pickle=False)
+    manifiesto = {
+        "formato": FORMATO_COMPACTO,
+        "checksum_origen": checksum_origen,
+        "comprimido": bool(bosque.comprimido),
+        "huella": huella(bosque),
+        "arboles": len(bosque.raices),
+        "nodos": len(bosque.variable),
+        "profundidad": int(bosque.profundidad),
+        "arreglos": {campo: {"tipo": arreglo.dtype.str, "forma": list(arreglo.shape)} for campo, arreglo in arreglos.items()},
+        "validacion": validacion,
+    }
+    (directorio / "manifiesto.json").write_text(json.dumps(manifiesto, indent=2), encoding="utf-8")
+    return manifiesto
+
+
+def abrir_compacto(directorio):
+    """
+    Abre con mapeo de memoria un bosque en formato compacto. Retorna (BosqueCompilado, manifiesto).
+
+    Lanza ValueError si el formato, los tipos o las formas de los arreglos no coinciden con el manifiesto, o si
+    algún hijo apunta fuera del bosque.
+    """
+    directorio = Path(directorio)
+    manifiesto = json.loads((directorio / "manifiesto.json").read_text(encoding="utf-8"))
+    if manifiesto.get("formato") != FORMATO_COMPACTO:
+        raise ValueError(f"{directorio}: formato {manifiesto.get('formato')!r}, se esperaba {FORMATO_COMPACTO}.")
+    arreglos = {}
+    for campo in CAMPOS:
+        arreglo = np.load(directorio / f"{campo}.npy", mmap_mode="r", allow_pickle=False)
+        esperado = manifiesto["arreglos"][campo]
+        if arreglo.dtype.str != esperado["tipo"] or list(arreglo.shape) != esperado["forma"]:
+            raise ValueError(f"{directorio}: el arreglo {campo!r} no coincide con el manifiesto.")
+        arreglos[campo] = arreglo
+
+    nodos = manifiesto["nodos"]
+    if any(len(arreglos[campo]) != nodos for campo in ("variable", "umbral", "izquierdo", "derecho", "valor")):
+        raise ValueError(f"{directorio}: los arreglos de nodos no tienen {nodos} filas.")
+    for campo in ("izquierdo", "derecho", "raices"):
+        if len(arreglos[campo]) and not (0 <= arreglos[campo].min() and arreglos[campo].max() < nodos):
+            raise ValueError(f"{directorio}: {campo!r} apunta fuera del bosque.")
+
+    bosque = BosqueCompilado(**arreglos, comprimido=bool(manifiesto["comprimido"]))
+    bosque._profundidad = manifiesto["profundidad"]
+    return bosque, manifiesto
+
+
+def entradas_de_prueba(bosque, filas=20000, semilla=0):
+    """
+    Matriz de entradas para comparar predicciones: puntuaciones enteras de 0 a 5 (el dominio de las respuestas
+    codificadas) y los umbrales del bosque, para cubrir ambos lados de cada corte.
+    """
+    rng = np.random.default_rng(semilla)
+    umbrales = np.unique(bosque.umbral[np.isfinite(bosque.umbral)])
+    valores = np.unique(np.concatenate([np.arange(6), umbrales]))
+    return rng.choice(valores, size=(filas, len(bosque.nombres_variables))).astype(np.float64)
+
+
+def verificar_equivalencia(modelo, bosque, X=None):
+    """
+    Compara el bosque compilado con el modelo original. Retorna (filas distintas en predict,
+    diferencia absoluta máxima en predict_proba).
+    """
+    import pandas as pd
+
+    if X is None:
+        X = entradas_de_prueba(bosque)
+    X = pd.DataFrame(X, columns=bosque.nombres_variables)
+    distintas = int((modelo.predict(X) != bosque.predict(X)).sum())
+    diferencia = float(np.abs(modelo.predict_proba(X) - bosque.predict_proba(X)).max())
+    return distintas, diferencia
+
+
+def main(argv=None):
+    from sat.modelos import ARCHIVOS_MODELOS, DIRECTORIO_COMPACTOS, RUTA_BASE, registro
+
+    parser = argparse.ArgumentParser(prog="python -m sat.arboles", description="Bosques compilados en arreglos planos.")
+    parser.add_argument("accion", choices=["exportar", "verificar", "compactar"])
+    parser.add_argument("--directorio", type=Path, default=RUTA_BASE,
+                        help="Directorio de salida de los .npz o del directorio de modelos compactos")
+    parser.add_argument("--float32", action="store_true", help="Al compactar, guarda los umbrales en float32")
+    args = parser.parse_args(argv)
+
+    fallas = 0
+    for nombre, archivo in ARCHIVOS_MODELOS.items():
+        modelo = registro.obtener(nombre)
+        bosque = compilar_bosque(modelo)
+        if args.accion == "exportar":
+            ruta = args.directorio / Path(archivo).with_suffix(".npz").name
+            guardar_bosque(bosque, ruta)
+            bosque = cargar_bosque(ruta)
+            print(f"{nombre}: {len(bosque.raices)} árboles, {len(bosque.variable)} nodos -> {ruta}")
+        elif args.accion == "compactar":
+            if args.float32:
+                bosque = replace(bosque, umbral=bosque.umbral.astype(np.float32))
+            # Se valida antes de escribir: un artefacto que no reproduce el modelo no se publica
+            distintas, diferencia = verificar_equivalencia(modelo, bosque)
+            ruta = args.directorio / DIRECTORIO_COMPACTOS / nombre
+            if distintas:
+                print(f"{nombre}: {distintas} predicciones distintas, no se escribe {ruta}")
+                fallas += 1
+                continue
+            validacion = {"filas": len(entradas_de_prueba(bosque)), "predicciones_distintas": distintas,
+                          "diferencia_maxima_probabilidad": diferencia}
+            guardar_compacto(bosque, ruta, registro.checksum(nombre), validacion)
+            bosque, _ = abrir_compacto(ruta)
+            tamano = sum(archivo.stat().st_size for archivo in ruta.glob("*.npy"))
+            print(f"{nombre}: {len(bosque.raices)} árboles, {len(bosque.variable)} nodos, {tamano / 2**10:.0f} KiB -> {ruta}")
+        elif (args.directorio / DIRECTORIO_COMPACTOS / nombre / "manifiesto.json").exists():
+            # Verificar también el artefacto compacto y que corresponda al .pkl actual
+            ruta = args.directorio / DIRECTORIO_COMPACTOS / nombre
+            try:
+                compacto, manifiesto = abrir_compacto(ruta)
+            except (OSError, ValueError, KeyError) as error:
+                print(f"{nombre}: artefacto compacto inválido ({error})")
+                fallas += 1
+            else:
+                distintas, _ = verificar_equivalencia(modelo, compacto)
+                vigente = manifiesto["checksum_origen"] == registro.checksum(nombre)
+                print(f"{nombre}: compacto con predicciones distintas = {distintas}, checksum vigente = {vigente}, "
+                      f"comprimido = {manifiesto['comprimido']}")
+                # Un bosque comprimido puede diferir del original; modelos_compactos/ debe tener solo bosques exactos
+                fallas += distintas > 0 or not vigente or manifiesto["comprimido"]
+        distintas, diferencia = verificar_equivalencia(modelo, bosque)
+        print(f"{nombre}: predicciones distintas = {distintas}, diferencia máxima de probabilidad = {diferencia:.2e}")
+        fallas += distintas > 0 or diferencia > 1e-12
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
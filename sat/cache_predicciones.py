@@ -0,0 +1,114 @@
+"""
+Caché LRU de predicciones por modelo, indexado por las respuestas codificadas.
+
+Los modelos reciben pocas variables discretas (4 en proyecto, 7 en familiar, 4 en económico y 14 en
+psicosocial), por lo que muchos estudiantes producen exactamente la misma fila codificada. `CachePredicciones`
+guarda, por modelo, la clase predicha para las últimas `capacidad` filas distintas (la tupla de valores de la
+fila es la clave) y descarta la menos usada cuando se llena. Una fila repetida se clasifica sin recorrer el
+bosque.
+
+Cada caché guarda la versión del bosque con que se calcularon sus predicciones (`registro.version_compilado`:
+la suma SHA-256 del .pkl, o la huella del bosque si es comprimido); si el modelo cambia en disco o se pasa a
+otro bosque, el caché de ese modelo se vacía en la siguiente consulta.
+
+Métricas (`sat.metricas`): contadores `cache_predicciones` por modelo y resultado (`acierto`, `fallo`,
+`desalojo`, `invalidacion`). `estadisticas()` retorna los mismos conteos y el tamaño actual de cada caché.
+
+Uso:
+    from sat.cache_predicciones import predicciones
+    clases = predicciones.predecir("psico", matriz, version, predecir_bosque)
+    predicciones.estadisticas()
+"""
+
+import threading
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+
+from sat.metricas import metricas
+
+# Filas distintas que se conservan por modelo
+CAPACIDAD = 10_000
+
+
+class CachePredicciones:
+    """Caché LRU de clases predichas, uno por modelo, seguro entre hilos."""
+
+    def __init__(self, capacidad=CAPACIDAD):
+        self.capacidad = capacidad
+        self._lock = threading.Lock()
+        self._entradas = defaultdict(OrderedDict)  # nombre -> {tupla de la fila: clase}
+        self._checksums = {}
+        self._conteos = defaultdict(lambda: dict.fromkeys(("aciertos", "fallos", "desalojos", "invalidaciones"), 0))
+
+    def _contar(self, nombre, campo, resultado, cantidad):
+        if cantidad:
+            self._conteos[nombre][campo] += cantidad
+            metricas.contar("cache_predicciones", cantidad, modelo=nombre, resultado=resultado)
+
+    def predecir(self, nombre, matriz, checksum, predecir):
+        """
+        Clase de cada fila de `matriz` para el modelo `nombre`. Las filas que no están en el caché se clasifican
+        con una sola llamada a `predecir(matriz)` (cada fila distinta una vez) y se agregan al caché.
+        `checksum` identifica la versión del bosque; si no coincide con la del caché, este se vacía.
+        """
+        claves = [tuple(fila) for fila in matriz.tolist()]
+        resultado = np.empty(len(claves), dtype=np.int64)
+        faltantes = {}  # clave -> posiciones de las filas con esa clave
+        with self._lock:
+            entradas = self._entradas[nombre]
+            if self._checksums.get(nombre) != checksum:
+                if self._checksums.get(nombre) is not None:
+                    self._contar(nombre, "invalidaciones", "invalidacion", 1)
+                entradas.clear()
+                self._checksums[nombre] = checksum
+            for i, clave in enumerate(claves):
+                clase = entradas.get(clave)
+                if clase is None:
+                    faltantes.setdefault(clave, []).append(i)
+                else:
+                    entradas.move_to_end(clave)
+                    resultado[i] = clase
+            self._contar(nombre, "aciertos", "acierto", len(claves) - sum(map(len, faltantes.values())))
+            self._contar(nombre, "fallos", "fallo", sum(map(len, faltantes.values())))
+        if not faltantes:
+            return resultado
+
+        # La predicción se hace fuera del lock, para no bloquear a las demás sesiones
+        nuevas = predecir(np.array(list(faltantes), dtype=matriz.dtype).reshape(-1, matriz.shape[1]))
+        with self._lock:
+            if self._checksums.get(nombre) == checksum:
+                for clave, clase in zip(faltantes, nuevas.tolist()):
+                    entradas[clave] = int(clase)
+                    entradas.move_to_end(clave)
+                desalojos = max(len(entradas) - self.capacidad, 0)
+                for _ in range(desalojos):
+                    entradas.popitem(last=False)
+                self._contar(nombre, "desalojos", "desalojo", desalojos)
+        for posiciones, clase in zip(faltantes.values(), nuevas):
+            resultado[posiciones] = clase
+        return resultado
+
+    def vaciar(self, nombre=None):
+        """Vacía el caché de un modelo o de todos."""
+        with self._lock:
+            for entradas in ([self._entradas[nombre]] if nombre else self._entradas.values()):
+                entradas.clear()
+
+    def estadisticas(self):
+        """Por modelo: filas en caché, capacidad, aciertos, fallos, desalojos, invalidaciones y tasa de aciertos."""
+        with self._lock:
+            resultado = {}
+            for nombre, conteos in self._conteos.items():
+                consultas = conteos["aciertos"] + conteos["fallos"]
+                resultado[nombre] = {
+                    "filas": len(self._entradas[nombre]),
+                    "capacidad": self.capacidad,
+                    **conteos,
+                    "tasa_aciertos": conteos["aciertos"] / consultas if consultas else 0.0,
+                }
+            return resultado
+
+
+# Caché único por proceso, compartido por todas las sesiones (como sat.modelos.registro)
+predicciones = CachePredicciones()
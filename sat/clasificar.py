@@ -0,0 +1,139 @@
+"""
+Clasificación masiva, sin navegador, de exportaciones de la hoja "Datos".
+
+Lee un archivo CSV o Parquet por bloques, clasifica cada bloque con `sat.puntaje.clasificar_lote` y escribe
+las etiquetas de riesgo en un archivo CSV o Parquet. La memoria usada depende del tamaño del bloque y no del
+tamaño del archivo, y al final se reporta el rendimiento en filas por segundo.
+
+Uso:
+    python -m sat.clasificar respuestas.csv riesgos.csv
+    python -m sat.clasificar respuestas.parquet riesgos.parquet --tamano-bloque 20000 --progreso
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from sat.almacenamiento import COLUMNA_DOCUMENTO
+from sat.ponderaciones import PREGUNTAS
+from sat.puntaje import COLUMNAS_RIESGO, clasificar_lote
+
+# Columnas de la exportación que necesita la clasificación
+COLUMNAS_REQUERIDAS = list(dict.fromkeys(pregunta for preguntas in PREGUNTAS.values() for pregunta in preguntas))
+
+
+def _formato(ruta):
+    sufijo = Path(ruta).suffix.lower()
+    if sufijo == ".csv":
+        return "csv"
+    if sufijo in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Formato no soportado para {ruta}: use un archivo .csv o .parquet")
+
+
+def leer_bloques(ruta, tamano_bloque, columnas_id=()):
+    """Genera DataFrames de a lo sumo `tamano_bloque` filas con las columnas requeridas y las de identificación."""
+    columnas = list(columnas_id) + COLUMNAS_REQUERIDAS
+    if _formato(ruta) == "csv":
+        # Todas las respuestas se leen como texto, tal como están en la hoja de cálculo
+        yield from pd.read_csv(ruta, usecols=columnas, dtype=str, chunksize=tamano_bloque)
+    else:
+        import pyarrow.parquet as pq
+
+        archivo = pq.ParquetFile(ruta)
+        for lote in archivo.iter_batches(batch_size=tamano_bloque, columns=columnas):
+            yield lote.to_pandas()
+
+
+class EscritorResultados:
+    """Escribe los bloques clasificados de forma incremental en CSV o Parquet."""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.formato = _formato(ruta)
+        self._escritor_parquet = None
+        self._primer_bloque = True
+
+    def escribir(self, df):
+        if self.formato == "csv":
+            df.to_csv(self.ruta, mode="w" if self._primer_bloque else "a", header=self._primer_bloque, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            tabla = pa.Table.from_pandas(df, preserve_index=False)
+            if self._escritor_parquet is None:
+                self._escritor_parquet = pq.ParquetWriter(self.ruta, tabla.schema)
+            self._escritor_parquet.write_table(tabla)
+        self._primer_bloque = False
+
+    def cerrar(self):
+        if self._escritor_parquet is not None:
+            self._escritor_parquet.close()
+        elif self._primer_bloque and self.formato == "csv":
+            # Archivo de entrada vacío: escribir solo el encabezado
+            pd.DataFrame(columns=COLUMNAS_RIESGO).to_csv(self.ruta, index=False)
+
+
+def clasificar_archivo(entrada, salida, tamano_bloque=10000, columnas_id=(COLUMNA_DOCUMENTO,), progreso=None):
+    """
+    Clasifica todas las filas de `entrada` y escribe en `salida` las columnas de identificación junto con
+    las etiquetas de riesgo. Retorna un diccionario con el resumen de la ejecución.
+    """
+    escritor = EscritorResultados(salida)
+    filas = sin_clasificar = bloques = 0
+    inicio = time.perf_counter()
+    try:
+        for bloque in leer_bloques(entrada, tamano_bloque, columnas_id):
+            riesgos = clasificar_lote(bloque, estricto=False)
+            sin_clasificar += int(riesgos.isna().any(axis=1).sum())
+            escritor.escribir(pd.concat([bloque[list(columnas_id)], riesgos], axis=1))
+            filas += len(bloque)
+            bloques += 1
+            if progreso:
+                progreso(filas, time.perf_counter() - inicio)
+    finally:
+        escritor.cerrar()
+    segundos = time.perf_counter() - inicio
+    return {
+        "filas": filas,
+        "bloques": bloques,
+        "sin_clasificar": sin_clasificar,
+        "segundos": segundos,
+        "filas_por_segundo": filas / segundos if segundos > 0 else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m sat.clasificar",
+        description="Clasifica el riesgo SAT de una exportación CSV/Parquet de la hoja 'Datos'.",
+    )
+    parser.add_argument("entrada", help="Archivo .csv o .parquet con las respuestas")
+    parser.add_argument("salida", help="Archivo .csv o .parquet donde se escriben las etiquetas")
+    parser.add_argument("--tamano-bloque", type=int, default=10000, help="Filas procesadas por bloque (por defecto 10000)")
+    parser.add_argument("--columna-id", action="append", dest="columnas_id",
+                        help=f"Columna de identificación a copiar en la salida (por defecto '{COLUMNA_DOCUMENTO}'); "
+                             "puede repetirse")
+    parser.add_argument("--progreso", action="store_true", help="Mostrar el avance después de cada bloque")
+    args = parser.parse_args(argv)
+
+    def mostrar_progreso(filas, segundos):
+        print(f"{filas} filas clasificadas ({filas / segundos:.0f} filas/s)", file=sys.stderr)
+
+    resumen = clasificar_archivo(
+        args.entrada, args.salida, tamano_bloque=args.tamano_bloque,
+        columnas_id=tuple(args.columnas_id or (COLUMNA_DOCUMENTO,)),
+        progreso=mostrar_progreso if args.progreso else None,
+    )
+    print(f"Filas: {resumen['filas']} en {resumen['bloques']} bloques; "
+          f"{resumen['segundos']:.2f} s ({resumen['filas_por_segundo']:.0f} filas/s); "
+          f"filas con algún componente sin clasificar: {resumen['sin_clasificar']}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+"""
+Cola local durable de envíos, escrita por lotes en el almacenamiento definitivo.
+
+`AlmacenamientoEnCola` envuelve a otro almacenamiento (normalmente la hoja de Google Sheets). Cada envío se
+guarda primero en una tabla SQLite local (con `synchronous=FULL`, de modo que sobrevive a una caída del
+proceso) y se confirma de inmediato al estudiante, sin esperar a la API. Un hilo de fondo toma las filas
+pendientes en orden de llegada y las escribe en el destino en lotes de hasta `tamano_lote` filas con una
+sola llamada (`agregar_filas`, que en la hoja es un `append_rows`).
+
+Varios procesos del servidor pueden compartir el mismo archivo de cola. Antes de enviar un lote, cada proceso
+lo reclama dentro de una transacción `BEGIN IMMEDIATE` (columnas `propietario` y `reclamado_en`), de modo que
+una fila solo la envía el proceso que la reclamó. Un reclamo vence a los `duracion_reclamo` segundos, para
+que las filas de un proceso que se detuvo a mitad de un envío las retome otro.
+
+Si un lote falla, sus filas se liberan y se reintenta con espera exponencial (con variación aleatoria, hasta
+`espera_maxima` segundos). Un error de cuota (HTTP 429) significa que la solicitud fue rechazada. Cualquier
+otro error (por ejemplo, un tiempo agotado) pudo haberse aplicado sin confirmación: esas filas quedan
+marcadas para verificar y, antes de volver a enviarlas, se leen los documentos del destino y se descartan
+las que ya están, para no duplicarlas. Lo mismo ocurre con las filas de un reclamo vencido.
+
+Cada reclamo suma un intento a sus filas (los rechazos por cuota no cuentan). Una fila que llega a
+`maximo_intentos` se envía sola, para no arrastrar a las demás del lote; si ese envío también falla, la fila
+pasa a la tabla `cola_fallidas` con el último error, se registra en el log y deja de reintentarse. Esas filas
+se revisan con `fallidas()` y se reenvían con `reencolar_fallidas()`.
+
+Métricas (`sat.metricas`): indicador `cola_pendientes`, etapa `envio_lote` (latencia de cada escritura por
+lote), etapa `espera_en_cola` (desde que la fila entra a la cola hasta que queda en el destino) y contadores
+`filas_enviadas`, `filas_ya_en_destino`, `filas_fallidas` y `errores_envio_lote` por motivo.
+
+Uso:
+    from sat.cola import AlmacenamientoEnCola
+    almacenamiento = AlmacenamientoEnCola(AlmacenamientoGSheets(conn), "cola_envios.sqlite")
+    almacenamiento.agregar_nuevo(fila)   # retorna en milisegundos
+    almacenamiento.vaciar(timeout=30)    # espera a que la cola quede vacía (p. ej. antes de detener)
+"""
+
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+from sat.almacenamiento import (
+    COLUMNA_DOCUMENTO,
+    COLUMNAS_DATOS,
+    COLUMNAS_REGISTRO,
+    Almacenamiento,
+    DocumentoDuplicado,
+    normalizar_documento,
+    valor_celda,
+)
+from sat.metricas import metricas
+
+_log = logging.getLogger(__name__)
+
+
+def es_error_cuota(error):
+    """True si `error` es un rechazo por cuota de la API (HTTP 429), en el que la solicitud no se aplicó."""
+    respuesta = getattr(error, "response", None)
+    if getattr(respuesta, "status_code", None) == 429:
+        return True
+    texto = str(error)
+    return "429" in texto or "RESOURCE_EXHAUSTED" in texto or "Quota exceeded" in texto
+
+
+def contar_pendientes(ruta):
+    """Número de filas pendientes en el archivo de cola `ruta` (0 si el archivo no tiene cola)."""
+    with sqlite3.connect(ruta) as conexion:
+        try:
+            return conexion.execute("SELECT COUNT(*) FROM cola").fetchone()[0]
+        except sqlite3.OperationalError:
+            return 0
+
+
+class AlmacenamientoEnCola(Almacenamiento):
+    """
+    Almacenamiento que confirma cada envío al guardarlo en una cola SQLite local y lo escribe después,
+    por lotes, en `destino`.
+
+    Parámetros:
+        destino: almacenamiento definitivo (implementa `agregar_filas`, `documentos` e `invalidar_cache`).
+        ruta: archivo SQLite de la cola.
+        tamano_lote: máximo de filas por escritura en el destino.
+        intervalo: segundos que el hilo espera nuevas filas antes de volver a revisar la cola.
+        espera_minima, espera_maxima: límites de la espera exponencial entre reintentos (segundos).
+        iniciar: si es False, el hilo de fondo no se inicia y los lotes se envían con `enviar_lote`.
+        duracion_reclamo: segundos tras los cuales otro proceso puede retomar un lote reclamado y no enviado.
+        maximo_intentos: intentos tras los cuales una fila que sigue fallando pasa a `cola_fallidas`.
+    """
+
+    def __init__(self, destino, ruta="cola_envios.sqlite", tamano_lote=50, intervalo=1.0,
+                 espera_minima=1.0, espera_maxima=60.0, iniciar=True, duracion_reclamo=120.0,
+                 maximo_intentos=10):
+        self.destino = destino
+        self.ruta = ruta
+        self.tamano_lote = tamano_lote
+        self.intervalo = intervalo
+        self.espera_minima = espera_minima
+        self.espera_maxima = espera_maxima
+        self.duracion_reclamo = duracion_reclamo
+        self.maximo_intentos = maximo_intentos
+        # Identifica los reclamos de esta instancia entre todos los procesos que comparten la cola
+        self.propietario = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._hay_filas = threading.Event()
+        self._detener = threading.Event()
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False, isolation_level=None)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=FULL")
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS cola (_id INTEGER PRIMARY KEY AUTOINCREMENT, documento INTEGER UNIQUE, "
+            "fila TEXT NOT NULL, encolado_en REAL NOT NULL, intentos INTEGER NOT NULL DEFAULT 0, "
+            "propietario TEXT, reclamado_en REAL, verificar INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS cola_fallidas (_id INTEGER PRIMARY KEY AUTOINCREMENT, documento INTEGER, "
+            "fila TEXT NOT NULL, encolado_en REAL NOT NULL, intentos INTEGER NOT NULL, error TEXT, "
+            "fallido_en REAL NOT NULL)"
+        )
+        self.reintentos_seguidos = 0
+        self.ultimo_error = None
+        metricas.fijar("cola_pendientes", self.pendientes())
+        self._hilo = None
+        if iniciar:
+            self._hilo = threading.Thread(target=self._trabajar, name="sat-cola-envios", daemon=True)
+            self._hilo.start()
+            self._hay_filas.set()
+
+    # --- Interfaz de Almacenamiento -------------------------------------------------------------------
+
+    def agregar(self, fila):
+        if len(fila) != len(COLUMNAS_REGISTRO):
+            raise ValueError(f"La fila tiene {len(fila)} valores y el registro {len(COLUMNAS_REGISTRO)} columnas.")
+        documento = normalizar_documento(fila[COLUMNAS_DATOS.index(COLUMNA_DOCUMENTO)])
+        texto = json.dumps([valor_celda(valor) for valor in fila], ensure_ascii=False, default=str)
+        with self._lock:
+            try:
+                self._conexion.execute("INSERT INTO cola (documento, fila, encolado_en) VALUES (?, ?, ?)",
+                                       (documento, texto, time.time()))
+            except sqlite3.IntegrityError as error:
+                raise DocumentoDuplicado(str(error)) from error
+        metricas.fijar("cola_pendientes", self.pendientes())
+        self._hay_filas.set()
+
+    def _filas_pendientes(self):
+        with self._lock:
+            return [json.loads(fila) for (fila,) in self._conexion.execute("SELECT fila FROM cola ORDER BY _id")]
+
+    def leer(self, estadisticas=None):
+        # Las respuestas del destino seguidas de las que aún esperan en la cola
+        pendientes = pd.DataFrame(self._filas_pendientes(), columns=COLUMNAS_REGISTRO)
+        datos = self.destino.leer(estadisticas)
+        return pd.concat([datos, pendientes], ignore_index=True) if len(pendientes) else datos
+
+    def documentos(self):
+        with self._lock:
+            pendientes = [documento for (documento,) in self._conexion.execute("SELECT documento FROM cola")]
+        return list(self.destino.documentos()) + pendientes
+
+    def invalidar_cache(self):
+        self.destino.invalidar_cache()
+
+    @property
+    def vigencia_indice(self):
+        # El índice se recarga con la vigencia del destino, que es donde aparecen los envíos de otros procesos
+        return self.destino.vigencia_indice
+
+    # --- Cola -----------------------------------------------------------------------------------------
+
+    def pendientes(self):
+        """Número de filas que aún no se han escrito en el destino."""
+        with self._lock:
+            return self._conexion.execute("SELECT COUNT(*) FROM cola").fetchone()[0]
+
+    def fallidas(self):
+        """Filas que agotaron sus intentos, con el último error (DataFrame con `documento`, `intentos`, `error`...)."""
+        with self._lock:
+            return pd.read_sql_query("SELECT * FROM cola_fallidas ORDER BY _id", self._conexion)
+
+    def reencolar_fallidas(self):
+        """Devuelve a la cola las filas fallidas, con los intentos en cero. Retorna cuántas se reencolaron."""
+        with self._lock:
+            self._conexion.execute("BEGIN IMMEDIATE")
+            try:
+                cantidad = self._conexion.execute(
+                    "INSERT OR IGNORE INTO cola (documento, fila, encolado_en) "
+                    "SELECT documento, fila, encolado_en FROM cola_fallidas ORDER BY _id"
+                ).rowcount
+                self._conexion.execute("DELETE FROM cola_fallidas")
+                self._conexion.execute("COMMIT")
+            except BaseException:
+                self._conexion.execute("ROLLBACK")
+                raise
+        metricas.fijar("cola_pendientes", self.pendientes())
+        self._hay_filas.set()
+        return cantidad
+
+    def _reclamar(self):
+        # Toma de forma atómica las filas más antiguas que no tienen un reclamo vigente. Las de un reclamo
+        # vencido pudieron enviarse sin confirmación, por lo que quedan marcadas para verificar. Una fila que
+        # ya llegó a `maximo_intentos` se reclama sola, para que su último intento no dependa del resto del lote.
+        ahora = time.time()
+        with self._lock:
+            self._conexion.execute("BEGIN IMMEDIATE")
+            try:
+                lote = self._conexion.execute(
+                    "SELECT _id, documento, fila, encolado_en, verificar OR propietario IS NOT NULL, intentos + 1 "
+                    "FROM cola WHERE propietario IS NULL OR reclamado_en < ? ORDER BY _id LIMIT ?",
+                    (ahora - self.duracion_reclamo, self.tamano_lote),
+                ).fetchall()
+                if lote and lote[0][-1] >= self.maximo_intentos:
+                    lote = lote[:1]
+                self._conexion.executemany(
+                    "UPDATE cola SET propietario = ?, reclamado_en = ?, intentos = intentos + 1, "
+                    "verificar = verificar OR propietario IS NOT NULL WHERE _id = ?",
+                    [(self.propietario, ahora, i) for i, *_ in lote],
+                )
+                self._conexion.execute("COMMIT")
+            except BaseException:
+                self._conexion.execute("ROLLBACK")
+                raise
+        return lote
+
+    def _borrar(self, ids):
+        # Solo las filas que esta instancia aún tiene reclamadas
+        with self._lock:
+            self._conexion.executemany("DELETE FROM cola WHERE _id = ? AND propietario = ?",
+                                       [(i, self.propietario) for i in ids])
+
+    def _liberar(self, ids, verificar, descontar=False):
+        # `descontar` devuelve el intento de un envío que el destino rechazó sin procesarlo (cuota)
+        with self._lock:
+            self._conexion.executemany(
+                "UPDATE cola SET propietario = NULL, reclamado_en = NULL, verificar = verificar OR ?, "
+                "intentos = intentos - ? WHERE _id = ? AND propietario = ?",
+                [(int(verificar), int(descontar), i, self.propietario) for i in ids],
+            )
+
+    def _descartar(self, registro, error):
+        # Mueve a `cola_fallidas` una fila que agotó sus intentos
+        i, documento, fila, encolado_en, _, intentos = registro
+        with self._lock:
+            self._conexion.execute("BEGIN IMMEDIATE")
+            try:
+                movidas = self._conexion.execute(
+                    "INSERT INTO cola_fallidas (documento, fila, encolado_en, intentos, error, fallido_en) "
+                    "SELECT documento, fila, encolado_en, intentos, ?, ? FROM cola WHERE _id = ? AND propietario = ?",
+                    (repr(error), time.time(), i, self.propietario),
+                ).rowcount
+                self._conexion.execute("DELETE FROM cola WHERE _id = ? AND propietario = ?", (i, self.propietario))
+                self._conexion.execute("COMMIT")
+            except BaseException:
+                self._conexion.execute("ROLLBACK")
+                raise
+        if movidas:
+            _log.error("La fila del documento %s no se pudo escribir tras %d intentos y pasó a cola_fallidas: %r",
+                       documento, intentos, error)
+            metricas.contar("filas_fallidas")
+            metricas.fijar("cola_pendientes", self.pendientes())
+
+    def enviar_lote(self):
+        """
+        Reclama las filas más antiguas de la cola (hasta `tamano_lote`), las escribe en el destino y las retira
+        de la cola. Retorna el número de filas escritas; los errores del destino se propagan después de liberar
+        las filas (marcadas para verificar, salvo en un rechazo por cuota) o de mover a `cola_fallidas` la fila
+        que agotó sus intentos.
+        """
+        lote = self._reclamar()
+        if not lote:
+            return 0
+
+        if any(verificar for *_, verificar in lote):
+            # Un intento anterior pudo haberse aplicado sin confirmación: se descartan las filas ya escritas
+            try:
+                self.destino.invalidar_cache()
+                presentes = {normalizar_documento(documento) for documento in self.destino.documentos()}
+            except BaseException:
+                self._liberar([i for i, *_ in lote], verificar=True)
+                raise
+            escritas = [i for i, documento, *_ in lote if documento in presentes]
+            if escritas:
+                self._borrar(escritas)
+                metricas.contar("filas_ya_en_destino", len(escritas))
+            lote = [registro for registro in lote if registro[0] not in escritas]
+            if not lote:
+                return 0
+
+        try:
+            with metricas.medir("envio_lote"):
+                self.destino.agregar_filas([json.loads(fila) for _, _, fila, *_ in lote])
+        except BaseException as error:
+            cuota = es_error_cuota(error)
+            if len(lote) == 1 and not cuota and lote[0][-1] >= self.maximo_intentos:
+                self._descartar(lote[0], error)
+            else:
+                self._liberar([i for i, *_ in lote], verificar=not cuota, descontar=cuota)
+            raise
+        self._borrar([i for i, *_ in lote])
+        ahora = time.time()
+        for _, _, _, encolado_en, *_ in lote:
+            metricas.observar("espera_en_cola", ahora - encolado_en)
+        metricas.contar("filas_enviadas", len(lote))
+        metricas.fijar("cola_pendientes", self.pendientes())
+        return len(lote)
+
+    def _espera_reintento(self):
+        # Espera exponencial con variación aleatoria, para que varios procesos no reintenten a la vez
+        espera = min(self.espera_maxima, self.espera_minima * 2 ** (self.reintentos_seguidos - 1))
+        return espera * random.uniform(0.5, 1.0)
+
+    def _trabajar(self):
+        while not self._detener.is_set():
+            if self.reintentos_seguidos:
+                self._detener.wait(self._espera_reintento())
+            else:
+                self._hay_filas.wait(self.intervalo)
+                self._hay_filas.clear()
+            try:
+                enviadas = self.enviar_lote()
+            except DocumentoDuplicado as error:
+                # El destino ya tenía alguna fila del lote: quedó marcado para verificar y descartar las repetidas
+                self.ultimo_error = error
+                metricas.contar("errores_envio_lote", motivo="duplicado")
+                continue
+            except Exception as error:
+                self.reintentos_seguidos += 1
+                self.ultimo_error = error
+                metricas.contar("errores_envio_lote", motivo="cuota" if es_error_cuota(error) else "error")
+                continue
+            self.reintentos_seguidos = 0
+            if enviadas:
+                # Puede haber más filas pendientes: se revisa de nuevo sin esperar
+                self._hay_filas.set()
+
+    def vaciar(self, timeout=None):
+        """Espera a que la cola quede vacía. Retorna True si se vació antes de `timeout` segundos."""
+        limite = None if timeout is None else time.monotonic() + timeout
+        while self.pendientes():
+            if self._hilo is None and self.enviar_lote():
+                continue
+            if limite is not None and time.monotonic() >= limite:
+                return False
+            self._hay_filas.set()
+            time.sleep(0.05)
+        return True
+
+    def detener(self, timeout=None):
+        """Intenta vaciar la cola durante `timeout` segundos y detiene el hilo de fondo."""
+        vacia = self.vaciar(timeout)
+        self._detener.set()
+        self._hay_filas.set()
+        if self._hilo is not None:
+            self._hilo.join()
+        return vacia
@@ -0,0 +1,284 @@
+"""
+Compresión de los bosques compilados con un mínimo garantizado de concordancia con el modelo original.
+
+Los modelos psicosocial y familiar tienen muchos más nodos que los de proyecto y económico, aunque reciben
+solo 14 y 7 variables enteras. `comprimir_bosque` reduce un `sat.arboles.BosqueCompilado` en cuatro pasos:
+
+    1. Une las hojas equivalentes: un nodo cuyos dos hijos son hojas con la misma distribución de clases se
+       convierte en hoja (sin pérdida: las probabilidades del bosque no cambian).
+    2. Elige árboles: partiendo de ninguno, agrega en cada paso el árbol con el que el bosque parcial más
+       concuerda con las etiquetas originales, hasta alcanzar `concordancia_minima`; los demás se descartan.
+    3. Poda por profundidad: la menor profundidad máxima que mantiene la concordancia; los nodos a esa
+       profundidad pasan a ser hojas con la distribución de clases de su nodo.
+    4. Vuelve a unir las hojas equivalentes y retira los nodos inalcanzables.
+
+Los pasos 2 y 3 se prueban en ambos órdenes y con dos objetivos de concordancia, y se conserva el candidato
+aceptado con menor costo por predicción (árboles × profundidad, el número de pasos de `BosqueCompilado`).
+
+Cada candidato (un número de árboles, una profundidad) se acepta solo si la fracción de filas del conjunto de
+referencia en que su clase coincide con la del modelo original es al menos `concordancia_minima`. El
+conjunto de referencia son respuestas sintéticas (`sat.sinteticos`), todo el espacio de respuestas cuando es
+pequeño y, opcionalmente, una exportación real de la hoja "Datos". El resultado se valida además con otro
+conjunto sintético que no se usa para construir los candidatos; si ningún candidato cumple el mínimo en ambos,
+queda el bosque sin pérdida.
+
+Los bosques comprimidos se escriben en formato compacto (`sat.arboles.guardar_compacto`) en un directorio
+aparte, con `comprimido` y la suma del .pkl de origen en el manifiesto; los modelos que no se comprimen se
+copian sin cambios para que el directorio esté completo. Para usarlos en la aplicación, apunte
+SAT_MODELOS_COMPACTOS a ese directorio. Un bosque comprimido tiene su propia identidad en el registro y en el
+caché de predicciones, `sat.tablas_riesgo` no construye tablas con él, y `sat.puntaje` lo usa también en los
+lotes grandes, para que en línea y en las exportaciones una respuesta reciba la misma etiqueta.
+
+Por defecto solo se comprime psico: familiar, proyecto y económico se clasifican con sus tablas precalculadas
+(construidas con el modelo original), por lo que un bosque comprimido para ellos no se usaría y solo
+introduciría diferencias en las filas que la tabla no cubre.
+
+Uso:
+    python -m sat.compresion                                  # psico, concordancia mínima 0.995
+    python -m sat.compresion --concordancia-minima 0.999 --referencia respuestas.csv
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from sat.arboles import compilar_bosque, guardar_compacto
+
+# Concordancia mínima por defecto con las etiquetas del modelo original
+CONCORDANCIA_MINIMA = 0.995
+
+# Directorio (junto a los .pkl) donde se escriben los bosques comprimidos
+DIRECTORIO_COMPRIMIDOS = "modelos_comprimidos"
+
+
+def concordancia(bosque, X, etiquetas):
+    """Fracción de filas de `X` en que `bosque` predice la misma clase que `etiquetas`."""
+    return float(np.mean(bosque.predict(X) == etiquetas))
+
+
+def _es_hoja(bosque):
+    return bosque.izquierdo == np.arange(len(bosque.izquierdo))
+
+
+def _convertir_en_hojas(bosque, nodos):
+    # Copia del bosque en que `nodos` son hojas, con la distribución de clases que ya tienen
+    variable, umbral = bosque.variable.copy(), bosque.umbral.copy()
+    izquierdo, derecho = bosque.izquierdo.copy(), bosque.derecho.copy()
+    variable[nodos], umbral[nodos] = 0, np.inf
+    izquierdo[nodos] = derecho[nodos] = nodos
+    return replace(bosque, variable=variable, umbral=umbral, izquierdo=izquierdo, derecho=derecho)
+
+
+def retirar_inalcanzables(bosque):
+    """Bosque sin los nodos a los que no se llega desde ninguna raíz, con los índices renumerados."""
+    alcanzables = np.zeros(len(bosque.variable), dtype=bool)
+    nodos = np.asarray(bosque.raices)
+    while nodos.size:
+        alcanzables[nodos] = True
+        hijos = np.concatenate([bosque.izquierdo[nodos], bosque.derecho[nodos]])
+        nodos = np.unique(hijos[~alcanzables[hijos]])
+    conservados = np.flatnonzero(alcanzables)
+    nuevo_indice = np.cumsum(alcanzables) - 1
+    return replace(
+        bosque,
+        variable=bosque.variable[conservados],
+        umbral=bosque.umbral[conservados],
+        izquierdo=nuevo_indice[bosque.izquierdo[conservados]].astype(np.int32),
+        derecho=nuevo_indice[bosque.derecho[conservados]].astype(np.int32),
+        valor=np.ascontiguousarray(bosque.valor[conservados]),
+        raices=nuevo_indice[bosque.raices].astype(np.int32),
+    )
+
+
+def unir_hojas_equivalentes(bosque):
+    """Convierte en hoja cada nodo cuyos hijos son hojas con la misma distribución de clases (sin pérdida)."""
+    while True:
+        hoja = _es_hoja(bosque)
+        internos = np.flatnonzero(~hoja)
+        izquierdo, derecho = bosque.izquierdo[internos], bosque.derecho[internos]
+        unibles = hoja[izquierdo] & hoja[derecho] & (bosque.valor[izquierdo] == bosque.valor[derecho]).all(axis=1)
+        if not unibles.any():
+            return retirar_inalcanzables(bosque)
+        # La nueva hoja toma la distribución de sus hijos, iguales entre sí
+        valor = bosque.valor.copy()
+        valor[internos[unibles]] = bosque.valor[izquierdo[unibles]]
+        bosque = replace(_convertir_en_hojas(bosque, internos[unibles]), valor=valor)
+
+
+def elegir_arboles(bosque, X, etiquetas, concordancia_minima):
+    """
+    Selección voraz de árboles: agrega en cada paso el que más aumenta la concordancia del bosque parcial con
+    `etiquetas`, hasta alcanzar `concordancia_minima`. Retorna el bosque con los árboles elegidos.
+    """
+    # Probabilidades de cada árbol para cada fila: (filas, árboles, clases)
+    probabilidades = bosque.valor[bosque.hojas(X)]
+    indices_etiquetas = np.searchsorted(bosque.clases, etiquetas)
+    suma = np.zeros((len(X), bosque.valor.shape[1]))
+    elegidos, disponibles = [], list(range(len(bosque.raices)))
+    while disponibles:
+        puntajes = [np.mean(np.argmax(suma + probabilidades[:, arbol], axis=1) == indices_etiquetas)
+                    for arbol in disponibles]
+        mejor = disponibles.pop(int(np.argmax(puntajes)))
+        elegidos.append(mejor)
+        suma += probabilidades[:, mejor]
+        if max(puntajes) >= concordancia_minima:
+            break
+    # Los árboles se conservan en su orden original, para que las sumas se acumulen en el mismo orden
+    return retirar_inalcanzables(replace(bosque, raices=bosque.raices[np.sort(elegidos)]))
+
+
+def profundidades(bosque):
+    """Profundidad de cada nodo en su árbol (-1 para los nodos inalcanzables)."""
+    profundidad = np.full(len(bosque.variable), -1)
+    nodos, nivel = np.asarray(bosque.raices), 0
+    while nodos.size:
+        profundidad[nodos] = nivel
+        hijos = np.concatenate([bosque.izquierdo[nodos], bosque.derecho[nodos]])
+        nodos = np.unique(hijos[profundidad[hijos] < 0])
+        nivel += 1
+    return profundidad
+
+
+def podar(bosque, profundidad_maxima):
+    """Bosque en que los nodos a `profundidad_maxima` pasan a ser hojas con la distribución de su nodo."""
+    corte = np.flatnonzero((profundidades(bosque) == profundidad_maxima) & ~_es_hoja(bosque))
+    return retirar_inalcanzables(_convertir_en_hojas(bosque, corte))
+
+
+def podar_hasta(bosque, X, etiquetas, concordancia_minima):
+    """Poda `bosque` a la menor profundidad máxima que mantiene `concordancia_minima`."""
+    for profundidad_maxima in range(1, bosque.profundidad):
+        candidato = podar(bosque, profundidad_maxima)
+        if concordancia(candidato, X, etiquetas) >= concordancia_minima:
+            return candidato
+    return bosque
+
+
+def costo(bosque):
+    # Trabajo de una predicción en BosqueCompilado: un paso por nivel de profundidad para cada árbol
+    return len(bosque.raices) * bosque.profundidad, len(bosque.variable)
+
+
+def comprimir_bosque(bosque, X, concordancia_minima=CONCORDANCIA_MINIMA, X_validacion=None):
+    """
+    Comprime `bosque` manteniendo una concordancia de al menos `concordancia_minima` con sus propias
+    predicciones, tanto sobre las filas de referencia `X` como sobre `X_validacion`, si se da. Retorna
+    (bosque comprimido, concordancia sobre `X`, concordancia sobre `X_validacion` o None).
+
+    El paso con pérdida que se aplica primero consume casi todo el margen de concordancia, por lo que se
+    prueban los dos órdenes (elegir árboles y podar, podar y elegir árboles), cada uno con el mínimo pedido y
+    con un objetivo más estricto (la mitad del margen restante hasta 1), y se conserva el candidato aceptado
+    de menor costo por predicción. Si ninguno se acepta, queda el bosque con las hojas equivalentes unidas
+    (exacto); los demás resultados se marcan con `comprimido=True`.
+    """
+    etiquetas = bosque.predict(X)
+    etiquetas_validacion = None if X_validacion is None else bosque.predict(X_validacion)
+    sin_perdida = unir_hojas_equivalentes(bosque)
+    candidatos = [sin_perdida]
+    for objetivo in (concordancia_minima, (1 + concordancia_minima) / 2):
+        candidatos += [
+            podar_hasta(elegir_arboles(sin_perdida, X, etiquetas, objetivo), X, etiquetas, objetivo),
+            elegir_arboles(podar_hasta(sin_perdida, X, etiquetas, objetivo), X, etiquetas, objetivo),
+        ]
+
+    def aceptado(candidato):
+        return (concordancia(candidato, X, etiquetas) >= concordancia_minima
+                and (X_validacion is None
+                     or concordancia(candidato, X_validacion, etiquetas_validacion) >= concordancia_minima))
+
+    comprimido = min((unir_hojas_equivalentes(candidato) for candidato in candidatos[1:]
+                      if aceptado(candidato)), key=costo, default=sin_perdida)
+    if comprimido is not sin_perdida:
+        # Con pérdida: sus predicciones ya no son las del modelo original (ver sat.arboles.BosqueCompilado)
+        comprimido = replace(comprimido, comprimido=True)
+    return (comprimido, concordancia(comprimido, X, etiquetas),
+            None if X_validacion is None else concordancia(comprimido, X_validacion, etiquetas_validacion))
+
+
+def datos_referencia(nombre, filas=20000, semilla=0, archivo=None):
+    """
+    Matriz de entradas del modelo `nombre` para medir la concordancia: `filas` respuestas sintéticas, todas
+    las combinaciones de respuestas si son pocas y las filas completas de la exportación `archivo`, si se da.
+    """
+    from sat.clasificar import leer_bloques
+    from sat.puntaje import COMPONENTES, codificar_lote, codificar_respuestas
+    from sat.sinteticos import generar_indices
+    from sat.tablas_riesgo import MAXIMO_COMBINACIONES, combinaciones, dominios_componente
+
+    posicion = [componente for componente, _ in COMPONENTES].index(nombre)
+    partes = [codificar_respuestas(generar_indices(filas, semilla=semilla))[posicion]]
+    dominios = dominios_componente(nombre)
+    if np.prod([len(dominio) for dominio in dominios]) <= MAXIMO_COMBINACIONES:
+        partes.append(combinaciones(dominios))
+    if archivo is not None:
+        for bloque in leer_bloques(archivo, 10000):
+            matriz = codificar_lote(bloque)[posicion]
+            partes.append(matriz[~np.isnan(matriz).any(axis=1)])
+    return np.vstack(partes)
+
+
+def tamano_bytes(bosque):
+    return sum(arreglo.nbytes for arreglo in bosque.arreglos().values())
+
+
+def segundos_por_fila(bosque, X, repeticiones=200):
+    """Tiempo medio de `predict` de una sola fila."""
+    inicio = time.perf_counter()
+    for i in range(repeticiones):
+        bosque.predict(X[i % len(X):i % len(X) + 1])
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main(argv=None):
+    from sat.modelos import ARCHIVOS_MODELOS, RUTA_BASE, registro
+
+    parser = argparse.ArgumentParser(prog="python -m sat.compresion",
+                                     description="Compresión de los bosques con concordancia mínima garantizada.")
+    parser.add_argument("--modelos", nargs="+", choices=list(ARCHIVOS_MODELOS), default=["psico"],
+                        help="Modelos a comprimir (los demás se copian sin cambios)")
+    parser.add_argument("--concordancia-minima", type=float, default=CONCORDANCIA_MINIMA,
+                        help=f"Fracción mínima de etiquetas iguales a las del original (por defecto {CONCORDANCIA_MINIMA})")
+    parser.add_argument("--referencia", help="Exportación .csv o .parquet de la hoja para el conjunto de referencia")
+    parser.add_argument("--filas", type=int, default=20000, help="Respuestas sintéticas del conjunto de referencia")
+    parser.add_argument("--destino", type=Path, default=RUTA_BASE / DIRECTORIO_COMPRIMIDOS,
+                        help="Directorio donde se escriben los modelos en formato compacto")
+    args = parser.parse_args(argv)
+
+    for nombre in ARCHIVOS_MODELOS:
+        # Siempre a partir del .pkl, aunque el registro esté usando artefactos comprimidos
+        original = compilar_bosque(registro.obtener(nombre))
+        checksum = registro.checksum(nombre)
+        if nombre not in args.modelos:
+            guardar_compacto(original, args.destino / nombre, checksum)
+            print(f"{nombre}: copiado sin comprimir")
+            continue
+
+        X = datos_referencia(nombre, args.filas, semilla=0, archivo=args.referencia)
+        # Respuestas que no participan en la construcción de los candidatos, solo en su aceptación
+        X_validacion = datos_referencia(nombre, args.filas, semilla=1)
+        comprimido, resultado, validacion = comprimir_bosque(original, X, args.concordancia_minima, X_validacion)
+        informe = {
+            "concordancia_minima": args.concordancia_minima,
+            "concordancia_referencia": resultado,
+            "concordancia_validacion": validacion,
+            "filas_referencia": len(X),
+            "arboles_originales": len(original.raices),
+            "nodos_originales": len(original.variable),
+        }
+        guardar_compacto(comprimido, args.destino / nombre, checksum, informe)
+        print(f"{nombre}: árboles {len(original.raices)} -> {len(comprimido.raices)}, "
+              f"nodos {len(original.variable)} -> {len(comprimido.variable)}, "
+              f"profundidad {original.profundidad} -> {comprimido.profundidad}, "
+              f"{tamano_bytes(original) / 2**10:.0f} -> {tamano_bytes(comprimido) / 2**10:.0f} KiB, "
+              f"{segundos_por_fila(original, X) * 1e6:.0f} -> {segundos_por_fila(comprimido, X) * 1e6:.0f} µs por fila")
+        print(f"{nombre}: concordancia referencia = {resultado:.4f}, validación = {validacion:.4f} "
+              f"(mínimo {args.concordancia_minima})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
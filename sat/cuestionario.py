@@ -0,0 +1,1046 @@
+"""
+Esquema declarativo del cuestionario SAT: secciones, preguntas, opciones, puntuaciones y componente.
+
+Es la única fuente de los textos del cuestionario. A partir de él se generan los widgets de la aplicación
+(que retornan directamente el índice de la opción elegida), las columnas de la hoja "Datos", la tabla de
+ponderaciones (`sat.ponderaciones`) y la codificación entera de las respuestas (`sat.puntaje`).
+
+Cada `Opcion` tiene el texto que se muestra y se guarda en la hoja, su puntuación de riesgo y, si existen,
+los textos con que la misma respuesta aparece en exportaciones anteriores (`alias`), que se puntúan igual.
+
+Tipos de pregunta:
+    - "radio": una sola opción.
+    - "seleccion_multiple": varias opciones; se guardan separadas por comas.
+    - "casilla": casilla de verificación; opciones "Sí" (marcada) y "No".
+    - "deslizador" y "numero": valor entero; las opciones son los valores posibles como texto.
+"""
+
+from dataclasses import dataclass
+
+# Nombres de los componentes de riesgo, tal como aparecen en la tabla de ponderaciones
+COMPONENTE_PROYECTO = "PROYECTO DE VIDA ACADEMICA-PROFESIONAL"
+COMPONENTE_FAMILIAR = "FAMILIAR"
+COMPONENTE_ECONOMICO = "ECONOMICA"
+COMPONENTE_PSICOSOCIAL = "PSICOSOCIAL"
+COMPONENTES = (COMPONENTE_PROYECTO, COMPONENTE_FAMILIAR, COMPONENTE_ECONOMICO, COMPONENTE_PSICOSOCIAL)
+
+TIPOS = ("radio", "seleccion_multiple", "casilla", "deslizador", "numero")
+
+
+@dataclass(frozen=True)
+class Opcion:
+    texto: str              # texto mostrado en el formulario y guardado en la hoja "Datos"
+    puntuacion: int = None  # puntuación de riesgo; None en las preguntas que no se puntúan
+    alias: tuple = ()       # otros textos de la misma respuesta en exportaciones anteriores
+
+
+@dataclass(frozen=True)
+class Pregunta:
+    columna: str              # encabezado de la columna en la hoja "Datos"
+    opciones: tuple           # Opcion, tupla (texto, puntuación) o texto
+    etiqueta: str = None      # texto del widget; por defecto, el de la columna
+    componente: str = None    # componente de riesgo; None si la pregunta no se puntúa
+    posicion: int = None      # número de la pregunta dentro de su componente (1, 2, ...)
+    tipo: str = "radio"
+    encabezado: str = None    # texto destacado que se muestra antes de la pregunta
+    subtitulo: str = None
+    imagen: str = None
+    predeterminada: tuple = ()  # textos de las opciones marcadas inicialmente (selección múltiple)
+
+    def __post_init__(self):
+        opciones = tuple(
+            opcion if isinstance(opcion, Opcion) else Opcion(opcion) if isinstance(opcion, str) else Opcion(*opcion)
+            for opcion in self.opciones
+        )
+        object.__setattr__(self, "opciones", opciones)
+        if self.etiqueta is None:
+            object.__setattr__(self, "etiqueta", self.columna)
+
+    @property
+    def textos(self):
+        return [opcion.texto for opcion in self.opciones]
+
+    def indice(self, texto):
+        """Índice de la opción con texto (o alias) `texto`."""
+        for i, opcion in enumerate(self.opciones):
+            if texto == opcion.texto or texto in opcion.alias:
+                return i
+        raise ValueError(f"{texto!r} no es una opción de {self.columna!r}")
+
+    def valores_enteros(self):
+        """Valores de las opciones numéricas de un deslizador o de un campo numérico."""
+        return [int(texto) for texto in self.textos if texto.isdigit()]
+
+    def valor(self, respuesta):
+        """Valor que se guarda en la hoja para `respuesta` (índice de la opción, o lista de índices)."""
+        if self.tipo == "seleccion_multiple":
+            return ", ".join(self.opciones[i].texto for i in respuesta)
+        texto = self.opciones[respuesta].texto
+        return int(texto) if self.tipo in ("deslizador", "numero") and texto.isdigit() else texto
+
+    def respondida(self, respuesta):
+        if self.tipo == "seleccion_multiple":
+            return bool(respuesta)
+        return respuesta is not None
+
+
+@dataclass(frozen=True)
+class Seccion:
+    clave: str        # nombre de la sección en las respuestas de la aplicación
+    preguntas: tuple
+
+VOCACIONAL = Seccion("Vocacional", (
+    Pregunta(
+        "¿Cuál de las siguientes opciones define mejor la razón por la que usted eligió el actual programa de estudios? ",
+        etiqueta="**¿Cuál de las siguientes opciones define mejor la razón por la que usted eligió el actual programa de estudios?**",
+        componente=COMPONENTE_PROYECTO, posicion=1,
+        opciones=(
+            ("Conozco el programa, se ajusta con mis intereses, personalidad y habilidades.", 1),
+            ("Conozco el programa, presenta una buena oferta laboral y puede representar estabilidad económica.", 2),
+            ("Es una alternativa de lo que realmente desearía estudiar.", 3),
+            ("Sin ser la carrera que quisiera estudiar es la única en la que mi familia me apoya.", 4),
+            ("Por sugerencia de amigos, familia y medios de comunicación sin tener claridad de qué es lo que realmente quiero estudiar.", 5),
+        ),
+    ),
+    Pregunta(
+        "¿Qué tan bien conoce el plan de estudios del programa al cual ingresó?",
+        etiqueta="**¿Qué tan bien conoce el plan de estudios del programa al cual ingresó?**",
+        componente=COMPONENTE_PROYECTO, posicion=2,
+        opciones=(("Lo conozco detalladamente", 1), ("Lo conozco de manera superficial", 3), ("No lo conozco", 5)),
+    ),
+    Pregunta(
+        "¿Con cuál de las siguientes afirmaciones está de acuerdo?",
+        etiqueta="**¿Con cuál de las siguientes afirmaciones está de acuerdo?**",
+        componente=COMPONENTE_PROYECTO, posicion=3,
+        opciones=(
+            ("Me identifico con el perfil profesional de mi carrera y mi desempeño académico es bueno.", 1),
+            ("Me identifico con el perfil profesional de mi carrera y mi desempeño académico es regular.", 3),
+            ("No me identifico con el perfil profesional de mi carrera.", 5),
+        ),
+    ),
+    Pregunta(
+        "¿Cuánto tiempo usualmente invierte por día para estudiar fuera del aula de clase? ",
+        etiqueta="**¿Cuánto tiempo usualmente invierte por día para estudiar fuera del aula de clase?**",
+        componente=COMPONENTE_PROYECTO, posicion=4,
+        opciones=(
+            ("4 o más horas", 1),
+            ("Entre 3 y 4 horas", 2),
+            ("Entre 2 y 3 horas", 3),
+            ("Entre 1 y 2 horas", 4),
+            ("Menos de 1 hora", 5),
+        ),
+    ),
+    Pregunta(
+        "En general, ¿cómo calificaría su desempeño durante su trayectoria académica?",
+        etiqueta="**En general, ¿cómo calificaría su desempeño durante su trayectoria académica?**",
+        componente=COMPONENTE_PROYECTO, posicion=5,
+        opciones=(("Sobresaliente", 1), ("Bueno", 2), ("Regular", 3), ("Deficiente", 4), ("Muy deficiente", 5)),
+    ),
+    Pregunta(
+        "Antes de iniciar este semestre, ¿cuánto tiempo estuvo desvinculado como estudiante de una Institución Educativa?",
+        etiqueta="**Antes de iniciar este semestre, ¿cuánto tiempo estuvo desvinculado como estudiante de una Institución Educativa?**",
+        componente=COMPONENTE_PROYECTO, posicion=6,
+        opciones=(("Menos de 6 meses", 1), ("6 meses a 1 año", 2), ("1 año a 3 años", 3), ("3 años o más", 5)),
+    ),
+))
+
+RAZONAMIENTO = Seccion("Razonamiento", (
+    Pregunta(
+        "Seleccione la respuesta correcta 1",
+        etiqueta="Seleccione la respuesta correcta 1:",
+        subtitulo="**1.**", imagen="imagenes/razonamiento1.png",
+        opciones=("1", "2", "3", "4", "5"),
+    ),
+    Pregunta(
+        "Seleccione la respuesta correcta 2",
+        etiqueta="Seleccione la respuesta correcta 2:",
+        subtitulo="**2.**", imagen="imagenes/razonamiento2.png",
+        opciones=("1", "2", "3", "4", "5"),
+    ),
+    Pregunta(
+        "Seleccione la respuesta correcta 3",
+        etiqueta="Seleccione la respuesta correcta 3:",
+        subtitulo="**3.**", imagen="imagenes/razonamiento3.png",
+        opciones=("1", "2", "3", "4", "5"),
+    ),
+    Pregunta(
+        "Seleccione la respuesta correcta 4",
+        etiqueta="Seleccione la respuesta correcta 4:",
+        subtitulo="**4.**", imagen="imagenes/razonamiento4.png",
+        opciones=("1", "2", "3", "4", "5"),
+    ),
+    Pregunta(
+        "Seleccione la respuesta correcta 5",
+        etiqueta="Seleccione la respuesta correcta 5:",
+        subtitulo="**5.**", imagen="imagenes/razonamiento5.png",
+        opciones=("1", "2", "3", "4", "5"),
+    ),
+    Pregunta(
+        "Seleccione la respuesta correcta 6",
+        etiqueta="Seleccione la respuesta correcta 6:",
+        subtitulo="**6.**", imagen="imagenes/razonamiento6.png",
+        opciones=("1", "2", "3", "4", "5"),
+    ),
+))
+
+LECTORA = Seccion("Lectora", (
+    Pregunta(
+        "¿Qué día iban a viajar los personajes de la historia?",
+        etiqueta="**¿Qué día iban a viajar los personajes de la historia?**",
+        componente=COMPONENTE_PROYECTO, posicion=7,
+        encabezado="Teniendo en cuenta la lectura presentada anteriormente, responda las siguientes preguntas:",
+        opciones=(("Lunes.", 5), ("Jueves.", 1), ("Martes.", 5), ("Domingo.", 5)),
+    ),
+    Pregunta(
+        "¿Con motivo de qué celebración iba a viajar esta pareja?",
+        etiqueta="**¿Con motivo de qué celebración iba a viajar esta pareja?**",
+        componente=COMPONENTE_PROYECTO, posicion=8,
+        opciones=(("Luna de miel.", 5), ("Aniversario de bodas.", 1), ("Cumpleaños de ambos.", 5), ("Vacaciones.", 5)),
+    ),
+    Pregunta(
+        "¿Cuál era el nombre de la mujer que protagoniza la historia?",
+        etiqueta="**¿Cuál era el nombre de la mujer que protagoniza la historia?**",
+        componente=COMPONENTE_PROYECTO, posicion=9,
+        opciones=(("Andrea.", 5), ("Alma.", 5), ("Ana", 5), Opcion("Aura", 1, alias=("Aura.",))),
+    ),
+    Pregunta(
+        "¿Cuál era el nombre del hombre que protagoniza la historia?",
+        etiqueta="**¿Cuál era el nombre del hombre que protagoniza la historia?**",
+        componente=COMPONENTE_PROYECTO, posicion=10,
+        opciones=(("Leonardo.", 5), ("Lucas.", 5), ("Luis.", 1), ("Lorenzo.", 5)),
+    ),
+    Pregunta(
+        "Inicialmente, ¿A qué país iban a viajar?",
+        etiqueta="**Inicialmente, ¿A qué país iban a viajar?**",
+        componente=COMPONENTE_PROYECTO, posicion=11,
+        opciones=(("México.", 5), ("Costa Rica.", 5), ("Puerto Rico.", 1), ("Guatemala.", 5)),
+    ),
+    Pregunta(
+        "¿Cuál era el nombre del agente de viajes?",
+        etiqueta="**¿Cuál era el nombre del agente de viajes?**",
+        componente=COMPONENTE_PROYECTO, posicion=12,
+        opciones=(("Andrés.", 1), ("Armando.", 5), ("Alberto.", 5), ("Ninguno de los anteriores.", 5)),
+    ),
+    Pregunta(
+        "Finalmente, ¿A qué país terminaron viajando?",
+        etiqueta="**Finalmente, ¿A qué país terminaron viajando?**",
+        componente=COMPONENTE_PROYECTO, posicion=13,
+        opciones=(("Puerto Rico.", 5), ("París.", 5), ("Perú.", 1), ("Ninguno de los anteriores.", 5)),
+    ),
+    Pregunta(
+        "Con relación a sus técnicas de estudio responda las siguientes preguntas:  [¿El lugar donde estudia cuenta con las condiciones adecuadas para estudiar? (iluminación, libre de ruido, suficiente espacio)]",
+        etiqueta="**¿El lugar donde estudia cuenta con las condiciones adecuadas para estudiar? (iluminación, libre de ruido, suficiente espacio)**",
+        componente=COMPONENTE_PROYECTO, posicion=14,
+        encabezado="Con relación a sus técnicas de estudio responda las siguientes preguntas:",
+        opciones=(("Sí", 1), ("A veces", 3), ("No", 5)),
+    ),
+    Pregunta(
+        "Con relación a sus técnicas de estudio responda las siguientes preguntas:  [¿Encuentra motivación en las diferentes actividades que realiza a nivel académico?]",
+        etiqueta="**¿Encuentra motivación en las diferentes actividades que realiza a nivel académico?**",
+        componente=COMPONENTE_PROYECTO, posicion=15,
+        opciones=(("Sí", 1), ("A veces", 3), ("No", 5)),
+    ),
+    Pregunta(
+        "Con relación a sus técnicas de estudio responda las siguientes preguntas:  [¿Considera que las técnicas de estudio que utiliza son efectivas?]",
+        etiqueta="**¿Considera que las técnicas de estudio que utiliza son efectivas?**",
+        componente=COMPONENTE_PROYECTO, posicion=16,
+        opciones=(("Sí", 1), ("A veces", 3), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Le han diagnosticado alguna  dificultad de aprendizaje como dificultad para concentrarse, falta de atención, impulsividad, hiperactividad, dislexia o discalculia?",
+        etiqueta="**¿Le han diagnosticado alguna  dificultad de aprendizaje como dificultad para concentrarse, falta de atención, impulsividad, hiperactividad, dislexia o discalculia?**",
+        componente=COMPONENTE_PROYECTO, posicion=17,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+))
+
+DIAGNOSTICO = Seccion("Diagnóstico", (
+    Pregunta(
+        "¿Cuenta con una red de apoyo  (familiares, amigos o adultos cercanos) que le brinden ayuda a nivel emocional, social, económica o de salud? ",
+        etiqueta="**¿Cuenta con una red de apoyo  (familiares, amigos o adultos cercanos) que le brinden ayuda a nivel emocional, social, económica o de salud?**",
+        componente=COMPONENTE_FAMILIAR, posicion=1,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Cómo definiría la relación con las personas que conviven con usted?",
+        etiqueta="**¿Cómo definiría la relación con las personas que conviven con usted?**",
+        componente=COMPONENTE_FAMILIAR, posicion=2,
+        opciones=(
+            ("Tenemos muy buena relación.", 1),
+            ("Discutimos pocas veces y cuando lo hacemos solucionamos los problemas hablando y llegando a un acuerdo.", 2),
+            ("Apenas hablamos entre nosotros.", 3),
+            ("Discutimos algunas veces y no  llegamos a acuerdos.", 4),
+            ("Discutimos muchas veces sin llegar a acuerdos.", 5),
+        ),
+    ),
+    Pregunta(
+        "De acuerdo a la relación que tiene con su familia, califique los siguientes aspectos: [Comunicación]",
+        etiqueta="Comunicación",
+        componente=COMPONENTE_FAMILIAR, posicion=3,
+        opciones=(("Buena", 1), ("Regular", 3), ("Mala", 5)),
+    ),
+    Pregunta(
+        "De acuerdo a la relación que tiene con su familia, califique los siguientes aspectos: [Expresión de afecto entre los miembros de la familia]",
+        etiqueta="Expresión de afecto entre los miembros de la familia",
+        componente=COMPONENTE_FAMILIAR, posicion=4,
+        opciones=(("Buena", 1), ("Regular", 3), ("Mala", 5)),
+    ),
+    Pregunta(
+        "De acuerdo a la relación que tiene con su familia, califique los siguientes aspectos: [Afrontamiento de problemas familiares]",
+        etiqueta="Afrontamiento de problemas familiares",
+        componente=COMPONENTE_FAMILIAR, posicion=5,
+        opciones=(("Buena", 1), ("Regular", 3), ("Mala", 5)),
+    ),
+    Pregunta(
+        "De acuerdo a la relación que tiene con su familia, califique los siguientes aspectos: [Establecimiento de normas en el contexto familiar]",
+        etiqueta="Establecimiento de normas en el contexto familiar",
+        componente=COMPONENTE_FAMILIAR, posicion=6,
+        opciones=(("Buena", 1), ("Regular", 3), ("Mala", 5)),
+    ),
+    Pregunta(
+        "De acuerdo a la relación que tiene con su familia, califique los siguientes aspectos: [Cercanía de los miembros de su familia]",
+        etiqueta="Cercanía de los miembros de su familia",
+        componente=COMPONENTE_FAMILIAR, posicion=7,
+        opciones=(("Buena", 1), ("Regular", 3), ("Mala", 5)),
+    ),
+    Pregunta(
+        "Elija la opción que mejor refleje su entorno familiar:",
+        etiqueta="**Elija la opción que mejor refleje su entorno familiar:**",
+        componente=COMPONENTE_FAMILIAR, posicion=8,
+        opciones=(
+            Opcion("En mi hogar las normas se establecen a través de la negociación", 1, alias=("En casa, mis padres (o acudientes) establecen las normas a través de la negociación.",)),
+            Opcion("Las normas del hogar ya están establecidas y todos las cumplimos", 2, alias=("Mis padres establecen las normas del hogar y todos las cumplimos.",)),
+            Opcion("Hay normas establecidas, pero no las cumplo porque no estoy de acuerdo", 3, alias=("Hay normas establecidas por mis padres (o acudientes), pero no las cumplo porque no estoy de acuerdo.",)),
+            Opcion("No me quedan muy claras cuáles son las normas de convivencia que hay en el hogar", 4, alias=("No me quedan muy claras cuáles son las normas de convivencia que hay en casa",)),
+            Opcion("En mi hogar no hay establecidas normas de convivencia", 5, alias=("En mi casa no hay establecidas normas de convivencia",)),
+        ),
+    ),
+    Pregunta(
+        "¿Con qué frecuencia su familia realiza las siguientes acciones? [Cuando algo le preocupa, ¿puede pedir ayuda a su familia?]",
+        etiqueta="**Cuando algo le preocupa, ¿puede pedir ayuda a su familia?**",
+        componente=COMPONENTE_FAMILIAR, posicion=9,
+        encabezado="¿Con qué frecuencia su familia realiza las siguientes acciones?",
+        opciones=(("Frecuentemente", 1), ("Algunas veces", 3), ("Nunca", 5)),
+    ),
+    Pregunta(
+        "¿Con qué frecuencia su familia realiza las siguientes acciones? [Disfrutra el tiempo que comparte con su familia.]",
+        etiqueta="**Disfruta el tiempo que comparte con su familia.**",
+        componente=COMPONENTE_FAMILIAR, posicion=10,
+        opciones=(("Frecuentemente", 1), ("Algunas veces", 3), ("Nunca", 5)),
+    ),
+    Pregunta(
+        "¿Con qué frecuencia su familia realiza las siguientes acciones? [Su familia lo acompaña en su vida universitaria.]",
+        etiqueta="**Su familia lo acompaña en su vida universitaria.**",
+        componente=COMPONENTE_FAMILIAR, posicion=11,
+        opciones=(("Frecuentemente", 1), ("Algunas veces", 3), ("Nunca", 5)),
+    ),
+    Pregunta(
+        "¿Cómo gestiona los conflictos familiares con sus padres o personas con las que convive?  [Interrumpo constantemente a mis padres porque no estoy de acuerdo con lo que dicen]",
+        etiqueta="**Interrumpo constantemente a mis padres porque no estoy de acuerdo con lo que dicen**",
+        componente=COMPONENTE_FAMILIAR, posicion=12,
+        encabezado="¿Cómo gestiona los conflictos familiares con sus padres o personas con las que convive?",
+        opciones=(("Nunca", 1), ("Pocas veces", 2), ("Algunas veces", 3), ("A menudo", 4), ("Siempre", 5)),
+    ),
+    Pregunta(
+        "¿Cómo gestiona los conflictos familiares con sus padres o personas con las que convive?  [Intento cambiar de tema y evitar hablar de lo que ha pasado]",
+        etiqueta="**Intento cambiar de tema y evitar hablar de lo que ha pasado**",
+        componente=COMPONENTE_FAMILIAR, posicion=13,
+        opciones=(("Nunca", 1), ("Pocas veces", 2), ("Algunas veces", 3), ("A menudo", 4), ("Siempre", 5)),
+    ),
+    Pregunta(
+        "¿Cómo gestiona los conflictos familiares con sus padres o personas con las que convive?  [Discuto con mis padres o tutores y me enfrento a ellos]",
+        etiqueta="**Discuto con mis padres o tutores y me enfrento a ellos**",
+        componente=COMPONENTE_FAMILIAR, posicion=14,
+        opciones=(("Nunca", 1), ("Pocas veces", 2), ("Algunas veces", 3), ("A menudo", 4), ("Siempre", 5)),
+    ),
+    Pregunta(
+        "¿Cómo gestiona los conflictos familiares con sus padres o personas con las que convive?  [Aporto soluciones para resolver el problema]",
+        etiqueta="**Aporto soluciones para resolver el problema**",
+        componente=COMPONENTE_FAMILIAR, posicion=15,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("A menudo", 2), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "¿Cómo gestiona los conflictos familiares con sus padres o personas con las que convive?  [Cuando nos enfadamos, incluso llegamos a la violencia física]",
+        etiqueta="**Cuando nos enfadamos, incluso llegamos a la violencia física**",
+        componente=COMPONENTE_FAMILIAR, posicion=16,
+        opciones=(("Nunca", 1), ("Pocas veces", 2), ("Algunas veces", 3), ("A menudo", 4), ("Siempre", 5)),
+    ),
+    Pregunta(
+        "¿Cómo gestiona los conflictos familiares con sus padres o personas con las que convive?  [Intento tratar el conflicto dialogando y escuchando a mis padres.]",
+        etiqueta="**Intento tratar el conflicto dialogando y escuchando a mis padres.**",
+        componente=COMPONENTE_FAMILIAR, posicion=17,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("A menudo", 2), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "¿Actualmente en su familia se presentan algunas de las siguientes situaciones?",
+        etiqueta="**¿Actualmente en su familia se presentan algunas de las siguientes situaciones? (Selección múltiple)**",
+        componente=COMPONENTE_FAMILIAR, posicion=18,
+        tipo="seleccion_multiple",
+        predeterminada=("Ninguna",),
+        opciones=(
+            ("Malas relaciones intrafamiliares", 5),
+            ("Fallecimiento de algún pariente", 5),
+            ("Violencia intrafamiliar", 5),
+            ("Abuso o violencia sexual", 5),
+            ("Enfermedad crónica de algún pariente", 5),
+            ("Separación de los padres", 5),
+            ("Alcoholismo o adicción a sustancias", 5),
+            ("Desplazamiento forzado", 5),
+            ("Dificultades económicas de la familia", 5),
+            Opcion("Ninguna", 1, alias=("Ninguno",)),
+        ),
+    ),
+    Pregunta(
+        "¿Cuántos hijos tiene usted?",
+        etiqueta="**¿Cuántos hijos tiene usted?**",
+        componente=COMPONENTE_FAMILIAR, posicion=19,
+        opciones=(("Ninguno", 1), ("Uno", 2), ("Dos", 3), ("Más de dos", 5)),
+    ),
+))
+
+SOCIALES = Seccion("Habilidades Sociales", (
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [En una conversación. Presta atención a la persona que le está hablando]",
+        etiqueta="**En una conversación. Presta atención a la persona que le está hablando**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=45,
+        encabezado="Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones:",
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Toma la iniciativa de darse a conocer a otras personas]",
+        etiqueta="**Toma la iniciativa de darse a conocer a otras personas**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=46,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Ayuda a que los demás se conozcan entre sí]",
+        etiqueta="**Ayuda a que los demás se conozcan entre sí**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=47,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Pide ayuda cuando tiene alguna dificultad]",
+        etiqueta="**Pide ayuda cuando tiene alguna dificultad**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=48,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Se integra con facilidad a un grupo o  participa en actividades grupales]",
+        etiqueta="**Se integra con facilidad a un grupo o participa en actividades grupales**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=49,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Pide disculpas a los demás por haber hecho algo mal]",
+        etiqueta="**Pide disculpas a los demás por haber hecho algo mal**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=50,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Reconoce cuando es necesario pedir permiso para hacer algo y lo solicita a la persona indicada]",
+        etiqueta="**Reconoce cuando es necesario pedir permiso para hacer algo y lo solicita a la persona indicada**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=51,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Presta ayuda a quien lo necesita]",
+        etiqueta="**Presta ayuda a quien lo necesita**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=52,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [En una situación que le genera enojo, logra controlar esta emoción]",
+        etiqueta="**En una situación que le genera enojo, logra controlar esta emoción**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=53,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Se mantiene al margen de situaciones que le pueden ocasionar problemas]",
+        etiqueta="**Se mantiene al margen de situaciones que le pueden ocasionar problemas**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=54,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Se cohibe de participar en actividades sociales por miedo a la critica o por verguenza]",
+        etiqueta="**Se cohibe de participar en actividades sociales por miedo a la critica o por vergüenza**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=55,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Siempre", 5)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [Antes de una conversación problemática, planifica la forma de exponer su punto de vista]",
+        etiqueta="**Antes de una conversación problemática, planifica la forma de exponer su punto de vista**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=56,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+    Pregunta(
+        "Señale la frecuencia con la que le ocurre lo indicado en cada una de las siguientes afirmaciones: [En un contexto social, sino tiene claro el tema de conversación o surgen inquietudes alrededor del mismo, solicita explicación]",
+        etiqueta="**En un contexto social, si no tiene claro el tema de conversación o surgen inquietudes alrededor del mismo, solicita explicación**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=57,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Siempre", 1)),
+    ),
+))
+
+ECONOMICO = Seccion("Componente Económico", (
+    Pregunta(
+        "¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda? [Energía eléctrica]",
+        etiqueta="**Energía eléctrica**",
+        componente=COMPONENTE_ECONOMICO, posicion=1,
+        encabezado="¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda?",
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda? [Alcantarillado]",
+        etiqueta="**Alcantarillado**",
+        componente=COMPONENTE_ECONOMICO, posicion=2,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda? [Gas natural o propano]",
+        etiqueta="**Gas natural o propano**",
+        componente=COMPONENTE_ECONOMICO, posicion=3,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda? [Recolección de basuras]",
+        etiqueta="**Recolección de basuras**",
+        componente=COMPONENTE_ECONOMICO, posicion=4,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda? [Acueducto]",
+        etiqueta="**Acueducto**",
+        componente=COMPONENTE_ECONOMICO, posicion=5,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda? [Internet hogar]",
+        etiqueta="**Internet hogar**",
+        componente=COMPONENTE_ECONOMICO, posicion=6,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Con cuáles de los siguientes servicios públicos, privados o comunales cuenta la vivienda? [Plan de datos (celular)]",
+        etiqueta="**Plan de datos (celular)**",
+        componente=COMPONENTE_ECONOMICO, posicion=7,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "La vivienda ocupada es:",
+        etiqueta="**La vivienda ocupada es:**",
+        componente=COMPONENTE_ECONOMICO, posicion=8,
+        opciones=(
+            ("Propia, totalmente pagada", 1),
+            ("Propia, la están pagando", 2),
+            ("Con permiso del propietario o de familia", 3),
+            ("En arriendo o subarriendo", 4),
+            ("Posesión sin título, ocupante de hecho (invasión)", 5),
+        ),
+    ),
+    Pregunta(
+        "El agua para el consumo o preparación de alimentos la obtienen principalmente de:",
+        etiqueta="**El agua para el consumo o preparación de alimentos la obtienen principalmente de:**",
+        componente=COMPONENTE_ECONOMICO, posicion=9,
+        opciones=(
+            ("Acueducto", 1),
+            ("Pozo con bomba", 3),
+            ("Pozo sin bomba, jagüey", 5),
+            ("Agua lluvia", 5),
+            ("Río, quebrada, manantial, escorrentía, nacimiento", 5),
+            ("Pila pública", 3),
+            ("Carrotanque", 3),
+            ("Aguatero", 3),
+            ("Agua embotellada o en bolsa", 3),
+        ),
+    ),
+    Pregunta(
+        "¿Qué tipo de sanitario utiliza en su hogar?",
+        etiqueta="**¿Qué tipo de sanitario utiliza en su hogar?**",
+        componente=COMPONENTE_ECONOMICO, posicion=10,
+        opciones=(
+            ("Con conexión a alcantarillado", 1),
+            ("Con conexión a pozo séptico", 2),
+            ("Sin conexión a alcantarillado ni a pozo séptico", 4),
+            ("Letrina, bajamar", 4),
+            ("No tiene", 5),
+        ),
+    ),
+    Pregunta(
+        "¿Cuáles de los siguientes bienes posee este hogar? [Nevera o refrigerador]",
+        etiqueta="**Nevera o refrigerador**",
+        componente=COMPONENTE_ECONOMICO, posicion=11,
+        encabezado="¿Cuáles de los siguientes bienes posee este hogar?",
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Cuáles de los siguientes bienes posee este hogar? [Máquina lavadora de ropa]",
+        etiqueta="**Máquina lavadora de ropa**",
+        componente=COMPONENTE_ECONOMICO, posicion=12,
+        opciones=(("Sí", 1), ("No", 3)),
+    ),
+    Pregunta(
+        "¿Cuáles de los siguientes bienes posee este hogar? [Computador]",
+        etiqueta="**Computador**",
+        componente=COMPONENTE_ECONOMICO, posicion=13,
+        opciones=(("Sí", 1), ("No", 3)),
+    ),
+    Pregunta(
+        "¿Cuáles de los siguientes bienes posee este hogar? [Celular, tablet]",
+        etiqueta="**Celular, tablet**",
+        componente=COMPONENTE_ECONOMICO, posicion=14,
+        opciones=(("Sí", 1), ("No", 3)),
+    ),
+    Pregunta(
+        "¿Cuáles de los siguientes bienes posee este hogar? [Fogón o estufa]",
+        etiqueta="**Fogón o estufa**",
+        componente=COMPONENTE_ECONOMICO, posicion=15,
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "¿Cuáles de los siguientes bienes posee este hogar? [Televisión o equipo de sonido]",
+        etiqueta="**Televisión o equipo de sonido**",
+        componente=COMPONENTE_ECONOMICO, posicion=16,
+        opciones=(("Sí", 1), ("No", 3)),
+    ),
+    Pregunta(
+        "¿Cuáles de los siguientes bienes posee este hogar? [Consola de videojuegos]",
+        etiqueta="**Consola de videojuegos**",
+        componente=COMPONENTE_ECONOMICO, posicion=17,
+        opciones=(("Sí", 1), ("No", 1)),
+    ),
+    Pregunta(
+        "Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos? [Inundaciones, crecientes, arroyos]",
+        etiqueta="**Inundaciones, crecientes, arroyos**",
+        componente=COMPONENTE_ECONOMICO, posicion=18,
+        encabezado="Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos?",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos? [Avalanchas, derrumbes o deslizamientos]",
+        etiqueta="**Avalanchas, derrumbes o deslizamientos**",
+        componente=COMPONENTE_ECONOMICO, posicion=19,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos? [Terremotos]",
+        etiqueta="**Terremotos**",
+        componente=COMPONENTE_ECONOMICO, posicion=20,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos? [Incendios]",
+        etiqueta="**Incendios**",
+        componente=COMPONENTE_ECONOMICO, posicion=21,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos? [Hundimientos de terreno]",
+        etiqueta="**Hundimientos de terreno**",
+        componente=COMPONENTE_ECONOMICO, posicion=22,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos? [Desalojos]",
+        etiqueta="**Desalojos**",
+        componente=COMPONENTE_ECONOMICO, posicion=23,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Durante el tiempo que lleva habitando su vivienda, ¿ésta ha sido afectada por alguno de los siguientes eventos? [Conflicto armado]",
+        etiqueta="**Conflicto armado**",
+        componente=COMPONENTE_ECONOMICO, posicion=24,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Las vías de acceso vehicular a su vivienda son principalmente:",
+        etiqueta="**Las vías de acceso vehicular a su vivienda son principalmente:**",
+        componente=COMPONENTE_ECONOMICO, posicion=25,
+        opciones=(("Vía pavimentada", 1), ("Destapada, trocha, herradura", 3), ("No hay vía", 5)),
+    ),
+    Pregunta(
+        "Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para? [Ver]",
+        etiqueta="Ver",
+        componente=COMPONENTE_ECONOMICO, posicion=26,
+        tipo="casilla",
+        encabezado="Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para?",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para? [Oír]",
+        etiqueta="Oír",
+        componente=COMPONENTE_ECONOMICO, posicion=27,
+        tipo="casilla",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para? [Hablar]",
+        etiqueta="Hablar",
+        componente=COMPONENTE_ECONOMICO, posicion=28,
+        tipo="casilla",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para? [Moverse o caminar por sí mismo]",
+        etiqueta="Moverse o caminar por sí mismo",
+        componente=COMPONENTE_ECONOMICO, posicion=29,
+        tipo="casilla",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para? [Bañarse, vestirse o alimentarse por sí mismo]",
+        etiqueta="Bañarse, vestirse o alimentarse por sí mismo",
+        componente=COMPONENTE_ECONOMICO, posicion=30,
+        tipo="casilla",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para? [Dificultad para salir a la calle sin ayuda o compañía]",
+        etiqueta="Dificultad para salir a la calle sin ayuda o compañía",
+        componente=COMPONENTE_ECONOMICO, posicion=31,
+        tipo="casilla",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Por enfermedad, accidente o nacimiento ¿tiene usted limitaciones permanentes para? [Entender o aprender]",
+        etiqueta="Entender o aprender",
+        componente=COMPONENTE_ECONOMICO, posicion=32,
+        tipo="casilla",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "¿Usted es el responsable del cuidado de una persona que presenta una condición especial o adulto mayor?",
+        etiqueta="**¿Usted es el responsable del cuidado de una persona que presenta una condición especial o adulto mayor?**",
+        componente=COMPONENTE_ECONOMICO, posicion=33,
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "¿En qué rango se encuentra el ingreso mensual de la familia?",
+        etiqueta="**Ingreso mensual de la familia**",
+        componente=COMPONENTE_ECONOMICO, posicion=34,
+        opciones=(
+            ("Menos de 1 salario mínimo mensual legal vigente.", 5),
+            ("Entre 1 y 2 salarios mínimos mensuales legales vigentes.", 4),
+            Opcion("Más de 2 y menos de 3 salarios mensuales mínimos legales vigentes.", 3, alias=("Más de 2 y menos de 3 salarios mensuales  mínimos legales vigentes.",)),
+            ("Más de 3 y menos de 4 salarios mensuales mínimos legales vigentes.", 2),
+            ("Más de 4 salarios mínimos mensuales legales vigentes.", 1),
+        ),
+    ),
+    Pregunta(
+        "¿Cuántas personas dependen del ingreso familiar?",
+        etiqueta="**¿Cuántas personas dependen del ingreso familiar?**",
+        componente=COMPONENTE_ECONOMICO, posicion=35,
+        tipo="numero",
+        opciones=(("1", 1), ("2", 2), ("3", 3), ("4", 4), ("5", 5), (">5", 5)),
+    ),
+))
+
+AFRONTAMIENTO = Seccion("Estrategias de Afrontamiento", (
+    Pregunta(
+        "Indique el grado de intensidad de estrés que le ha generado esa situación",
+        etiqueta="**Indique el grado de intensidad de estrés que le ha generado esa situación, donde 1 es nada estresante y 5 muy estresante**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=1,
+        tipo="deslizador",
+        opciones=(("1", 1), ("2", 2), ("3", 3), ("4", 4), ("5", 5)),
+    ),
+    Pregunta(
+        "Indique el grado en que creía controlar este problema.",
+        etiqueta="**Indique el grado en que creía controlar este problema. Donde 1 es nada y 5 es mucho**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=2,
+        tipo="deslizador",
+        opciones=(("1", 5), ("2", 4), ("3", 3), ("4", 2), ("5", 1)),
+    ),
+    Pregunta(
+        "Cuando ocurrió este problema: [¿Pensó en él como una amenaza?]",
+        etiqueta="¿Pensó en él como una amenaza?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=3,
+        tipo="casilla",
+        encabezado="Cuando ocurrió este problema:",
+        opciones=(("Sí", 5), ("No", 1)),
+    ),
+    Pregunta(
+        "Cuando ocurrió este problema: [¿Pensó en el como un reto?]",
+        etiqueta="¿Pensó en él como un reto?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=4,
+        tipo="casilla",
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "Cuando ocurrió este problema: [¿Pensó en diferentes maneras de resolver el problema?]",
+        etiqueta="¿Pensó en diferentes maneras de resolver el problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=5,
+        tipo="casilla",
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "Cuando ocurrió este problema: [¿Decidió una forma de resolver el problema y la aplicó?]",
+        etiqueta="¿Decidió una forma de resolver el problema y la aplicó?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=6,
+        tipo="casilla",
+        opciones=(("Sí", 1), ("No", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Se decía a si mismo algo para sentirse mejor?]",
+        etiqueta="¿Se decía a sí mismo algo para sentirse mejor?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=7,
+        encabezado="Lea atentamente cada una de las siguientes preguntas y señale con qué frecuencia actúa",
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 2), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Habló con algún familiar sobre el problema?]",
+        etiqueta="¿Habló con algún familiar sobre el problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=8,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó olvidarlo todo?]",
+        etiqueta="¿Intentó olvidarlo todo?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=9,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó ayudar a otros a resolver un problema similar?]",
+        etiqueta="¿Intentó ayudar a otros a resolver un problema similar?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=10,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Descargó su enfado sobre otras personas cuando se sentía triste o enfadado?]",
+        etiqueta="¿Descargó su enfado sobre otras personas cuando se sentía triste o enfadado?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=11,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó distanciarse del problema y ser más objetivo?]",
+        etiqueta="¿Intentó distanciarse del problema y ser más objetivo?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=12,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Se recordó a sí mismo que las cosas podían ser mucho peores?]",
+        etiqueta="¿Se recordó a sí mismo que las cosas podían ser mucho peores?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=13,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Habló con algún amigo sobre el problema?]",
+        etiqueta="¿Habló con algún amigo sobre el problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=14,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Se esforzó por resolver el problema?]",
+        etiqueta="¿Se esforzó por resolver el problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=15,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó no pensar en el problema?]",
+        etiqueta="¿Intentó no pensar en el problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=16,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Se dio cuenta de que no controlaba el problema?]",
+        etiqueta="¿Se dio cuenta de que no controlaba el problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=17,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Empezó a hacer nuevas actividades?]",
+        etiqueta="¿Empezó a hacer nuevas actividades?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=18,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Se aventuro e hizo algo arriesgado?]",
+        etiqueta="¿Se aventuró e hizo algo arriesgado?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=19,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Pensó acerca de lo que tenía que hacer o decir en torno al problema?]",
+        etiqueta="¿Pensó acerca de lo que tenía que hacer o decir en torno al problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=20,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó ver el lado positivo de la situación?]",
+        etiqueta="¿Intentver el lado positivo de la situación?**",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=21,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Habló con algún profesional (por ejemplo, psicólogo, médico, abogado, sacerdote...)?]",
+        etiqueta="¿Habló con algún profesional (por ejemplo, psicólogo, médico, abogado, sacerdote...)?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=22,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Fantaseó o imagino mejores tiempos y situaciones que las que estaba viviendo?]",
+        etiqueta="¿Fantaseó o imaginó mejores tiempos y situaciones que las que estaba viviendo?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=23,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Creyó que el resultado sería decidido por el destino?]",
+        etiqueta="¿Creyó que el resultado sería decidido por el destino?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=24,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó hacer nuevos amigos?]",
+        etiqueta="¿Intentó hacer nuevos amigos?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=25,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Se mantuvo apartado de la gente?]",
+        etiqueta="¿Se mantuvo apartado de la gente?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=26,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó prever cómo podrían cambiar las cosas?]",
+        etiqueta="¿Intentó prever cómo podrían cambiar las cosas?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=27,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Pensó que estaba mejor que otras personas con el mismo problema que el suyo?]",
+        etiqueta="¿Pensó que estaba mejor que otras personas con el mismo problema que el suyo?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=28,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Buscó la ayuda de otras personas o grupos con el mismo tipo de problema?]",
+        etiqueta="¿Buscó la ayuda de otras personas o grupos con el mismo tipo de problema?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=29,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó resolver el problema al menos de dos formas diferentes?]",
+        etiqueta="¿Intentó resolver el problema al menos de dos formas diferentes?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=30,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó no pensar en su situación, aún sabiendo que tendría que hacerlo en otro momento?]",
+        etiqueta="¿Intentó no pensar en su situación, aún sabiendo que tendría que hacerlo en otro momento?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=31,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Aceptó el problema por que no se podía hacer algo para cambiarlo?]",
+        etiqueta="¿Aceptó el problema porque no se podía hacer algo para cambiarlo?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=32,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Leyó con más frecuencia como forma de distracción?]",
+        etiqueta="¿Leyó con más frecuencia como forma de distracción?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=33,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Gritó o lloró para desahogarse?]",
+        etiqueta="¿Gritó o lloró para desahogarse?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=34,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Trató de dar algún sentido personal a la situación?]",
+        etiqueta="¿Trató de dar algún sentido personal a la situación?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=35,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó decirse a sí mismo que las cosas mejorarían?]",
+        etiqueta="¿Intentó decirse a sí mismo que las cosas mejorarían?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=36,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Procuró informarse más sobre la situación?]",
+        etiqueta="¿Procuró informarse más sobre la situación?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=37,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó aprender a hacer más cosas por su cuenta?]",
+        etiqueta="¿Intentó aprender a hacer más cosas por su cuenta?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=38,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Deseó que el problema desapareciera o deseó acabar con él de algún modo?]",
+        etiqueta="¿Deseó que el problema desapareciera o deseó acabar con él de algún modo?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=39,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Esperó que se resolviera de la peor manera posible?]",
+        etiqueta="¿Esperó que se resolviera de la peor manera posible?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=40,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Empleó mucho tiempo en actividades de recreo?]",
+        etiqueta="¿Empleó mucho tiempo en actividades de recreo?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=41,
+        opciones=(("Nunca", 1), ("Pocas veces", 3), ("Algunas veces", 4), ("Muchas veces", 5)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Intentó anticipar las nuevas demandas que le podían pedir?]",
+        etiqueta="¿Intentó anticipar las nuevas demandas que le podían pedir?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=42,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Pensó en cómo está situación podía cambiar su vida para mejor?]",
+        etiqueta="¿Pensó en cómo esta situación podía cambiar su vida para mejor?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=43,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+    Pregunta(
+        "Lea atentamente cada una de las siguientes preguntas  y señale con qué frecuencia actúa  [¿Rezó para guiarse o fortalecerse?]",
+        etiqueta="¿Rezó para guiarse o fortalecerse?",
+        componente=COMPONENTE_PSICOSOCIAL, posicion=44,
+        opciones=(("Nunca", 5), ("Pocas veces", 4), ("Algunas veces", 3), ("Muchas veces", 1)),
+    ),
+))
+
+# Secciones en el orden del formulario, que es también el orden de las columnas de la hoja "Datos"
+SECCIONES = (VOCACIONAL, RAZONAMIENTO, LECTORA, DIAGNOSTICO, SOCIALES, ECONOMICO, AFRONTAMIENTO)
+PREGUNTAS_CUESTIONARIO = tuple(pregunta for seccion in SECCIONES for pregunta in seccion.preguntas)
+
+
+def validar_cuestionario(preguntas=PREGUNTAS_CUESTIONARIO):
+    """Verifica la consistencia del esquema; lanza ValueError con el primer problema encontrado."""
+    columnas = [pregunta.columna for pregunta in preguntas]
+    repetidas = {columna for columna in columnas if columnas.count(columna) > 1}
+    if repetidas:
+        raise ValueError(f"Columnas repetidas en el cuestionario: {sorted(repetidas)}")
+
+    for pregunta in preguntas:
+        if pregunta.tipo not in TIPOS:
+            raise ValueError(f"Tipo desconocido {pregunta.tipo!r} en {pregunta.columna!r}")
+        textos = [texto for opcion in pregunta.opciones for texto in (opcion.texto, *opcion.alias)]
+        if len(set(textos)) != len(textos):
+            raise ValueError(f"Opciones repetidas en {pregunta.columna!r}")
+        if pregunta.tipo == "casilla" and pregunta.textos != ["Sí", "No"]:
+            raise ValueError(f"La casilla {pregunta.columna!r} debe tener las opciones 'Sí' y 'No'")
+        for texto in pregunta.predeterminada:
+            pregunta.indice(texto)
+        if pregunta.componente is None:
+            continue
+        if pregunta.componente not in COMPONENTES:
+            raise ValueError(f"Componente desconocido {pregunta.componente!r} en {pregunta.columna!r}")
+        if any(opcion.puntuacion is None for opcion in pregunta.opciones):
+            raise ValueError(f"Opciones sin puntuación en {pregunta.columna!r}")
+
+    for componente in COMPONENTES:
+        posiciones = sorted(pregunta.posicion for pregunta in preguntas if pregunta.componente == componente)
+        if posiciones != list(range(1, len(posiciones) + 1)):
+            raise ValueError(f"Las posiciones del componente {componente!r} deben ser 1..{len(posiciones)}")
+
+
+validar_cuestionario()
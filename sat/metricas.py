@@ -0,0 +1,234 @@
+"""
+Tiempos por etapa y contadores del proceso, exportados como registros estructurados y en el formato de texto
+de Prometheus.
+
+Cada etapa de un envío (lectura de la hoja, validación, escritura, carga de modelos, codificación y
+predicción) se mide con `metricas.medir`, que acumula la duración en un histograma por etapa y, si el
+registro "sat.metricas" está activo en nivel INFO, escribe una línea JSON por medición. Los contadores
+(lecturas y escrituras remotas, filas clasificadas...) se incrementan con `metricas.contar`, y los indicadores
+de estado (como el número de envíos en cola) se actualizan con `metricas.fijar`.
+
+Uso:
+    from sat.metricas import metricas
+
+    with metricas.medir("lectura_hoja"):
+        ...
+
+    @metricas.medir("validar_entrada")
+    def validar_entrada(...):
+        ...
+
+    metricas.contar("escrituras_hoja")
+    metricas.prometheus()            # texto para un endpoint /metrics
+    metricas.escribir("sat.prom")    # el mismo texto en un archivo (p. ej. para node_exporter)
+    metricas.iniciar_escritura("sat.prom", intervalo=15)  # ... reescrito periódicamente
+    metricas.iniciar_servidor(9100)  # endpoint HTTP /metrics en un hilo de fondo
+"""
+
+import bisect
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Límites superiores (en segundos) de los intervalos de los histogramas de duración
+LIMITES = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+# Prefijo de los nombres de las métricas exportadas
+PREFIJO = "sat"
+
+_log = logging.getLogger("sat.metricas")
+
+
+def _etiquetas(etiquetas):
+    # Clave hashable y ordenada de un diccionario de etiquetas
+    return tuple(sorted((nombre, str(valor)) for nombre, valor in etiquetas.items()))
+
+
+def _formato_etiquetas(etiquetas, extra=()):
+    pares = list(etiquetas) + list(extra)
+    if not pares:
+        return ""
+    escapar = lambda valor: valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{nombre}="{escapar(valor)}"' for nombre, valor in pares) + "}"
+
+
+def _formato_limite(limite):
+    return "+Inf" if limite == math.inf else repr(limite)
+
+
+class Metricas:
+    """Histogramas de duración por etapa y contadores, seguros entre hilos."""
+
+    def __init__(self, limites=LIMITES, prefijo=PREFIJO):
+        self.limites = tuple(limites)
+        self.prefijo = prefijo
+        self._histogramas = {}  # (etapa, etiquetas) -> [conteos por intervalo, suma, cantidad]
+        self._contadores = {}  # (nombre, etiquetas) -> valor
+        self._indicadores = {}  # (nombre, etiquetas) -> último valor
+        self._lock = threading.Lock()
+
+    def observar(self, etapa, segundos, **etiquetas):
+        """Registra una duración de `etapa`."""
+        clave = (etapa, _etiquetas(etiquetas))
+        intervalo = bisect.bisect_left(self.limites, segundos)
+        with self._lock:
+            histograma = self._histogramas.get(clave)
+            if histograma is None:
+                histograma = self._histogramas[clave] = [[0] * len(self.limites), 0.0, 0]
+            histograma[0][intervalo] += 1
+            histograma[1] += segundos
+            histograma[2] += 1
+
+    def contar(self, nombre, cantidad=1, **etiquetas):
+        """Incrementa el contador `nombre`."""
+        clave = (nombre, _etiquetas(etiquetas))
+        with self._lock:
+            self._contadores[clave] = self._contadores.get(clave, 0) + cantidad
+
+    def fijar(self, nombre, valor, **etiquetas):
+        """Fija el valor actual del indicador `nombre` (por ejemplo, el tamaño de una cola)."""
+        with self._lock:
+            self._indicadores[(nombre, _etiquetas(etiquetas))] = valor
+
+    @contextmanager
+    def medir(self, etapa, **etiquetas):
+        """
+        Mide la duración del bloque (o de la función decorada) como una observación de `etapa`.
+        Si el bloque lanza una excepción, la duración se registra con la etiqueta error="si".
+        """
+        inicio = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            segundos = time.perf_counter() - inicio
+            if error:
+                etiquetas = {**etiquetas, "error": "si"}
+            self.observar(etapa, segundos, **etiquetas)
+            if _log.isEnabledFor(logging.INFO):
+                _log.info(json.dumps({"evento": "etapa", "etapa": etapa, "segundos": round(segundos, 6),
+                                      "momento": round(time.time(), 3), **etiquetas}, ensure_ascii=False))
+
+    def resumen(self):
+        """Diccionario con la cantidad, el total y el promedio de cada etapa, y el valor de cada contador e indicador."""
+        with self._lock:
+            etapas = [
+                {"etapa": etapa, **dict(etiquetas), "cantidad": cantidad, "segundos": suma,
+                 "promedio_ms": 1000 * suma / cantidad}
+                for (etapa, etiquetas), (_, suma, cantidad) in self._histogramas.items()
+            ]
+            contadores = [{"contador": nombre, **dict(etiquetas), "valor": valor}
+                          for (nombre, etiquetas), valor in self._contadores.items()]
+            indicadores = [{"indicador": nombre, **dict(etiquetas), "valor": valor}
+                           for (nombre, etiquetas), valor in self._indicadores.items()]
+        return {"etapas": etapas, "contadores": contadores, "indicadores": indicadores}
+
+    def prometheus(self):
+        """Todas las métricas en el formato de texto de Prometheus (versión 0.0.4)."""
+        with self._lock:
+            histogramas = sorted((clave, (list(conteos), suma, cantidad))
+                                 for clave, (conteos, suma, cantidad) in self._histogramas.items())
+            contadores = sorted(self._contadores.items())
+            indicadores = sorted(self._indicadores.items())
+
+        nombre = f"{self.prefijo}_etapa_segundos"
+        lineas = [f"# HELP {nombre} Duración de cada etapa del cálculo y del envío de respuestas.",
+                  f"# TYPE {nombre} histogram"]
+        for (etapa, etiquetas), (conteos, suma, cantidad) in histogramas:
+            etiquetas = (("etapa", etapa),) + etiquetas
+            acumulado = 0
+            for limite, conteo in zip(self.limites, conteos):
+                acumulado += conteo
+                lineas.append(f"{nombre}_bucket{_formato_etiquetas(etiquetas, [('le', _formato_limite(limite))])} {acumulado}")
+            lineas.append(f"{nombre}_sum{_formato_etiquetas(etiquetas)} {suma!r}")
+            lineas.append(f"{nombre}_count{_formato_etiquetas(etiquetas)} {cantidad}")
+
+        anterior = None
+        for (contador, etiquetas), valor in contadores:
+            nombre = f"{self.prefijo}_{contador}_total"
+            if contador != anterior:
+                lineas.append(f"# TYPE {nombre} counter")
+                anterior = contador
+            lineas.append(f"{nombre}{_formato_etiquetas(etiquetas)} {valor}")
+
+        anterior = None
+        for (indicador, etiquetas), valor in indicadores:
+            nombre = f"{self.prefijo}_{indicador}"
+            if indicador != anterior:
+                lineas.append(f"# TYPE {nombre} gauge")
+                anterior = indicador
+            lineas.append(f"{nombre}{_formato_etiquetas(etiquetas)} {valor}")
+        return "\n".join(lineas) + "\n"
+
+    def escribir(self, ruta):
+        """Escribe `prometheus()` en `ruta`, reemplazando el archivo de forma atómica."""
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.prometheus())
+        os.replace(temporal, ruta)
+
+    def iniciar_escritura(self, ruta, intervalo=15.0):
+        """Escribe `prometheus()` en `ruta` cada `intervalo` segundos desde un hilo de fondo."""
+        def escribir_periodicamente():
+            while True:
+                self.escribir(ruta)
+                time.sleep(intervalo)
+
+        threading.Thread(target=escribir_periodicamente, name="sat-metricas-archivo", daemon=True).start()
+
+    def iniciar_servidor(self, puerto, direccion=""):
+        """
+        Sirve `prometheus()` en http://direccion:puerto/metrics desde un hilo de fondo.
+        Retorna el servidor (su método `shutdown` lo detiene).
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metricas = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                cuerpo = metricas.prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+
+            def log_message(self, formato, *argumentos):
+                pass
+
+        servidor = ThreadingHTTPServer((direccion, puerto), Manejador)
+        threading.Thread(target=servidor.serve_forever, name="sat-metricas", daemon=True).start()
+        return servidor
+
+    def reiniciar(self):
+        """Descarta todas las mediciones y contadores."""
+        with self._lock:
+            self._histogramas.clear()
+            self._contadores.clear()
+            self._indicadores.clear()
+
+
+def activar_registros(flujo=None, nivel=logging.INFO):
+    """Escribe los registros estructurados de "sat.metricas" (una línea JSON por medición) en `flujo`."""
+    if not any(getattr(manejador, "_sat_metricas", False) for manejador in _log.handlers):
+        manejador = logging.StreamHandler(flujo or sys.stderr)
+        manejador.setFormatter(logging.Formatter("%(message)s"))
+        manejador._sat_metricas = True
+        _log.addHandler(manejador)
+    _log.setLevel(nivel)
+
+
+# Instancia única por proceso, compartida por todas las sesiones del servidor (como sat.modelos.registro)
+metricas = Metricas()
@@ -0,0 +1,263 @@
+"""
+Registro de modelos de clasificación compartido por todas las sesiones del servidor.
+
+Los cuatro RandomForest (proyecto, familiar, económico y psicosocial) se cargan una sola vez por
+proceso. Cada consulta verifica, como máximo cada `intervalo_verificacion` segundos, si el archivo
+.pkl cambió en disco (fecha y tamaño); si cambió, se recalcula su suma SHA-256 y el modelo se recarga
+solo cuando el contenido es realmente distinto.
+
+El bosque compilado (`obtener_compilado`) se abre, si existe, desde el directorio de modelos compactos
+(`sat.arboles.abrir_compacto`, con mapeo de memoria) cuando su manifiesto corresponde a la suma SHA-256
+del .pkl actual; así la clasificación en línea no deserializa el .pkl. Si el artefacto no existe, es de
+otra versión o no es válido, el bosque se compila a partir del modelo de sklearn. La variable de entorno
+SAT_MODELOS_COMPACTOS cambia el directorio (por ejemplo, al de los bosques de `sat.compresion`).
+
+Un artefacto comprimido (`comprimido` en su manifiesto) se acepta igual cuando su suma de origen coincide, pero
+no es el mismo modelo que el .pkl: `version_compilado` lo identifica por la huella de sus arreglos, y no por la
+suma del .pkl, para que el caché de predicciones no mezcle sus clases con las del bosque exacto, y
+`comprimido` permite a `sat.puntaje` clasificar también los lotes grandes con él.
+
+Uso:
+    from sat.modelos import registro
+    modelo = registro.obtener("psico")
+    registro.metricas()  # tiempos de carga, memoria estimada, número de recargas...
+"""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sat.metricas import metricas
+
+# Directorio raíz del repositorio, donde se encuentran los archivos .pkl
+RUTA_BASE = Path(__file__).resolve().parent.parent
+
+# Archivos de los modelos previamente entrenados para cada componente de riesgo
+ARCHIVOS_MODELOS = {
+    "proyecto": "modelo_proyecto.pkl",
+    "familiar": "modelo_familiar.pkl",
+    "economica": "modelo_economica.pkl",
+    "psico": "modelo_psico.pkl",
+}
+
+# Directorio (junto a los .pkl) con un subdirectorio por modelo en formato compacto (`sat.arboles`)
+DIRECTORIO_COMPACTOS = "modelos_compactos"
+
+
+def calcular_checksum(ruta, tamano_bloque=1 << 20):
+    """Suma SHA-256 del archivo en `ruta`, leído por bloques."""
+    sha = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(tamano_bloque), b""):
+            sha.update(bloque)
+    return sha.hexdigest()
+
+
+def estimar_memoria(modelo):
+    """
+    Estima los bytes que ocupan en memoria los arreglos de nodos de un ensamble de árboles.
+    Para modelos que no son ensambles de árboles de sklearn retorna None.
+    """
+    estimadores = getattr(modelo, "estimators_", None)
+    if estimadores is None:
+        return None
+    total = 0
+    for estimador in estimadores:
+        arbol = getattr(estimador, "tree_", None)
+        if arbol is None:
+            return None
+        estado = arbol.__getstate__()
+        total += estado["nodes"].nbytes + estado["values"].nbytes
+    return total
+
+
+@dataclass
+class EntradaModelo:
+    nombre: str
+    ruta: Path
+    modelo: object = None
+    compilado: object = None  # BosqueCompilado de la versión vigente, abierto o construido al primer uso
+    origen_compilado: str = None  # "compacto" o "sklearn"
+    version_compilado: str = None  # suma del .pkl si el bosque compilado es exacto; huella si es comprimido
+    checksum: str = None
+    firma: tuple = None  # (mtime_ns, tamaño) del archivo cuando se cargó
+    cargado_en: float = None
+    segundos_carga: float = 0.0
+    bytes_archivo: int = 0
+    bytes_memoria: int = None
+    cargas: int = 0
+    consultas: int = 0
+    ultima_verificacion: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class RegistroModelos:
+    """Carga perezosa y recarga en caliente de los modelos, segura entre hilos."""
+
+    def __init__(self, ruta_base=RUTA_BASE, archivos=ARCHIVOS_MODELOS, intervalo_verificacion=2.0,
+                 directorio_compactos=None):
+        self.intervalo_verificacion = intervalo_verificacion
+        # SAT_MODELOS_COMPACTOS permite usar otro directorio, por ejemplo el de `python -m sat.compresion`
+        directorio_compactos = directorio_compactos or os.environ.get("SAT_MODELOS_COMPACTOS")
+        self.directorio_compactos = Path(directorio_compactos or Path(ruta_base) / DIRECTORIO_COMPACTOS)
+        self._entradas = {
+            nombre: EntradaModelo(nombre, Path(ruta_base) / archivo) for nombre, archivo in archivos.items()
+        }
+
+    def nombres(self):
+        return list(self._entradas)
+
+    def _entrada(self, nombre):
+        try:
+            return self._entradas[nombre]
+        except KeyError:
+            raise KeyError(f"Modelo desconocido: {nombre!r}. Opciones: {', '.join(self._entradas)}") from None
+
+    def _vigente(self, entrada):
+        # Verifica el archivo como máximo cada `intervalo_verificacion` segundos
+        ahora = time.monotonic()
+        if entrada.checksum is None or ahora - entrada.ultima_verificacion >= self.intervalo_verificacion:
+            with entrada.lock:
+                if entrada.checksum is None or ahora - entrada.ultima_verificacion >= self.intervalo_verificacion:
+                    self._verificar(entrada)
+                    entrada.ultima_verificacion = time.monotonic()
+
+    def obtener(self, nombre):
+        """Retorna el modelo `nombre`, cargándolo o recargándolo si el archivo cambió."""
+        entrada = self._entrada(nombre)
+        self._vigente(entrada)
+        modelo = entrada.modelo
+        if modelo is None:
+            with entrada.lock:
+                if entrada.modelo is None:
+                    self._cargar(entrada)
+                modelo = entrada.modelo
+        entrada.consultas += 1
+        return modelo
+
+    def obtener_compilado(self, nombre):
+        """
+        Retorna el modelo `nombre` compilado en arreglos planos (`sat.arboles.BosqueCompilado`): el artefacto
+        compacto si corresponde al .pkl actual o, si no, el modelo de sklearn compilado. Se abre o se compila una
+        sola vez por versión del archivo .pkl.
+        """
+        entrada = self._entrada(nombre)
+        self._vigente(entrada)
+        compilado = entrada.compilado
+        if compilado is None:
+            with entrada.lock:
+                if entrada.compilado is None:
+                    entrada.compilado, entrada.origen_compilado, entrada.version_compilado = self._compilar(entrada)
+                compilado = entrada.compilado
+        return compilado
+
+    def version_compilado(self, nombre):
+        """
+        Identidad del bosque compilado vigente de `nombre`: la suma SHA-256 del .pkl si reproduce exactamente sus
+        predicciones, o "comprimido:<huella de los arreglos>" si es un bosque de `sat.compresion`.
+        """
+        entrada = self._entrada(nombre)
+        self.obtener_compilado(nombre)
+        return entrada.version_compilado
+
+    def comprimido(self, nombre):
+        """True si el bosque compilado vigente de `nombre` es un bosque comprimido."""
+        return self.obtener_compilado(nombre).comprimido
+
+    def _compilar(self, entrada):
+        from sat.arboles import abrir_compacto, compilar_bosque
+
+        directorio = self.directorio_compactos / entrada.nombre
+        if (directorio / "manifiesto.json").exists():
+            try:
+                with metricas.medir("apertura_compacto", modelo=entrada.nombre):
+                    bosque, manifiesto = abrir_compacto(directorio)
+            except (OSError, ValueError, KeyError):
+                metricas.contar("errores_compacto", modelo=entrada.nombre)
+            else:
+                if manifiesto["checksum_origen"] == entrada.checksum:
+                    if manifiesto["comprimido"]:
+                        return bosque, "compacto", f"comprimido:{manifiesto['huella']}"
+                    return bosque, "compacto", entrada.checksum
+                # El artefacto se generó con otra versión del .pkl
+                metricas.contar("compactos_desactualizados", modelo=entrada.nombre)
+        if entrada.modelo is None:
+            self._cargar(entrada)
+        with metricas.medir("compilacion_modelo", modelo=entrada.nombre):
+            return compilar_bosque(entrada.modelo), "sklearn", entrada.checksum
+
+    def obtener_todos(self):
+        """Retorna los cuatro modelos en el orden proyecto, familiar, económico y psicosocial."""
+        return tuple(self.obtener(nombre) for nombre in self._entradas)
+
+    def checksum(self, nombre):
+        """Suma SHA-256 del artefacto vigente para `nombre` (sin cargar el modelo)."""
+        entrada = self._entrada(nombre)
+        self._vigente(entrada)
+        return entrada.checksum
+
+    def _verificar(self, entrada):
+        stat = os.stat(entrada.ruta)
+        firma = (stat.st_mtime_ns, stat.st_size)
+        if entrada.checksum is not None and firma == entrada.firma:
+            return
+        checksum = calcular_checksum(entrada.ruta)
+        entrada.firma = firma
+        if checksum == entrada.checksum:
+            # El archivo fue tocado pero su contenido no cambió
+            return
+        # Contenido nuevo: el modelo y el bosque compilado de la versión anterior se descartan y se vuelven a
+        # cargar con la siguiente consulta
+        entrada.checksum = checksum
+        if entrada.modelo is not None:
+            self._cargar(entrada)
+        entrada.compilado = entrada.origen_compilado = entrada.version_compilado = None
+
+    def _cargar(self, entrada):
+        # joblib (y sklearn, al deserializar) se importan con la primera carga y no al importar el módulo
+        import joblib
+
+        inicio = time.perf_counter()
+        with metricas.medir("carga_modelo", modelo=entrada.nombre):
+            modelo = joblib.load(entrada.ruta)
+        entrada.segundos_carga = time.perf_counter() - inicio
+        entrada.modelo = modelo
+        entrada.cargado_en = time.time()
+        entrada.bytes_archivo = entrada.firma[1]
+        entrada.bytes_memoria = estimar_memoria(modelo)
+        entrada.cargas += 1
+
+    def recargar(self, nombre=None):
+        """Fuerza la verificación inmediata de uno o de todos los modelos."""
+        for entrada in ([self._entradas[nombre]] if nombre else self._entradas.values()):
+            with entrada.lock:
+                self._verificar(entrada)
+                entrada.ultima_verificacion = time.monotonic()
+
+    def metricas(self):
+        """Diccionario con métricas de carga y memoria por modelo."""
+        return {
+            nombre: {
+                "archivo": entrada.ruta.name,
+                "cargado": entrada.modelo is not None,
+                "compilado": entrada.origen_compilado,
+                "comprimido": entrada.compilado is not None and entrada.compilado.comprimido,
+                "checksum": entrada.checksum,
+                "cargado_en": entrada.cargado_en,
+                "segundos_carga": entrada.segundos_carga,
+                "bytes_archivo": entrada.bytes_archivo,
+                "bytes_memoria": entrada.bytes_memoria,
+                "cargas": entrada.cargas,
+                "recargas": max(entrada.cargas - 1, 0),
+                "consultas": entrada.consultas,
+            }
+            for nombre, entrada in self._entradas.items()
+        }
+
+
+# Registro único por proceso: Streamlit conserva los módulos importados entre ejecuciones del script,
+# por lo que todas las sesiones comparten esta instancia.
+registro = RegistroModelos()
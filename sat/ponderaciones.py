@@ -0,0 +1,38 @@
+"""
+Tabla de ponderaciones del cuestionario SAT, derivada una sola vez al importar del esquema `sat.cuestionario`.
+
+    - PREGUNTAS[componente]: tupla ordenada (por posición) con las preguntas de cada componente.
+    - PUNTUACIONES[componente][pregunta]: diccionario respuesta -> puntuación, para mapear en O(1). Incluye
+      el texto de cada opción y sus alias, de modo que las exportaciones anteriores se puntúan igual.
+"""
+
+from sat.cuestionario import (
+    COMPONENTE_ECONOMICO,
+    COMPONENTE_FAMILIAR,
+    COMPONENTE_PROYECTO,
+    COMPONENTE_PSICOSOCIAL,
+    COMPONENTES,
+    PREGUNTAS_CUESTIONARIO,
+)
+
+
+def compilar_ponderaciones(preguntas_cuestionario=PREGUNTAS_CUESTIONARIO):
+    """
+    Construye las tablas de ponderaciones por componente a partir de las preguntas del esquema.
+
+    Retorna (preguntas, puntuaciones), donde preguntas[componente] es la tupla de preguntas en el orden de
+    su posición y puntuaciones[componente][pregunta] es un diccionario {respuesta: puntuación}.
+    """
+    puntuadas = sorted((pregunta for pregunta in preguntas_cuestionario if pregunta.componente is not None),
+                       key=lambda pregunta: pregunta.posicion)
+    preguntas = {componente: [] for componente in COMPONENTES}
+    puntuaciones = {componente: {} for componente in COMPONENTES}
+    for pregunta in puntuadas:
+        preguntas[pregunta.componente].append(pregunta.columna)
+        puntuaciones[pregunta.componente][pregunta.columna] = {
+            texto: opcion.puntuacion for opcion in pregunta.opciones for texto in (opcion.texto, *opcion.alias)
+        }
+    return {componente: tuple(lista) for componente, lista in preguntas.items()}, puntuaciones
+
+
+PREGUNTAS, PUNTUACIONES = compilar_ponderaciones()
@@ -0,0 +1,323 @@
+"""
+Asignación de los niveles de riesgo SAT a partir de las respuestas del formulario.
+
+Las respuestas se convierten en puntuaciones con las tablas de `sat.ponderaciones` (compiladas una sola vez
+al importar) y se clasifican con los modelos del registro compartido `sat.modelos.registro`. Los lotes pequeños
+usan los modelos compilados en arreglos planos (`sat.arboles`), para no pagar la validación de sklearn en cada
+llamada, y pasan por el caché de predicciones (`sat.cache_predicciones`), de modo que una fila codificada
+repetida no recorre el bosque; los grandes, el modelo de sklearn, salvo que el bosque en uso sea comprimido
+(`sat.compresion`), en cuyo caso todos los lotes usan ese bosque y las etiquetas no dependen del tamaño del
+lote. Los componentes con una tabla precalculada
+vigente (`sat.tablas_riesgo`) se clasifican con un acceso a esa tabla.
+
+`clasificar_lote` procesa cualquier número de filas de texto (como las de la hoja o sus exportaciones) a la vez:
+codifica cada componente con búsquedas sobre arreglos y llama a `predict` una sola vez por modelo.
+`clasificar_respuestas` hace lo mismo con los índices de opción que entregan los widgets de la aplicación,
+indexando directamente los arreglos de puntuaciones del esquema `sat.cuestionario`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from sat.cache_predicciones import predicciones
+from sat.cuestionario import PREGUNTAS_CUESTIONARIO
+from sat.metricas import metricas
+from sat.modelos import registro
+from sat.tablas_riesgo import tablas
+from sat.ponderaciones import (
+    COMPONENTE_ECONOMICO,
+    COMPONENTE_FAMILIAR,
+    COMPONENTE_PROYECTO,
+    COMPONENTE_PSICOSOCIAL,
+    PREGUNTAS,
+    PUNTUACIONES,
+)
+
+# Activa una opción para que Pandas emita advertencias sobre cambios de tipo de datos
+pd.set_option('future.no_silent_downcasting', True)
+
+# Pregunta de selección múltiple del componente familiar
+PREGUNTA_SITUACIONES = "¿Actualmente en su familia se presentan algunas de las siguientes situaciones?"
+
+# Preguntas específicas de cada componente usadas por los modelos para la clasificación final
+selected_questions_proyecto = ["Pregunta1", "Pregunta7", "Pregunta17", "Pregunta9"]
+selected_questions_economico = ['Pregunta6', 'Pregunta7', 'Pregunta5', 'Pregunta1']
+selected_questions_psico = ['Pregunta38', 'Pregunta21', 'Pregunta25', 'Pregunta15', 'Pregunta43', 'Pregunta50', 'Pregunta26',
+                            'Pregunta35', 'Pregunta6', 'Pregunta52', 'Pregunta7', 'Pregunta3', 'Pregunta8', 'Pregunta4']
+selected_questions_familiar = ['Pregunta20', 'Pregunta4', 'Pregunta3', 'Pregunta11', 'Pregunta19', 'Pregunta5', 'Pregunta9']
+
+# Mapear predicciones numéricas a etiquetas de riesgo
+mapa_etiquetas = {0: 'BAJO', 1: 'MEDIO', 2: 'ALTO'}
+
+
+# Componentes en el orden en que Asignacion_SAT retorna sus resultados:
+# (nombre del modelo en el registro, columna del resultado por lotes)
+COMPONENTES = (
+    ("proyecto", "Riesgo Académico"),
+    ("familiar", "Riesgo Familiar"),
+    ("economica", "Riesgo Económico"),
+    ("psico", "Riesgo Psicosocial"),
+)
+COLUMNAS_RIESGO = [columna for _, columna in COMPONENTES]
+
+# Por modelo: componente de la tabla de ponderaciones y preguntas que recibe el modelo
+COMPONENTES_PONDERACION = {
+    "proyecto": COMPONENTE_PROYECTO,
+    "familiar": COMPONENTE_FAMILIAR,
+    "economica": COMPONENTE_ECONOMICO,
+    "psico": COMPONENTE_PSICOSOCIAL,
+}
+PREGUNTAS_SELECCIONADAS = {
+    "proyecto": selected_questions_proyecto,
+    "familiar": selected_questions_familiar,
+    "economica": selected_questions_economico,
+    "psico": selected_questions_psico,
+}
+
+# Etiquetas indexables directamente con la clase predicha (0, 1, 2)
+ETIQUETAS = np.array([mapa_etiquetas[clase] for clase in sorted(mapa_etiquetas)], dtype=object)
+
+
+def _compilar_tablas():
+    # Para cada pregunta: índice de respuestas (búsqueda vectorizada por hash) y arreglo de puntuaciones alineado
+    return {
+        componente: {
+            pregunta: (pd.Index(list(tabla)), np.array(list(tabla.values()), dtype=float))
+            for pregunta, tabla in tablas.items()
+        }
+        for componente, tablas in PUNTUACIONES.items()
+    }
+
+
+TABLAS = _compilar_tablas()
+
+
+def puntuar_columna(valores, componente, pregunta):
+    """
+    Convierte un arreglo de respuestas de `pregunta` en un arreglo float de puntuaciones.
+
+    Igual que el reemplazo original, las respuestas sin ponderación que son numéricas se conservan como número;
+    las demás (texto desconocido, vacíos) quedan como NaN.
+    """
+    indice, puntuaciones = TABLAS[componente][pregunta]
+    codigos = indice.get_indexer(valores)
+    resultado = puntuaciones[codigos]
+    faltantes = codigos < 0
+    if faltantes.any():
+        resultado[faltantes] = pd.to_numeric(pd.Series(valores[faltantes]), errors="coerce").to_numpy(dtype=float)
+    return resultado
+
+
+# Número de columnas en que se expande la pregunta de selección múltiple
+COLUMNAS_SITUACIONES = 9
+
+
+def _codificar_celda_situaciones(texto):
+    # Las primeras 9 opciones de la celda, en orden: 0 si la posición está vacía, la puntuación de la opción
+    # ("Ninguna" = 1, las demás situaciones = 5) y 5 para cualquier otro texto
+    puntuaciones = PUNTUACIONES[COMPONENTE_FAMILIAR][PREGUNTA_SITUACIONES]
+    fila = np.zeros(COLUMNAS_SITUACIONES)
+    for j, opcion in enumerate(texto.split(",")[:COLUMNAS_SITUACIONES]):
+        opcion = opcion.strip()
+        if opcion:
+            fila[j] = puntuaciones.get(opcion, 5)
+    return fila
+
+
+def codificar_situaciones(valores):
+    """
+    Expande las respuestas de la pregunta de selección múltiple (texto con las opciones separadas por comas)
+    en una matriz (N, 9).
+
+    Cada combinación distinta de opciones se codifica una sola vez y el resultado se reparte a todas las filas
+    con un solo acceso por índice, en lugar de dividir y mapear cada celda por separado.
+    """
+    codigos, celdas = pd.factorize(pd.Series(valores, dtype=object).astype(str))
+    tabla = np.array([_codificar_celda_situaciones(celda) for celda in celdas]).reshape(-1, COLUMNAS_SITUACIONES)
+    return tabla[codigos]
+
+
+def _indices(selected_questions):
+    # "PreguntaN" -> posición N-1 en la matriz del componente
+    return [int(nombre.removeprefix("Pregunta")) - 1 for nombre in selected_questions]
+
+
+def _resolver_variables():
+    # Para cada modelo y cada variable seleccionada: (pregunta de origen, opción). La opción es None salvo en las
+    # columnas que resultan de expandir la pregunta de selección múltiple, que siguen a las demás preguntas
+    # del componente familiar
+    variables = {}
+    for nombre, seleccionadas in PREGUNTAS_SELECCIONADAS.items():
+        preguntas = [pregunta for pregunta in PREGUNTAS[COMPONENTES_PONDERACION[nombre]]
+                     if pregunta != PREGUNTA_SITUACIONES]
+        variables[nombre] = [
+            (preguntas[indice], None) if indice < len(preguntas) else (PREGUNTA_SITUACIONES, indice - len(preguntas))
+            for indice in _indices(seleccionadas)
+        ]
+    return variables
+
+
+# Resueltas una sola vez: solo estas columnas se codifican, en lugar de todas las preguntas de cada componente
+VARIABLES = _resolver_variables()
+
+
+@metricas.medir("codificacion", entrada="texto")
+def codificar_lote(X):
+    """
+    Codifica en un solo paso las respuestas de un DataFrame de N filas con columnas de la hoja "Datos".
+
+    Retorna una tupla de matrices float (N, n_variables) con las preguntas seleccionadas de cada componente,
+    en el orden proyecto, familiar, económico y psicosocial. Solo se leen y puntúan las columnas de `VARIABLES`.
+    """
+    situaciones = codificar_situaciones(X[PREGUNTA_SITUACIONES].to_numpy())
+    matrices = []
+    for nombre, _ in COMPONENTES:
+        componente = COMPONENTES_PONDERACION[nombre]
+        matriz = np.empty((len(X), len(VARIABLES[nombre])))
+        for j, (pregunta, opcion) in enumerate(VARIABLES[nombre]):
+            if opcion is not None:
+                matriz[:, j] = situaciones[:, opcion]
+                continue
+            valores = X[pregunta]
+            if componente == COMPONENTE_FAMILIAR:
+                # Componente "Familiar": todas las respuestas se tratan como texto
+                valores = valores.astype(str)
+            matriz[:, j] = puntuar_columna(valores.to_numpy(), componente, pregunta)
+        matrices.append(matriz)
+    return tuple(matrices)
+
+
+def _compilar_codificacion():
+    # Para cada modelo y cada variable seleccionada: posición de su pregunta en PREGUNTAS_CUESTIONARIO, arreglo
+    # de puntuaciones indexable con el índice de la opción elegida y opción (ver VARIABLES)
+    posicion_columna = {pregunta.columna: i for i, pregunta in enumerate(PREGUNTAS_CUESTIONARIO)}
+    codificacion = {}
+    for nombre, variables in VARIABLES.items():
+        codificacion[nombre] = [
+            (posicion_columna[pregunta],
+             np.array([opcion.puntuacion for opcion in PREGUNTAS_CUESTIONARIO[posicion_columna[pregunta]].opciones],
+                      dtype=float),
+             opcion)
+            for pregunta, opcion in variables
+        ]
+    situaciones = PREGUNTAS_CUESTIONARIO[posicion_columna[PREGUNTA_SITUACIONES]]
+    puntuaciones_situaciones = np.array([opcion.puntuacion for opcion in situaciones.opciones], dtype=float)
+    return codificacion, posicion_columna[PREGUNTA_SITUACIONES], puntuaciones_situaciones
+
+
+CODIFICACION, POSICION_SITUACIONES, PUNTUACIONES_SITUACIONES = _compilar_codificacion()
+
+
+@metricas.medir("codificacion", entrada="indices")
+def codificar_respuestas(respuestas):
+    """
+    Codifica respuestas dadas como índices de opción, sin comparar textos.
+
+    `respuestas` es una lista de filas; cada fila está alineada con `sat.cuestionario.PREGUNTAS_CUESTIONARIO`
+    y contiene el índice de la opción elegida (la lista de índices en la selección múltiple). Retorna las
+    mismas matrices que `codificar_lote`.
+    """
+    # Selección múltiple: las primeras 9 opciones elegidas, en orden, con su puntuación (0 si no hay opción)
+    situaciones = np.zeros((len(respuestas), COLUMNAS_SITUACIONES))
+    for fila, respuesta in zip(situaciones, respuestas):
+        elegidas = list(respuesta[POSICION_SITUACIONES])[:COLUMNAS_SITUACIONES]
+        fila[:len(elegidas)] = PUNTUACIONES_SITUACIONES[elegidas]
+
+    matrices = []
+    for nombre, _ in COMPONENTES:
+        matriz = np.empty((len(respuestas), len(CODIFICACION[nombre])))
+        for j, (posicion, puntuaciones, opcion) in enumerate(CODIFICACION[nombre]):
+            if opcion is None:
+                matriz[:, j] = puntuaciones[[fila[posicion] for fila in respuestas]]
+            else:
+                matriz[:, j] = situaciones[:, opcion]
+        matrices.append(matriz)
+    return tuple(matrices)
+
+
+def df_numeric(X):
+    """Retorna las preguntas seleccionadas de cada componente (proyecto, familiar, económico, psicosocial) ya puntuadas."""
+    columnas = (selected_questions_proyecto, selected_questions_familiar,
+                selected_questions_economico, selected_questions_psico)
+    return tuple(pd.DataFrame(matriz, columns=nombres, index=X.index)
+                 for matriz, nombres in zip(codificar_lote(X), columnas))
+
+
+# Hasta este número de filas el bosque compilado es más rápido que sklearn; en lotes más grandes gana el
+# recorrido en C de sklearn (ver benchmarks/suite.py)
+MAXIMO_FILAS_COMPILADO = 256
+
+
+def _predecir_bosque(nombre, matriz):
+    compilado = registro.obtener_compilado(nombre)
+    if len(matriz) <= MAXIMO_FILAS_COMPILADO:
+        # Lotes pequeños (los envíos de la aplicación): las filas repetidas se toman del caché de predicciones
+        metricas.contar("filas_clasificadas", len(matriz), modelo=nombre, via="compilado")
+        return predicciones.predecir(nombre, matriz, registro.version_compilado(nombre), compilado.predict)
+    if compilado.comprimido:
+        # Con un bosque comprimido (sat.compresion) en uso, los lotes grandes también se clasifican con él: si
+        # pasaran a sklearn, una misma respuesta podría recibir otra etiqueta en una exportación que en línea
+        metricas.contar("filas_clasificadas", len(matriz), modelo=nombre, via="comprimido")
+        return compilado.predict(matriz)
+    metricas.contar("filas_clasificadas", len(matriz), modelo=nombre, via="sklearn")
+    modelo = registro.obtener(nombre)
+    return modelo.predict(pd.DataFrame(matriz, columns=modelo.feature_names_in_))
+
+
+def _predecir(nombre, matriz):
+    # Primero la tabla precalculada (sat.tablas_riesgo); el bosque solo para las filas que la tabla no cubre
+    # o si el componente no tiene tabla vigente
+    tabla = tablas.obtener(nombre)
+    if tabla is None:
+        return _predecir_bosque(nombre, matriz)
+    prediccion = tabla.clasificar(matriz)
+    faltantes = prediccion < 0
+    metricas.contar("filas_clasificadas", len(matriz) - int(faltantes.sum()), modelo=nombre, via="tabla")
+    if faltantes.any():
+        prediccion[faltantes] = _predecir_bosque(nombre, matriz[faltantes])
+    return prediccion
+
+
+def _clasificar_matrices(matrices, indice, estricto):
+    resultado = {}
+    for (nombre, columna), matriz in zip(COMPONENTES, matrices):
+        validas = ~np.isnan(matriz).any(axis=1)
+        if estricto and not validas.all():
+            fila = indice[np.argmin(validas)]
+            raise ValueError(f"La fila {fila!r} tiene respuestas sin ponderación en el componente {nombre!r}.")
+
+        etiquetas = np.full(len(indice), None, dtype=object)
+        if validas.any():
+            with metricas.medir("prediccion", modelo=nombre):
+                prediccion = _predecir(nombre, matriz[validas])
+            etiquetas[validas] = ETIQUETAS[prediccion.astype(int)]
+        resultado[columna] = etiquetas
+    return pd.DataFrame(resultado, index=indice)
+
+
+def clasificar_lote(X, estricto=True):
+    """
+    Clasifica el riesgo de todas las filas de `X` (respuestas con las columnas de la hoja "Datos").
+
+    Cada modelo se evalúa una sola vez sobre todo el lote. Retorna un DataFrame con el mismo índice que `X`
+    y las columnas COLUMNAS_RIESGO con las etiquetas BAJO, MEDIO o ALTO.
+
+    Si `estricto` es False, las filas con respuestas sin ponderación en un componente reciben None en ese
+    componente en lugar de provocar un ValueError.
+    """
+    return _clasificar_matrices(codificar_lote(X), X.index, estricto)
+
+
+def clasificar_respuestas(respuestas):
+    """
+    Clasifica respuestas dadas como índices de opción (ver `codificar_respuestas`), como las que entregan
+    los widgets de la aplicación. Retorna un DataFrame con las columnas COLUMNAS_RIESGO, una fila por respuesta.
+    """
+    return _clasificar_matrices(codificar_respuestas(respuestas), pd.RangeIndex(len(respuestas)), estricto=True)
+
+
+# construcción función Asignacion_SAT que asigna puntuaciones de riesgo a cada categoría
+def Asignacion_SAT(X):
+    # Retornar predicciones para cada componente (proyecto, familiar, económico y psicosocial)
+    resultado = clasificar_lote(X)
+    return tuple(resultado[columna].to_numpy() for columna in COLUMNAS_RIESGO)
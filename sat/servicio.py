@@ -0,0 +1,161 @@
+"""
+Servicio de clasificación en micro-lotes compartido por todas las sesiones del servidor.
+
+Cuando muchas sesiones envían a la vez, cada una clasificaría una sola fila con cuatro llamadas a los
+modelos. `ServicioClasificacion` recibe esas solicitudes desde cualquier hilo (`enviar` retorna un
+`concurrent.futures.Future`) y un hilo de fondo las agrupa en lotes de hasta `tamano_maximo` solicitudes,
+esperando como máximo `espera_maxima` segundos desde la primera; cada lote se clasifica con una sola llamada
+a `clasificar_respuestas`, es decir, una predicción por componente para todo el lote.
+
+Por defecto `espera_maxima` es 0: el lote se forma con las solicitudes que llegaron mientras se clasificaba
+el anterior, de modo que una solicitud aislada no espera y bajo carga los lotes crecen solos
+(ver benchmarks/microlotes.py).
+
+Si un lote falla (por ejemplo, por una respuesta sin ponderación), sus solicitudes se clasifican una por una
+para que el error llegue solo a la solicitud que lo provocó.
+
+`clasificar` cancela su solicitud si el resultado no llega en `timeout` segundos: las solicitudes canceladas
+antes de que su lote empiece a clasificarse se descartan. `detener` deja de aceptar solicitudes, clasifica
+las que ya estaban en cola y termina el hilo de fondo.
+
+Métricas (`sat.metricas`): etapas `espera_microlote` (desde que llega la solicitud hasta que su lote empieza
+a clasificarse) y `clasificacion_microlote`, y contadores `microlotes` y `solicitudes_microlote`; el tamaño
+medio de lote es su cociente. `estadisticas()` retorna además la distribución de tamaños de lote.
+
+Uso:
+    from sat.servicio import servicio
+    riesgos = servicio.clasificar(indices)    # lista con los cuatro niveles, en el orden de COLUMNAS_RIESGO
+    futuro = servicio.enviar(indices)          # sin bloquear; futuro.result() da la misma lista
+"""
+
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError
+
+from sat.metricas import metricas
+from sat.puntaje import clasificar_respuestas
+
+
+class ServicioClasificacion:
+    """Agrupa las solicitudes de clasificación de varias sesiones en micro-lotes."""
+
+    def __init__(self, tamano_maximo=64, espera_maxima=0.0, clasificar=clasificar_respuestas):
+        self.tamano_maximo = tamano_maximo
+        self.espera_maxima = espera_maxima
+        self._clasificar = clasificar
+        self._solicitudes = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._hilo = None
+        self._detenido = False
+        self.tamanos_lote = Counter()
+
+    def enviar(self, respuesta):
+        """
+        Encola una respuesta (índices de opción alineados con PREGUNTAS_CUESTIONARIO) y retorna un Future
+        con la lista de niveles de riesgo en el orden de COLUMNAS_RIESGO.
+        """
+        futuro = Future()
+        with self._lock:
+            if self._detenido:
+                raise RuntimeError("El servicio de clasificación está detenido.")
+            # El hilo se crea con la primera solicitud, así importar el módulo no inicia hilos
+            if self._hilo is None or not self._hilo.is_alive():
+                self._hilo = threading.Thread(target=self._trabajar, name="sat-microlotes", daemon=True)
+                self._hilo.start()
+            self._solicitudes.put((respuesta, futuro, time.perf_counter()))
+        return futuro
+
+    def clasificar(self, respuesta, timeout=30.0):
+        """
+        Clasifica una respuesta a través del servicio y espera el resultado. Si no llega en `timeout` segundos,
+        cancela la solicitud (si su lote aún no empezó) y lanza `concurrent.futures.TimeoutError`.
+        """
+        futuro = self.enviar(respuesta)
+        try:
+            return futuro.result(timeout)
+        except TimeoutError:
+            futuro.cancel()
+            raise
+
+    def detener(self, timeout=None):
+        """
+        Deja de aceptar solicitudes, espera a que se clasifiquen las que ya estaban en cola y detiene el hilo
+        de fondo. Retorna True si el hilo terminó antes de `timeout` segundos.
+        """
+        with self._lock:
+            self._detenido = True
+            hilo = self._hilo
+            if hilo is not None:
+                self._solicitudes.put(None)  # marca de fin, después de todas las solicitudes aceptadas
+        if hilo is None:
+            return True
+        hilo.join(timeout)
+        return not hilo.is_alive()
+
+    def _tomar_lote(self):
+        # Retorna (lote, fin); fin es True si se llegó a la marca de `detener`
+        lote = []
+        limite = None
+        while len(lote) < self.tamano_maximo:
+            if limite is None:
+                solicitud = self._solicitudes.get()
+                limite = time.perf_counter() + self.espera_maxima
+            else:
+                restante = limite - time.perf_counter()
+                try:
+                    solicitud = (self._solicitudes.get(timeout=restante) if restante > 0
+                                 else self._solicitudes.get_nowait())
+                except queue.Empty:
+                    break
+            if solicitud is None:
+                return lote, True
+            lote.append(solicitud)
+        return lote, False
+
+    def _trabajar(self):
+        while True:
+            lote, fin = self._tomar_lote()
+            # Las solicitudes canceladas (p. ej. por un `clasificar` que agotó su tiempo) no se clasifican
+            lote = [solicitud for solicitud in lote if solicitud[1].set_running_or_notify_cancel()]
+            if lote:
+                self._clasificar_lote(lote)
+            if fin:
+                return
+
+    def _clasificar_lote(self, lote):
+        inicio = time.perf_counter()
+        for _, _, llegada in lote:
+            metricas.observar("espera_microlote", inicio - llegada)
+        metricas.contar("microlotes")
+        metricas.contar("solicitudes_microlote", len(lote))
+        self.tamanos_lote[len(lote)] += 1
+        try:
+            with metricas.medir("clasificacion_microlote"):
+                resultado = self._clasificar([respuesta for respuesta, _, _ in lote])
+        except Exception:
+            # Aislar la solicitud que provocó el error clasificando cada una por separado
+            for respuesta, futuro, _ in lote:
+                try:
+                    futuro.set_result(self._clasificar([respuesta]).iloc[0].tolist())
+                except Exception as error:
+                    futuro.set_exception(error)
+            return
+        for (_, futuro, _), riesgos in zip(lote, resultado.itertuples(index=False)):
+            futuro.set_result(list(riesgos))
+
+    def estadisticas(self):
+        """Número de lotes y de solicitudes, tamaño medio y distribución de tamaños de lote."""
+        lotes = sum(self.tamanos_lote.values())
+        solicitudes = sum(tamano * cantidad for tamano, cantidad in self.tamanos_lote.items())
+        return {
+            "lotes": lotes,
+            "solicitudes": solicitudes,
+            "tamano_medio": solicitudes / lotes if lotes else 0.0,
+            "tamanos": dict(sorted(self.tamanos_lote.items())),
+        }
+
+
+# Servicio único por proceso, compartido por todas las sesiones (como sat.modelos.registro)
+servicio = ServicioClasificacion()
@@ -0,0 +1,83 @@
+"""
+Generador reproducible de respuestas sintéticas del cuestionario SAT.
+
+Las respuestas se eligen al azar entre las opciones reales del esquema `sat.cuestionario`, con las mismas
+restricciones que los widgets de la aplicación (los deslizadores y campos numéricos solo producen sus valores
+enteros y la selección múltiple tiene al menos una opción). Se pueden obtener como índices de opción, como
+los entrega la aplicación, o como filas de 136 columnas de la hoja "Datos".
+
+Uso:
+    from sat.sinteticos import generar_filas
+    df = generar_filas(10000, semilla=1)
+"""
+
+import numpy as np
+import pandas as pd
+
+from sat.cuestionario import PREGUNTAS_CUESTIONARIO
+
+# Documento del primer encuestado sintético; los siguientes son consecutivos
+DOCUMENTO_INICIAL = 1_000_000_000
+
+# Número máximo de situaciones elegidas en la pregunta de selección múltiple
+MAXIMO_SITUACIONES = 4
+
+
+def _opciones_posibles(pregunta):
+    # Índices de las opciones que el widget de la pregunta puede producir
+    if pregunta.tipo in ("deslizador", "numero"):
+        return np.array([pregunta.indice(str(valor)) for valor in pregunta.valores_enteros()])
+    return np.arange(len(pregunta.opciones))
+
+
+def _seleccion_multiple(pregunta, n, rng):
+    # Entre 0 y MAXIMO_SITUACIONES situaciones distintas en orden aleatorio; "Ninguna" si no hay ninguna
+    ninguna = pregunta.indice("Ninguna")
+    situaciones = np.array([i for i in range(len(pregunta.opciones)) if i != ninguna])
+    orden = situaciones[np.argsort(rng.random((n, len(situaciones))), axis=1)]
+    cantidades = rng.integers(0, MAXIMO_SITUACIONES + 1, size=n)
+    return [fila[:cantidad].tolist() if cantidad else [ninguna] for fila, cantidad in zip(orden, cantidades)]
+
+
+def generar_columnas(n, semilla=0):
+    """
+    Genera `n` envíos como índices de opción, por pregunta: una lista alineada con PREGUNTAS_CUESTIONARIO
+    con un arreglo de `n` índices por pregunta (en la selección múltiple, una lista de listas de índices).
+    """
+    rng = np.random.default_rng(semilla)
+    return [
+        _seleccion_multiple(pregunta, n, rng) if pregunta.tipo == "seleccion_multiple"
+        else rng.choice(_opciones_posibles(pregunta), size=n)
+        for pregunta in PREGUNTAS_CUESTIONARIO
+    ]
+
+
+def generar_indices(n, semilla=0):
+    """
+    Genera `n` envíos como índices de opción, como los entrega la aplicación: una lista de filas alineadas
+    con PREGUNTAS_CUESTIONARIO (en la selección múltiple, la lista de índices elegidos).
+    """
+    columnas = [columna if isinstance(columna, list) else columna.tolist() for columna in generar_columnas(n, semilla)]
+    return [list(fila) for fila in zip(*columnas)]
+
+
+def generar_filas(n, semilla=0, documento_inicial=DOCUMENTO_INICIAL):
+    """
+    Genera `n` filas válidas de la hoja "Datos" (nombre, documento y las 134 respuestas) como DataFrame con
+    las columnas `sat.almacenamiento.COLUMNAS_DATOS`, con los mismos valores que guarda la aplicación.
+    Con la misma semilla, las respuestas coinciden con las de `generar_indices`.
+    """
+    from sat.almacenamiento import COLUMNAS_DATOS
+
+    datos = {
+        COLUMNAS_DATOS[0]: [f"Estudiante {i}" for i in range(n)],
+        COLUMNAS_DATOS[1]: np.arange(documento_inicial, documento_inicial + n),
+    }
+    for pregunta, columna in zip(PREGUNTAS_CUESTIONARIO, generar_columnas(n, semilla)):
+        if pregunta.tipo == "seleccion_multiple":
+            datos[pregunta.columna] = [pregunta.valor(indices) for indices in columna]
+        else:
+            # Valor de cada opción calculado una sola vez y repartido por índice
+            valores = np.array([pregunta.valor(i) for i in range(len(pregunta.opciones))], dtype=object)
+            datos[pregunta.columna] = valores[columna]
+    return pd.DataFrame(datos, columns=COLUMNAS_DATOS)
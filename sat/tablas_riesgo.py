@@ -0,0 +1,196 @@
+"""
+Tablas de riesgo precalculadas sobre todo el espacio discreto de respuestas codificadas.
+
+Cada variable que llega a los modelos es una puntuación de la tabla de ponderaciones, con muy pocos valores
+posibles. `construir_tabla` enumera todas las combinaciones de las variables de un componente, las clasifica
+con el bosque y guarda la clase resultante en un arreglo denso indexado por las respuestas codificadas
+(índice en base mixta). Clasificar esos componentes es entonces un solo acceso al arreglo, sin el modelo en
+memoria.
+
+Tamaño de los espacios: proyecto 40 combinaciones, familiar 2187, económico 16. Psicosocial tiene más de
+33 millones, por lo que por defecto no se construye y ese componente se sigue clasificando con el bosque.
+
+Cada tabla guarda la suma SHA-256 del .pkl con el que se construyó; si el modelo cambia en disco, la tabla
+se descarta y se usa el bosque hasta reconstruirla. Las tablas se construyen siempre con el bosque exacto
+compilado del .pkl: `construir_tabla` rechaza los bosques comprimidos de `sat.compresion`, cuyas clases no son
+las del modelo cuya suma se guardaría.
+
+Uso:
+    python -m sat.tablas_riesgo construir     # escribe tabla_riesgo_<nombre>.npz junto a cada .pkl
+    python -m sat.tablas_riesgo verificar     # compara las tablas con los bosques sobre todo el espacio
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from sat.modelos import ARCHIVOS_MODELOS, RUTA_BASE, calcular_checksum
+
+# Por encima de este número de combinaciones no se construye la tabla densa
+MAXIMO_COMBINACIONES = 1_000_000
+
+# Valores posibles de las columnas de la pregunta de selección múltiple del componente familiar
+VALORES_SITUACIONES = (0, 1, 5)
+
+
+def archivo_tabla(nombre):
+    return Path(ARCHIVOS_MODELOS[nombre]).with_name(f"tabla_riesgo_{nombre}.npz").name
+
+
+def dominios_componente(nombre):
+    """Valores posibles (ordenados) de cada variable seleccionada del componente `nombre`."""
+    from sat.ponderaciones import PUNTUACIONES
+    from sat.puntaje import COMPONENTES_PONDERACION, VARIABLES
+
+    dominios = []
+    for pregunta, opcion in VARIABLES[nombre]:
+        if opcion is None:
+            valores = PUNTUACIONES[COMPONENTES_PONDERACION[nombre]][pregunta].values()
+        else:
+            # Columnas agregadas al expandir la pregunta de selección múltiple
+            valores = VALORES_SITUACIONES
+        dominios.append(np.array(sorted(set(valores)), dtype=float))
+    return dominios
+
+
+@dataclass
+class TablaRiesgo:
+    dominios: list       # arreglos ordenados con los valores posibles de cada variable
+    clases: np.ndarray   # (combinaciones,) clase predicha, en orden C sobre los dominios
+    checksum: str        # suma SHA-256 del .pkl con que se construyó
+
+    def codigos(self, matriz):
+        """Índice de cada fila en la tabla; -1 si algún valor no pertenece al dominio de su variable."""
+        codigos = np.zeros(len(matriz), dtype=np.int64)
+        cubiertas = np.ones(len(matriz), dtype=bool)
+        for j, dominio in enumerate(self.dominios):
+            posicion = np.searchsorted(dominio, matriz[:, j])
+            posicion = np.minimum(posicion, len(dominio) - 1)
+            cubiertas &= dominio[posicion] == matriz[:, j]
+            codigos = codigos * len(dominio) + posicion
+        return np.where(cubiertas, codigos, -1)
+
+    def clasificar(self, matriz):
+        """Clase de cada fila de `matriz`; -1 para las filas que la tabla no cubre."""
+        codigos = self.codigos(matriz)
+        return np.where(codigos >= 0, self.clases[np.maximum(codigos, 0)].astype(np.int64), -1)
+
+
+def combinaciones(dominios):
+    """Matriz con todas las combinaciones de los dominios, en el mismo orden que TablaRiesgo.codigos."""
+    mallas = np.meshgrid(*dominios, indexing="ij")
+    return np.stack([malla.ravel() for malla in mallas], axis=1)
+
+
+def construir_tabla(nombre, bosque, checksum):
+    """Clasifica con `bosque` todas las combinaciones de respuestas del componente `nombre`."""
+    if bosque.comprimido:
+        raise ValueError(f"{nombre}: no se construyen tablas con un bosque comprimido; use el modelo original.")
+    dominios = dominios_componente(nombre)
+    return TablaRiesgo(dominios, bosque.predict(combinaciones(dominios)).astype(np.int8), checksum)
+
+
+def guardar_tabla(tabla, ruta):
+    np.savez(ruta, clases=tabla.clases, checksum=np.array(tabla.checksum),
+             tamanos=np.array([len(dominio) for dominio in tabla.dominios]),
+             valores=np.concatenate(tabla.dominios))
+
+
+def cargar_tabla(ruta):
+    with np.load(ruta, allow_pickle=False) as datos:
+        limites = np.cumsum(datos["tamanos"])[:-1]
+        return TablaRiesgo(np.split(datos["valores"], limites), datos["clases"], str(datos["checksum"]))
+
+
+class RegistroTablas:
+    """
+    Carga perezosa de las tablas de `directorio`. Cada tabla se valida contra la suma SHA-256 del .pkl
+    correspondiente; la validación se repite, como máximo cada `intervalo_verificacion` segundos, cuando la
+    fecha o el tamaño del .pkl cambian.
+    """
+
+    def __init__(self, directorio=RUTA_BASE, archivos=ARCHIVOS_MODELOS, intervalo_verificacion=2.0):
+        self.directorio = Path(directorio)
+        self.archivos = archivos
+        self.intervalo_verificacion = intervalo_verificacion
+        self._estado = {}  # nombre -> (firma del .pkl, tabla o None, última verificación)
+        self._lock = threading.Lock()
+
+    def obtener(self, nombre):
+        """Retorna la TablaRiesgo vigente de `nombre`, o None si no existe o está desactualizada."""
+        estado = self._estado.get(nombre)
+        if estado is not None and time.monotonic() - estado[2] < self.intervalo_verificacion:
+            return estado[1]
+        with self._lock:
+            estado = self._estado.get(nombre)
+            ruta_modelo = self.directorio / self.archivos[nombre]
+            stat = os.stat(ruta_modelo)
+            firma = (stat.st_mtime_ns, stat.st_size)
+            if estado is not None and estado[0] == firma:
+                tabla = estado[1]
+            else:
+                tabla = self._cargar(nombre, calcular_checksum(ruta_modelo))
+            self._estado[nombre] = (firma, tabla, time.monotonic())
+            return tabla
+
+    def _cargar(self, nombre, checksum):
+        ruta = self.directorio / archivo_tabla(nombre)
+        if not ruta.exists():
+            return None
+        tabla = cargar_tabla(ruta)
+        return tabla if tabla.checksum == checksum else None
+
+
+# Registro único por proceso, igual que sat.modelos.registro
+tablas = RegistroTablas()
+
+
+def main(argv=None):
+    from sat.arboles import compilar_bosque
+    from sat.modelos import registro
+
+    parser = argparse.ArgumentParser(prog="python -m sat.tablas_riesgo", description="Tablas de riesgo precalculadas.")
+    parser.add_argument("accion", choices=["construir", "verificar"])
+    parser.add_argument("--directorio", type=Path, default=RUTA_BASE, help="Directorio de salida de las tablas")
+    parser.add_argument("--maximo-combinaciones", type=int, default=MAXIMO_COMBINACIONES,
+                        help=f"Componentes con más combinaciones se omiten (por defecto {MAXIMO_COMBINACIONES})")
+    args = parser.parse_args(argv)
+
+    fallas = 0
+    for nombre in ARCHIVOS_MODELOS:
+        total = int(np.prod([len(dominio) for dominio in dominios_componente(nombre)]))
+        if total > args.maximo_combinaciones:
+            print(f"{nombre}: {total} combinaciones, se omite (se clasifica con el bosque)")
+            continue
+        ruta = args.directorio / archivo_tabla(nombre)
+        if args.accion == "construir":
+            # Con el .pkl y no con `obtener_compilado`, que puede ser un bosque comprimido
+            tabla = construir_tabla(nombre, compilar_bosque(registro.obtener(nombre)), registro.checksum(nombre))
+            guardar_tabla(tabla, ruta)
+            print(f"{nombre}: {total} combinaciones -> {ruta}")
+        elif not ruta.exists():
+            print(f"{nombre}: no existe {ruta}")
+            fallas += 1
+            continue
+
+        # Comparación exhaustiva contra el modelo original de sklearn
+        import pandas as pd
+
+        tabla = cargar_tabla(ruta)
+        modelo = registro.obtener(nombre)
+        X = combinaciones(tabla.dominios)
+        distintas = int((modelo.predict(pd.DataFrame(X, columns=modelo.feature_names_in_)) != tabla.clasificar(X)).sum())
+        vigente = tabla.checksum == registro.checksum(nombre)
+        print(f"{nombre}: combinaciones distintas = {distintas}, checksum vigente = {vigente}")
+        fallas += distintas > 0 or not vigente
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Reporte de tiempos de importación del arranque de la aplicación.
+
+Mide, en un proceso nuevo de Python con `-X importtime`, las importaciones de nivel de módulo de `app2.py`
+(lo que paga un contenedor en frío antes de mostrar la primera pregunta) y, por separado, la primera carga
+de los modelos, que ocurre con el primer cálculo de riesgo. Permite fijar un límite para detectar regresiones
+del tiempo de arranque.
+
+Uso:
+    python -m sat.tiempos_importacion
+    python -m sat.tiempos_importacion --json tiempos.json --limite-ms 1500
+"""
+
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from sat.modelos import RUTA_BASE
+
+SCRIPT_APLICACION = RUTA_BASE / "app2.py"
+
+
+def importaciones_de_modulo(ruta):
+    """Sentencias de importación de nivel de módulo de `ruta`, en el orden en que aparecen."""
+    arbol = ast.parse(Path(ruta).read_text(encoding="utf-8"))
+    return [ast.unparse(nodo) for nodo in arbol.body if isinstance(nodo, (ast.Import, ast.ImportFrom))]
+
+
+def medir_importaciones(codigo, cwd=RUTA_BASE):
+    """
+    Ejecuta `codigo` en un proceso nuevo con -X importtime. Retorna la lista de módulos importados como
+    diccionarios {modulo, nivel, propio_ms, acumulado_ms}, en el orden del reporte de Python.
+    """
+    proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo], cwd=cwd,
+                             capture_output=True, text=True, check=True)
+    modulos = []
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "[us]" in linea:
+            continue
+        propio, acumulado, nombre = linea.removeprefix("import time:").split("|")
+        modulos.append({
+            "modulo": nombre.strip(),
+            "nivel": (len(nombre) - len(nombre.lstrip()) - 1) // 2,
+            "propio_ms": int(propio) / 1000,
+            "acumulado_ms": int(acumulado) / 1000,
+        })
+    return modulos
+
+
+def resumen(modulos, top=15):
+    return {
+        "total_ms": sum(modulo["acumulado_ms"] for modulo in modulos if modulo["nivel"] == 0),
+        "modulos": len(modulos),
+        "mas_lentos": sorted(modulos, key=lambda modulo: modulo["acumulado_ms"], reverse=True)[:top],
+    }
+
+
+def reporte(script=SCRIPT_APLICACION, top=15):
+    """Tiempos de las importaciones de arranque de `script` y de la primera carga de los modelos."""
+    arranque = "\n".join(importaciones_de_modulo(script))
+    # Lo que abre el primer cálculo de riesgo: los bosques compilados (desde los artefactos compactos, si existen)
+    primera_carga = ("from sat.modelos import registro\n"
+                     "for nombre in registro.nombres():\n    registro.obtener_compilado(nombre)")
+    arranque_modulos = medir_importaciones(arranque)
+    # Solo los módulos que agrega la primera carga de los modelos, con el arranque ya importado
+    cargados = {modulo["modulo"] for modulo in arranque_modulos}
+    carga_modulos = [modulo for modulo in medir_importaciones(arranque + "\n" + primera_carga)
+                     if modulo["modulo"] not in cargados]
+    return {
+        "script": str(script),
+        "arranque": resumen(arranque_modulos, top),
+        "primera_carga_modelos": resumen(carga_modulos, top),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sat.tiempos_importacion",
+                                     description="Tiempos de importación del arranque de la aplicación.")
+    parser.add_argument("--script", type=Path, default=SCRIPT_APLICACION, help="Script de Streamlit a medir")
+    parser.add_argument("--top", type=int, default=15, help="Número de módulos más lentos a mostrar")
+    parser.add_argument("--json", type=Path, help="Archivo donde escribir el reporte en JSON")
+    parser.add_argument("--limite-ms", type=float,
+                        help="Termina con código 1 si las importaciones de arranque superan este tiempo")
+    args = parser.parse_args(argv)
+
+    datos = reporte(args.script, args.top)
+    for clave, titulo in (("arranque", "Arranque"), ("primera_carga_modelos", "Primera carga de los modelos")):
+        seccion = datos[clave]
+        print(f"{titulo}: {seccion['total_ms']:.0f} ms en {seccion['modulos']} módulos")
+        for modulo in seccion["mas_lentos"]:
+            print(f"  {modulo['acumulado_ms']:9.1f} ms  {modulo['modulo']}")
+    if args.json:
+        args.json.write_text(json.dumps(datos, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.limite_ms is not None and datos["arranque"]["total_ms"] > args.limite_ms:
+        print(f"El arranque supera el límite de {args.limite_ms:.0f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Validación de un envío del cuestionario antes de guardarlo.
+
+Se separa de la aplicación para poder usarla (y medirla) sin Streamlit.
+"""
+
+from sat.cuestionario import PREGUNTAS_CUESTIONARIO
+from sat.metricas import metricas
+
+
+@metricas.medir("validar_entrada")
+def validar_entrada(numero_documento, nombre_completo, autorizacion_datos, respuestas, almacenamiento):
+    """
+    Valida los datos de identificación y las respuestas de un envío.
+
+    `respuestas` son los índices de las opciones elegidas, alineados con `PREGUNTAS_CUESTIONARIO`.
+    Retorna (True, None) si el envío es válido, o (False, mensaje de error).
+    """
+    # Verificar autorización
+    if not autorizacion_datos:
+        return False, "No has aceptado el tratamiento de datos personales. Por favor, acepta para continuar."
+
+    # Verificar número de documento
+    if not numero_documento:
+        return False, "Por favor, ingrese su número de documento de identidad."
+    try:
+        numero_documento = int(numero_documento)
+        if numero_documento <= 0:
+            return False, "Número de documento de identidad inválido."
+    except ValueError:
+        return False, "Por favor, ingrese solo números para el documento de identidad."
+
+    # Verificar documento duplicado en el almacenamiento de respuestas
+    if almacenamiento.existe_documento(numero_documento):
+        return False, "Este número de documento ya está registrado. No se puede volver a cargar."
+
+    # Verificar campo de nombre completo
+    if not nombre_completo:
+        return False, "Por favor, ingrese su nombre completo."
+
+    # Verificar que todas las preguntas estén contestadas
+    if len(respuestas) != len(PREGUNTAS_CUESTIONARIO) or not all(
+        pregunta.respondida(respuesta) for pregunta, respuesta in zip(PREGUNTAS_CUESTIONARIO, respuestas)
+    ):
+        return False, "Por favor, responda todas las preguntas."
+
+    return True, None  # Todas las validaciones pasaron
+
+
+def armar_fila(numero_documento, nombre_completo, respuestas):
+    """Fila de la hoja "Datos" para un envío válido: datos básicos seguidos de los valores de las respuestas."""
+    basico = [nombre_completo, int(numero_documento)]
+    return basico + [pregunta.valor(respuesta) for pregunta, respuesta in zip(PREGUNTAS_CUESTIONARIO, respuestas)]
@@ -0,0 +1,27 @@
+from sat.agregados import AgregadosRiesgo, main, reconstruir
+from sat.almacenamiento import COLUMNA_DOCUMENTO
+from sat.sinteticos import generar_filas
+
+
+def exportacion(tmp_path):
+    # Exportación de la hoja con celdas de documento vacías o con texto, que no se pueden contar
+    filas = generar_filas(20, semilla=2).astype({COLUMNA_DOCUMENTO: object})
+    filas.loc[[3, 7], COLUMNA_DOCUMENTO] = None
+    filas.loc[11, COLUMNA_DOCUMENTO] = "sin documento"
+    ruta = tmp_path / "respuestas.csv"
+    filas.to_csv(ruta, index=False)
+    return ruta
+
+
+def test_reconstruir_omite_filas_sin_documento(tmp_path):
+    agregados = AgregadosRiesgo(tmp_path / "agregados.sqlite")
+    assert reconstruir(agregados, exportacion(tmp_path), "2024-2", tamano_bloque=8) == (17, 3)
+    assert agregados.total("2024-2") == 17
+    # Una segunda reconstrucción no vuelve a contar los mismos documentos
+    assert reconstruir(agregados, exportacion(tmp_path), "2024-2") == (0, 3)
+
+
+def test_main_informa_las_filas_omitidas(tmp_path, capsys):
+    main(["--ruta", str(tmp_path / "agregados.sqlite"), "reconstruir", str(exportacion(tmp_path)), "--cohorte", "2024-2"])
+    salida = capsys.readouterr().out
+    assert "17 envíos sumados" in salida and "3 filas sin número de documento válido omitidas" in salida
@@ -0,0 +1,224 @@
+import logging
+import sqlite3
+import threading
+import time
+
+import gspread
+import pandas as pd
+import pytest
+
+from sat.almacenamiento import (
+    COLUMNA_DOCUMENTO,
+    COLUMNAS_DATOS,
+    COLUMNAS_REGISTRO,
+    AlmacenamientoGSheets,
+    AlmacenamientoParquet,
+    AlmacenamientoSQLite,
+    IndiceDocumentos,
+    abrir_hoja_gspread,
+    atribuir_lecturas,
+    crear_almacenamiento,
+)
+
+POSICION_DOCUMENTO = COLUMNAS_DATOS.index(COLUMNA_DOCUMENTO)
+
+
+def fila(documento):
+    valores = [""] * len(COLUMNAS_REGISTRO)
+    valores[POSICION_DOCUMENTO] = documento
+    return valores
+
+
+def insertar_sin_indice(ruta, documentos):
+    # Tabla con documentos repetidos, como una importación de la hoja anterior al índice único
+    columnas = ", ".join('"' + columna + '"' for columna in COLUMNAS_REGISTRO)
+    with sqlite3.connect(ruta) as conexion:
+        conexion.execute(f"CREATE TABLE datos (_id INTEGER PRIMARY KEY AUTOINCREMENT, {columnas})")
+        for documento in documentos:
+            conexion.execute(f"INSERT INTO datos ({columnas}) VALUES ({', '.join('?' for _ in COLUMNAS_REGISTRO)})",
+                             fila(documento))
+
+
+def test_rechaza_documento_repetido(tmp_path):
+    almacenamiento = AlmacenamientoSQLite(tmp_path / "datos.sqlite")
+    assert almacenamiento.agregar_nuevo(fila(1))
+    assert not almacenamiento.agregar_nuevo(fila(1))
+    # Otro proceso con su propio índice en memoria: lo detiene el índice único de la tabla
+    assert not AlmacenamientoSQLite(tmp_path / "datos.sqlite").agregar_nuevo(fila(1))
+    assert almacenamiento.documentos() == [1]
+
+
+def test_tabla_con_duplicados_se_informa_sin_fallar(tmp_path, caplog):
+    ruta = tmp_path / "datos.sqlite"
+    insertar_sin_indice(ruta, [1, 2, 1, 3, 3])
+    with caplog.at_level(logging.WARNING, logger="sat.almacenamiento"):
+        almacenamiento = AlmacenamientoSQLite(ruta)
+    assert almacenamiento.documentos_duplicados == [1, 3]
+    assert "repetidos" in caplog.text
+
+    # Sin índice único, la inserción sigue rechazando documentos ya guardados
+    otro_proceso = AlmacenamientoSQLite(ruta)
+    assert not otro_proceso.agregar_nuevo(fila(2))
+    assert otro_proceso.agregar_nuevo(fila(4))
+    assert not almacenamiento.agregar_nuevo(fila(4))
+    assert sorted(almacenamiento.documentos()) == [1, 1, 2, 3, 3, 4]
+
+
+def test_tabla_anterior_recibe_las_columnas_nuevas(tmp_path):
+    # Tabla de una versión anterior: solo las respuestas, con el índice no único sobre el documento
+    ruta = tmp_path / "datos.sqlite"
+    columnas = ", ".join('"' + columna + '"' for columna in COLUMNAS_DATOS)
+    with sqlite3.connect(ruta) as conexion:
+        conexion.execute(f"CREATE TABLE datos (_id INTEGER PRIMARY KEY AUTOINCREMENT, {columnas})")
+        conexion.execute(f'CREATE INDEX datos_documento ON datos ("{COLUMNA_DOCUMENTO}")')
+        conexion.execute(f"INSERT INTO datos ({columnas}) VALUES ({', '.join('?' for _ in COLUMNAS_DATOS)})",
+                         fila(1)[:len(COLUMNAS_DATOS)])
+
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    assert list(almacenamiento.leer().columns) == COLUMNAS_REGISTRO
+    assert almacenamiento.agregar_nuevo(fila(2))
+    assert not almacenamiento.agregar_nuevo(fila(1))
+    with sqlite3.connect(ruta) as conexion:
+        indices = {nombre for (nombre,) in conexion.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "datos_documento_unico" in indices and "datos_documento" not in indices
+    assert almacenamiento.leer()[COLUMNAS_REGISTRO[-1]].isna().tolist() == [True, False]
+
+
+def test_indice_se_recarga_al_vencer():
+    guardados = [1]
+    indice = IndiceDocumentos(lambda: list(guardados), vigencia=0.05)
+    assert 1 in indice and 2 not in indice
+    assert indice.reservar(3)
+    guardados.append(2)  # guardado por otro proceso
+    assert 2 not in indice
+    time.sleep(0.06)
+    # La recarga incorpora el documento nuevo y conserva la reserva local, aún no visible en el almacenamiento
+    assert 2 in indice and 3 in indice
+
+
+def test_indice_sin_vigencia_se_carga_una_vez():
+    cargas = []
+    indice = IndiceDocumentos(lambda: cargas.append(1) or [1])
+    assert 1 in indice and 1 in indice
+    assert len(cargas) == 1
+
+
+class HojaEnMemoria:
+    def __init__(self):
+        self.filas = []
+
+    def append_row(self, fila, **opciones):
+        self.filas.append(fila)
+
+    def append_rows(self, filas, **opciones):
+        self.filas.extend(filas)
+
+
+class ConexionEnMemoria:
+    """Conexión de lectura (como GSheetsConnection) y apertura de las hojas para escribir (como gspread)."""
+
+    def __init__(self):
+        self.hojas = {}
+        self.aperturas = 0
+
+    def abrir_hoja(self, worksheet):
+        self.aperturas += 1
+        return self.hojas.setdefault(worksheet, HojaEnMemoria())
+
+    def read(self, worksheet="Datos", ttl=None):
+        return pd.DataFrame(getattr(self.hojas.get(worksheet), "filas", []), columns=COLUMNAS_REGISTRO)
+
+
+def gsheets_en_memoria(conexion=None):
+    conexion = conexion or ConexionEnMemoria()
+    return AlmacenamientoGSheets(conexion, abrir_hoja=conexion.abrir_hoja)
+
+
+def test_gsheets_agrega_filas_en_la_hoja_configurada():
+    conexion = ConexionEnMemoria()
+    almacenamiento = gsheets_en_memoria(conexion)
+    assert almacenamiento.agregar_nuevo(fila(1))
+    almacenamiento.agregar_filas([fila(2), fila(3)])
+    assert [registro[POSICION_DOCUMENTO] for registro in conexion.hojas["Datos"].filas] == [1, 2, 3]
+    # La hoja se abre una sola vez: cada escritura es una sola solicitud
+    assert almacenamiento.escrituras_remotas == 2 and conexion.aperturas == 1
+
+
+def test_gsheets_sin_cuenta_de_servicio_falla_con_un_error_claro():
+    with pytest.raises(RuntimeError, match="secretos"):
+        AlmacenamientoGSheets(ConexionEnMemoria()).agregar(fila(1))
+    # Secretos de una hoja pública (solo lectura)
+    with pytest.raises(RuntimeError, match="service_account"):
+        abrir_hoja_gspread({"spreadsheet": "https://docs.google.com/spreadsheets/d/x"}, "Datos")
+
+
+def test_abrir_hoja_gspread_usa_la_api_publica(monkeypatch):
+    abiertas = []
+
+    class Libro:
+        def worksheet(self, titulo):
+            abiertas.append(titulo)
+            return HojaEnMemoria()
+
+    class Cliente:
+        def open_by_url(self, url):
+            abiertas.append(url)
+            return Libro()
+
+    def service_account_from_dict(credenciales):
+        # Las credenciales sin las claves propias de la conexión, como en GSheetsConnection
+        abiertas.append(credenciales)
+        return Cliente()
+
+    monkeypatch.setattr(gspread, "service_account_from_dict", service_account_from_dict)
+    secretos = {"type": "service_account", "spreadsheet": "https://docs.google.com/spreadsheets/d/x",
+                "worksheet": "0", "client_email": "sat@proyecto.iam.gserviceaccount.com"}
+    almacenamiento = crear_almacenamiento("gsheets", conn=ConexionEnMemoria(), secretos=secretos)
+    almacenamiento.agregar(fila(1))
+    almacenamiento.agregar(fila(2))
+    assert abiertas == [{"type": "service_account", "client_email": "sat@proyecto.iam.gserviceaccount.com"},
+                        "https://docs.google.com/spreadsheets/d/x", "Datos"]
+    assert "worksheet" in secretos  # los secretos de la aplicación no se modifican
+
+
+def test_parquet_dos_procesos_no_se_sobrescriben(tmp_path):
+    # Dos instancias sobre el mismo directorio, como dos procesos del servidor, escribiendo a la vez
+    primera, segunda = AlmacenamientoParquet(tmp_path), AlmacenamientoParquet(tmp_path)
+    hilos = [threading.Thread(target=lambda almacenamiento=almacenamiento, inicio=inicio: [
+        almacenamiento.agregar(fila(documento)) for documento in range(inicio, inicio + 20)])
+        for almacenamiento, inicio in ((primera, 0), (segunda, 100))]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert sorted(map(int, primera.documentos())) == list(range(20)) + list(range(100, 120))
+
+
+def test_parquet_rechaza_documento_guardado_por_otro_proceso(tmp_path):
+    primera, segunda = AlmacenamientoParquet(tmp_path), AlmacenamientoParquet(tmp_path)
+    assert primera.agregar_nuevo(fila(1))
+    primera.existe_documento(2)  # el índice de la primera instancia ya está cargado
+    assert segunda.agregar_nuevo(fila(2))
+    assert not primera.agregar_nuevo(fila(2))
+    primera.compactar()
+    assert segunda.agregar_nuevo(fila(3))
+    assert list(map(int, primera.documentos())) == [1, 2, 3]
+
+
+def test_lecturas_del_indice_se_atribuyen_a_la_sesion():
+    almacenamiento = gsheets_en_memoria()
+    primera, segunda = {}, {}
+    with atribuir_lecturas(primera):
+        # La carga del índice de documentos descarga la hoja por cuenta de esta sesión
+        assert almacenamiento.agregar_nuevo(fila(1))
+    with atribuir_lecturas(segunda):
+        almacenamiento.leer()  # la escritura invalidó la caché: vuelve a descargar
+        almacenamiento.leer()
+    almacenamiento.leer()  # fuera de una sesión: no se atribuye
+    assert primera == {"remotas": 1}
+    assert segunda == {"remotas": 1, "cache": 1}
+    # Las estadísticas explícitas tienen prioridad sobre las de la sesión
+    explicitas = {}
+    with atribuir_lecturas(primera):
+        almacenamiento.leer(explicitas)
+    assert explicitas == {"cache": 1} and primera == {"remotas": 1}
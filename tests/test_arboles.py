@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sat.arboles import abrir_compacto, compilar_bosque, entradas_de_prueba, guardar_compacto
+from sat.modelos import ARCHIVOS_MODELOS, DIRECTORIO_COMPACTOS, RUTA_BASE, RegistroModelos, registro
+from sat.puntaje import COMPONENTES, codificar_respuestas
+from sat.sinteticos import generar_indices
+
+
+@pytest.fixture(scope="module", params=list(ARCHIVOS_MODELOS))
+def modelo(request):
+    return request.param, registro.obtener(request.param)
+
+
+def respuestas_sinteticas(nombre, filas=2000, semilla=0):
+    # Filas codificadas como las de la aplicación, a partir de respuestas sintéticas del cuestionario
+    posicion = [componente for componente, _ in COMPONENTES].index(nombre)
+    return codificar_respuestas(generar_indices(filas, semilla=semilla))[posicion]
+
+
+def comparar(modelo, bosque, X):
+    X_sklearn = pd.DataFrame(X, columns=modelo.feature_names_in_)
+    np.testing.assert_array_equal(bosque.predict(X), modelo.predict(X_sklearn))
+    np.testing.assert_allclose(bosque.predict_proba(X), modelo.predict_proba(X_sklearn), rtol=0, atol=1e-12)
+
+
+def test_compilado_igual_a_sklearn_en_respuestas_sinteticas(modelo):
+    nombre, modelo = modelo
+    comparar(modelo, compilar_bosque(modelo), respuestas_sinteticas(nombre))
+
+
+def test_compilado_igual_a_sklearn_en_los_umbrales(modelo):
+    # Puntuaciones de 0 a 5 y los umbrales exactos de los árboles: ambos lados de cada corte
+    _, modelo = modelo
+    bosque = compilar_bosque(modelo)
+    comparar(modelo, bosque, entradas_de_prueba(bosque, filas=5000))
+
+
+def test_compacto_publicado_igual_a_sklearn(modelo):
+    nombre, modelo = modelo
+    bosque, manifiesto = abrir_compacto(RUTA_BASE / DIRECTORIO_COMPACTOS / nombre)
+    assert manifiesto["checksum_origen"] == registro.checksum(nombre)
+    assert not manifiesto["comprimido"] and not bosque.comprimido
+    assert isinstance(bosque.variable, np.memmap)
+    comparar(modelo, bosque, respuestas_sinteticas(nombre))
+    comparar(modelo, bosque, entradas_de_prueba(bosque, filas=5000))
+
+
+def test_registro_abre_el_compacto_vigente():
+    registro_local = RegistroModelos(directorio_compactos=RUTA_BASE / DIRECTORIO_COMPACTOS)
+    registro_local.obtener_compilado("proyecto")
+    metricas = registro_local.metricas()["proyecto"]
+    assert metricas["compilado"] == "compacto" and not metricas["cargado"] and not metricas["comprimido"]
+    assert registro_local.version_compilado("proyecto") == registro_local.checksum("proyecto")
+
+
+def test_compacto_con_arreglos_alterados_se_rechaza(tmp_path):
+    bosque = compilar_bosque(registro.obtener("proyecto"))
+    guardar_compacto(bosque, tmp_path, registro.checksum("proyecto"))
+    abrir_compacto(tmp_path)
+    np.save(tmp_path / "izquierdo.npy", bosque.izquierdo[:-1])
+    with pytest.raises(ValueError):
+        abrir_compacto(tmp_path)
+
+
+def test_compacto_de_otro_formato_se_rechaza(tmp_path):
+    guardar_compacto(compilar_bosque(registro.obtener("proyecto")), tmp_path, registro.checksum("proyecto"))
+    ruta = tmp_path / "manifiesto.json"
+    ruta.write_text(json.dumps({**json.loads(ruta.read_text()), "formato": 1}))
+    with pytest.raises(ValueError):
+        abrir_compacto(tmp_path)
@@ -0,0 +1,102 @@
+import numpy as np
+
+from sat import puntaje
+from sat.cache_predicciones import CAPACIDAD, CachePredicciones
+from sat.modelos import registro
+
+
+class Bosque:
+    """Predictor de prueba que cuenta las filas que recibe: la clase es la suma de la fila módulo 3."""
+
+    def __init__(self, desplazamiento=0):
+        self.desplazamiento = desplazamiento
+        self.filas = 0
+
+    def __call__(self, matriz):
+        self.filas += len(matriz)
+        return (matriz.sum(axis=1).astype(np.int64) + self.desplazamiento) % 3
+
+
+def filas(inicio, fin, columnas=4):
+    return np.repeat(np.arange(inicio, fin, dtype=float)[:, None], columnas, axis=1)
+
+
+def test_filas_repetidas_no_recorren_el_bosque():
+    cache, bosque = CachePredicciones(), Bosque()
+    matriz = np.vstack([filas(0, 50), filas(0, 50)])
+    np.testing.assert_array_equal(cache.predecir("proyecto", matriz, "v1", bosque), Bosque()(matriz))
+    assert bosque.filas == 50  # cada fila distinta una sola vez
+    np.testing.assert_array_equal(cache.predecir("proyecto", matriz, "v1", bosque), Bosque()(matriz))
+    assert bosque.filas == 50
+    estadisticas = cache.estadisticas()["proyecto"]
+    assert (estadisticas["aciertos"], estadisticas["fallos"], estadisticas["filas"]) == (100, 100, 50)
+
+
+def test_cambio_de_version_vacia_el_cache_del_modelo():
+    cache = CachePredicciones()
+    matriz = filas(0, 20)
+    cache.predecir("proyecto", matriz, "v1", Bosque())
+    cache.predecir("psico", matriz, "p1", Bosque())
+
+    # Otro .pkl (o un bosque comprimido): las predicciones anteriores ya no sirven
+    nuevo = Bosque(desplazamiento=1)
+    np.testing.assert_array_equal(cache.predecir("proyecto", matriz, "v2", nuevo), Bosque(desplazamiento=1)(matriz))
+    assert nuevo.filas == 20
+    estadisticas = cache.estadisticas()
+    assert estadisticas["proyecto"]["invalidaciones"] == 1 and estadisticas["proyecto"]["filas"] == 20
+    # El caché de los demás modelos se conserva
+    psico = Bosque()
+    cache.predecir("psico", matriz, "p1", psico)
+    assert psico.filas == 0 and estadisticas["psico"]["invalidaciones"] == 0
+
+
+def test_prediccion_de_una_version_vencida_no_se_guarda():
+    cache = CachePredicciones()
+
+    def predecir_mientras_cambia(matriz):
+        # Otra sesión consulta con la versión nueva mientras esta predice con la anterior
+        cache.predecir("proyecto", filas(100, 101), "v2", Bosque())
+        return Bosque()(matriz)
+
+    cache.predecir("proyecto", filas(0, 10), "v1", predecir_mientras_cambia)
+    assert cache.estadisticas()["proyecto"]["filas"] == 1
+
+
+def test_desalojo_respeta_la_capacidad():
+    cache, bosque = CachePredicciones(), Bosque()
+    assert cache.capacidad == CAPACIDAD == 10_000
+    cache.predecir("psico", filas(0, CAPACIDAD), "v1", bosque)
+    # Consultar las primeras filas las marca como recientes: se desalojan las siguientes menos usadas
+    cache.predecir("psico", filas(0, 100), "v1", bosque)
+    cache.predecir("psico", filas(CAPACIDAD, CAPACIDAD + 500), "v1", bosque)
+    estadisticas = cache.estadisticas()["psico"]
+    assert estadisticas["filas"] == CAPACIDAD and estadisticas["desalojos"] == 500
+
+    bosque.filas = 0
+    cache.predecir("psico", filas(0, 100), "v1", bosque)
+    assert bosque.filas == 0  # recientes: siguen en el caché
+    cache.predecir("psico", filas(100, 600), "v1", bosque)
+    assert bosque.filas == 500  # las menos usadas fueron desalojadas
+
+
+def test_lote_mayor_que_la_capacidad():
+    cache, bosque = CachePredicciones(capacidad=100), Bosque()
+    matriz = filas(0, 250)
+    np.testing.assert_array_equal(cache.predecir("familiar", matriz, "v1", bosque), Bosque()(matriz))
+    estadisticas = cache.estadisticas()["familiar"]
+    assert estadisticas["filas"] == 100 and estadisticas["desalojos"] == 150
+
+
+def test_puntaje_usa_la_version_del_compilado(monkeypatch):
+    # El caché compartido se invalida cuando registro.version_compilado cambia (otro .pkl o bosque comprimido)
+    cache = CachePredicciones()
+    monkeypatch.setattr(puntaje, "predicciones", cache)
+    matriz = filas(1, 4)
+    puntaje._predecir_bosque("proyecto", matriz)
+    puntaje._predecir_bosque("proyecto", matriz)
+    assert cache.estadisticas()["proyecto"]["invalidaciones"] == 0
+
+    monkeypatch.setattr(registro, "version_compilado", lambda nombre: "otra versión")
+    puntaje._predecir_bosque("proyecto", matriz)
+    estadisticas = cache.estadisticas()["proyecto"]
+    assert estadisticas["invalidaciones"] == 1 and estadisticas["aciertos"] == 3
@@ -0,0 +1,152 @@
+import logging
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from sat.almacenamiento import COLUMNAS_DATOS, COLUMNA_DOCUMENTO, COLUMNAS_REGISTRO, Almacenamiento
+from sat.cola import AlmacenamientoEnCola
+
+POSICION_DOCUMENTO = COLUMNAS_DATOS.index(COLUMNA_DOCUMENTO)
+
+
+class DestinoLento(Almacenamiento):
+    """Destino en memoria cuya escritura tarda, para que dos trabajadores compitan por el mismo lote."""
+
+    def __init__(self, espera=0.02):
+        self.espera = espera
+        self.filas = []
+        self._lock = threading.Lock()
+
+    def leer(self, estadisticas=None):
+        with self._lock:
+            return pd.DataFrame(self.filas, columns=COLUMNAS_REGISTRO)
+
+    def agregar(self, fila):
+        self.agregar_filas([fila])
+
+    def agregar_filas(self, filas):
+        time.sleep(self.espera)
+        with self._lock:
+            self.filas.extend(filas)
+
+    def documentos(self):
+        with self._lock:
+            return [fila[POSICION_DOCUMENTO] for fila in self.filas]
+
+
+def fila(documento):
+    valores = [""] * len(COLUMNAS_REGISTRO)
+    valores[POSICION_DOCUMENTO] = documento
+    return valores
+
+
+def test_dos_trabajadores_envian_cada_fila_una_vez(tmp_path):
+    ruta = tmp_path / "cola.sqlite"
+    destino = DestinoLento()
+    trabajadores = [AlmacenamientoEnCola(destino, ruta, tamano_lote=5, iniciar=False) for _ in range(2)]
+    for documento in range(100):
+        trabajadores[documento % 2].agregar(fila(documento))
+
+    def vaciar(cola):
+        while cola.pendientes():
+            cola.enviar_lote()
+
+    hilos = [threading.Thread(target=vaciar, args=(cola,)) for cola in trabajadores]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert sorted(destino.documentos()) == list(range(100))
+
+
+def test_reclamo_vencido_se_retoma_sin_duplicar(tmp_path):
+    ruta = tmp_path / "cola.sqlite"
+    destino = DestinoLento(espera=0)
+    caido = AlmacenamientoEnCola(destino, ruta, tamano_lote=10, iniciar=False, duracion_reclamo=0.05)
+    for documento in range(10):
+        caido.agregar(fila(documento))
+
+    # El primer proceso reclama y escribe la mitad del lote, y se detiene antes de retirarlo de la cola
+    lote = caido._reclamar()
+    destino.agregar_filas([fila(documento) for _, documento, *_ in lote[:5]])
+
+    otro = AlmacenamientoEnCola(destino, ruta, tamano_lote=10, iniciar=False, duracion_reclamo=0.05)
+    assert otro.enviar_lote() == 0  # el reclamo aún está vigente
+    time.sleep(0.1)
+    assert otro.enviar_lote() == 5
+    assert otro.pendientes() == 0
+    assert sorted(destino.documentos()) == list(range(10))
+
+
+class DestinoConFilaInvalida(DestinoLento):
+    """Destino que rechaza cualquier lote con el documento `invalido`, o responde por cuota las primeras veces."""
+
+    def __init__(self, invalido=None, rechazos_cuota=0):
+        super().__init__(espera=0)
+        self.invalido = invalido
+        self.rechazos_cuota = rechazos_cuota
+
+    def agregar_filas(self, filas):
+        if self.rechazos_cuota:
+            self.rechazos_cuota -= 1
+            raise RuntimeError("APIError: [429]: Quota exceeded")
+        if any(fila[POSICION_DOCUMENTO] == self.invalido for fila in filas):
+            raise ValueError("fila inválida")
+        super().agregar_filas(filas)
+
+
+def vaciar_con_errores(cola, intentos=50):
+    for _ in range(intentos):
+        if not cola.pendientes():
+            return
+        try:
+            cola.enviar_lote()
+        except Exception:
+            pass
+
+
+def test_fila_que_agota_sus_intentos_pasa_a_fallidas(tmp_path, caplog):
+    destino = DestinoConFilaInvalida(invalido=2)
+    cola = AlmacenamientoEnCola(destino, tmp_path / "cola.sqlite", tamano_lote=5, iniciar=False, maximo_intentos=3)
+    for documento in range(10):
+        cola.agregar(fila(documento))
+    with caplog.at_level(logging.ERROR, logger="sat.cola"):
+        vaciar_con_errores(cola)
+
+    # Las demás filas del lote se envían solas en su último intento y llegan al destino
+    assert cola.pendientes() == 0
+    assert sorted(destino.documentos()) == [0, 1, 3, 4, 5, 6, 7, 8, 9]
+    fallidas = cola.fallidas()
+    assert fallidas["documento"].tolist() == [2] and fallidas["intentos"].tolist() == [3]
+    assert "fila inválida" in fallidas["error"][0] and "cola_fallidas" in caplog.text
+
+    destino.invalido = None
+    assert cola.reencolar_fallidas() == 1 and cola.fallidas().empty
+    assert cola.enviar_lote() == 1
+    assert sorted(destino.documentos()) == list(range(10))
+
+
+def test_rechazos_por_cuota_no_agotan_los_intentos(tmp_path):
+    destino = DestinoConFilaInvalida(rechazos_cuota=5)
+    cola = AlmacenamientoEnCola(destino, tmp_path / "cola.sqlite", tamano_lote=5, iniciar=False, maximo_intentos=2)
+    for documento in range(5):
+        cola.agregar(fila(documento))
+    for _ in range(5):
+        with pytest.raises(RuntimeError):
+            cola.enviar_lote()
+    assert cola.enviar_lote() == 5
+    assert cola.fallidas().empty and sorted(destino.documentos()) == list(range(5))
+
+
+def test_leer_incluye_las_filas_aun_en_cola(tmp_path):
+    destino = DestinoLento(espera=0)
+    cola = AlmacenamientoEnCola(destino, tmp_path / "cola.sqlite", tamano_lote=2, iniciar=False)
+    for documento in range(3):
+        cola.agregar(fila(documento))
+    cola.enviar_lote()
+    datos = cola.leer()
+    assert list(datos.columns) == COLUMNAS_REGISTRO
+    assert datos[COLUMNA_DOCUMENTO].tolist() == [0, 1, 2]
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from sat.arboles import compilar_bosque
+from sat.compresion import (
+    CONCORDANCIA_MINIMA,
+    comprimir_bosque,
+    concordancia,
+    datos_referencia,
+    podar,
+    podar_hasta,
+    unir_hojas_equivalentes,
+)
+from sat.modelos import registro
+
+
+@pytest.fixture(scope="module")
+def psico():
+    bosque = compilar_bosque(registro.obtener("psico"))
+    X = datos_referencia("psico", 2000, semilla=0)
+    X_validacion = datos_referencia("psico", 2000, semilla=1)
+    return bosque, X, X_validacion
+
+
+def test_unir_hojas_equivalentes_no_cambia_las_probabilidades(psico):
+    bosque, X, _ = psico
+    unido = unir_hojas_equivalentes(bosque)
+    assert len(unido.variable) <= len(bosque.variable)
+    np.testing.assert_array_equal(unido.predict_proba(X), bosque.predict_proba(X))
+
+
+def test_poda_agresiva_se_rechaza(psico):
+    bosque, X, _ = psico
+    etiquetas = bosque.predict(X)
+    # Podar a profundidad 1 pierde mucho más que el margen permitido
+    assert concordancia(podar(bosque, 1), X, etiquetas) < CONCORDANCIA_MINIMA
+    podado = podar_hasta(bosque, X, etiquetas, CONCORDANCIA_MINIMA)
+    assert podado.profundidad > 1 and concordancia(podado, X, etiquetas) >= CONCORDANCIA_MINIMA
+    # Sin margen, ninguna poda que cambie una etiqueta se acepta
+    exacto = podar_hasta(bosque, X, etiquetas, 1.0)
+    np.testing.assert_array_equal(exacto.predict(X), etiquetas)
+
+
+def test_comprimido_cumple_la_concordancia_minima(psico):
+    bosque, X, X_validacion = psico
+    comprimido, referencia, validacion = comprimir_bosque(bosque, X, CONCORDANCIA_MINIMA, X_validacion)
+    assert comprimido.comprimido
+    assert referencia >= CONCORDANCIA_MINIMA and validacion >= CONCORDANCIA_MINIMA
+    assert referencia == concordancia(comprimido, X, bosque.predict(X))
+    assert validacion == concordancia(comprimido, X_validacion, bosque.predict(X_validacion))
+
+
+def test_poda_que_solo_concuerda_en_la_referencia_se_rechaza_en_la_validacion(psico):
+    bosque, X, X_validacion = psico
+    # Referencia engañosa: solo las filas en que la poda a profundidad 1 acierta, así esa poda parece exacta
+    agresivo = podar(bosque, 1)
+    X_sesgado = X[agresivo.predict(X) == bosque.predict(X)]
+    assert concordancia(agresivo, X_sesgado, bosque.predict(X_sesgado)) == 1.0
+
+    comprimido, referencia, validacion = comprimir_bosque(bosque, X_sesgado, CONCORDANCIA_MINIMA, X_validacion)
+    assert validacion >= CONCORDANCIA_MINIMA
+    assert comprimido.profundidad > 1
+    # Sin validación, la misma referencia habría aceptado un bosque que no cumple el mínimo
+    sin_validacion, _, _ = comprimir_bosque(bosque, X_sesgado, CONCORDANCIA_MINIMA)
+    assert concordancia(sin_validacion, X_validacion, bosque.predict(X_validacion)) < CONCORDANCIA_MINIMA
+
+
+def test_sin_candidato_aceptado_queda_el_bosque_sin_perdida():
+    bosque = compilar_bosque(registro.obtener("proyecto"))
+    X = datos_referencia("proyecto", 500, semilla=0)
+    # Una concordancia mínima inalcanzable rechaza todos los candidatos con pérdida
+    comprimido, referencia, validacion = comprimir_bosque(bosque, X, concordancia_minima=1.01)
+    assert not comprimido.comprimido and validacion is None
+    assert referencia == 1.0
+    np.testing.assert_array_equal(comprimido.predict_proba(X), bosque.predict_proba(X))
@@ -0,0 +1,109 @@
+import math
+import re
+
+import pytest
+
+from sat.metricas import LIMITES, Metricas
+
+# Formato de texto de Prometheus 0.0.4: nombre, etiquetas opcionales y valor
+MUESTRA = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+ETIQUETA = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"(,|$)')
+ESCAPES = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+
+
+def leer_etiquetas(texto):
+    etiquetas, posicion = {}, 0
+    while posicion < len(texto):
+        coincidencia = ETIQUETA.match(texto, posicion)
+        assert coincidencia, f"etiquetas mal formadas: {texto!r}"
+        nombre, valor, _ = coincidencia.groups()
+        etiquetas[nombre] = re.sub(r"\\.", lambda escape: ESCAPES[escape.group()], valor)
+        posicion = coincidencia.end()
+    return etiquetas
+
+
+def leer(texto):
+    """Familias {nombre: {"tipo", "ayuda", "muestras": [(nombre, etiquetas, valor)]}} del texto exportado."""
+    assert texto.endswith("\n")
+    familias = {}
+    for linea in texto.splitlines():
+        if linea.startswith("# HELP "):
+            nombre, ayuda = linea[len("# HELP "):].split(" ", 1)
+            familias.setdefault(nombre, {"muestras": []})["ayuda"] = ayuda
+        elif linea.startswith("# TYPE "):
+            nombre, tipo = linea[len("# TYPE "):].split(" ")
+            familia = familias.setdefault(nombre, {"muestras": []})
+            assert "tipo" not in familia and not familia["muestras"], f"TYPE repetido o tardío: {nombre}"
+            familia["tipo"] = tipo
+        else:
+            coincidencia = MUESTRA.match(linea)
+            assert coincidencia, f"línea mal formada: {linea!r}"
+            nombre, etiquetas, valor = coincidencia.groups()
+            base = re.sub(r"_(bucket|sum|count)$", "", nombre)
+            familia = familias.get(nombre) or familias.get(base)
+            assert familia is not None and "tipo" in familia, f"muestra sin TYPE: {linea!r}"
+            familia["muestras"].append((nombre, leer_etiquetas(etiquetas or ""), float(valor)))
+    return familias
+
+
+@pytest.fixture
+def metricas():
+    metricas = Metricas()
+    for segundos in (0.0002, 0.003, 0.003, 0.7, 42.0):
+        metricas.observar("prediccion", segundos, modelo="psico")
+    with pytest.raises(ValueError):
+        with metricas.medir("envio"):
+            raise ValueError
+    metricas.contar("lecturas_hoja", origen="remotas")
+    metricas.contar("lecturas_hoja", 4, origen="cache")
+    metricas.contar("errores", motivo='texto con "comillas", \\barra\\ y\nsalto')
+    metricas.fijar("cola_pendientes", 7)
+    return metricas
+
+
+def test_tipos_y_ayuda(metricas):
+    familias = leer(metricas.prometheus())
+    assert familias["sat_etapa_segundos"]["tipo"] == "histogram" and familias["sat_etapa_segundos"]["ayuda"]
+    assert familias["sat_lecturas_hoja_total"]["tipo"] == "counter"
+    assert familias["sat_errores_total"]["tipo"] == "counter"
+    assert familias["sat_cola_pendientes"]["tipo"] == "gauge"
+    assert familias["sat_cola_pendientes"]["muestras"] == [("sat_cola_pendientes", {}, 7.0)]
+    lecturas = {etiquetas["origen"]: valor for _, etiquetas, valor in familias["sat_lecturas_hoja_total"]["muestras"]}
+    assert lecturas == {"remotas": 1.0, "cache": 4.0}
+
+
+def test_histograma_con_buckets_acumulados(metricas):
+    muestras = leer(metricas.prometheus())["sat_etapa_segundos"]["muestras"]
+    prediccion = [(nombre, etiquetas, valor) for nombre, etiquetas, valor in muestras
+                  if etiquetas.get("etapa") == "prediccion"]
+    buckets = [(etiquetas["le"], valor) for nombre, etiquetas, valor in prediccion if nombre.endswith("_bucket")]
+    assert all(etiquetas["modelo"] == "psico" for _, etiquetas, _ in prediccion)
+    # Un bucket por límite, en orden creciente, con conteos acumulados y +Inf al final
+    assert [float(limite) for limite, _ in buckets] == list(LIMITES)
+    assert buckets[-1][0] == "+Inf"
+    conteos = [valor for _, valor in buckets]
+    assert conteos == sorted(conteos)
+    assert dict(buckets)["0.0005"] == 1 and dict(buckets)["0.005"] == 3 and dict(buckets)["1.0"] == 4
+    resumen = {nombre.rsplit("_", 1)[1]: valor for nombre, _, valor in prediccion if not nombre.endswith("_bucket")}
+    assert resumen["count"] == conteos[-1] == 5
+    assert math.isclose(resumen["sum"], 0.0002 + 0.003 + 0.003 + 0.7 + 42.0)
+
+
+def test_etapa_con_error_lleva_su_etiqueta(metricas):
+    muestras = leer(metricas.prometheus())["sat_etapa_segundos"]["muestras"]
+    assert [etiquetas for nombre, etiquetas, _ in muestras if nombre.endswith("_count")
+            and etiquetas["etapa"] == "envio"] == [{"etapa": "envio", "error": "si"}]
+
+
+def test_valores_de_etiqueta_escapados(metricas):
+    texto = metricas.prometheus()
+    # El salto de línea del valor no parte la muestra en dos líneas
+    assert all(linea.startswith(("#", "sat_")) for linea in texto.splitlines())
+    [(_, etiquetas, valor)] = leer(texto)["sat_errores_total"]["muestras"]
+    assert etiquetas == {"motivo": 'texto con "comillas", \\barra\\ y\nsalto'} and valor == 1
+
+
+def test_sin_mediciones():
+    familias = leer(Metricas().prometheus())
+    assert familias == {"sat_etapa_segundos": {"muestras": [], "ayuda": familias["sat_etapa_segundos"]["ayuda"],
+                                               "tipo": "histogram"}}
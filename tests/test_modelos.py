@@ -0,0 +1,70 @@
+import shutil
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from sat.modelos import ARCHIVOS_MODELOS, DIRECTORIO_COMPACTOS, RUTA_BASE, RegistroModelos, calcular_checksum
+from sat.tablas_riesgo import RegistroTablas, archivo_tabla, combinaciones, dominios_componente
+
+ARCHIVOS = {"proyecto": ARCHIVOS_MODELOS["proyecto"]}
+
+
+def copiar_artefactos(destino):
+    # El .pkl, su tabla precalculada y su bosque compacto, como se publican junto a la aplicación
+    shutil.copy(RUTA_BASE / ARCHIVOS["proyecto"], destino / ARCHIVOS["proyecto"])
+    shutil.copy(RUTA_BASE / archivo_tabla("proyecto"), destino / archivo_tabla("proyecto"))
+    shutil.copytree(RUTA_BASE / DIRECTORIO_COMPACTOS / "proyecto", destino / DIRECTORIO_COMPACTOS / "proyecto")
+
+
+def reentrenado(ruta):
+    # Otro modelo con las mismas variables: el mismo bosque con la mitad de los árboles
+    modelo = joblib.load(ruta)
+    modelo.estimators_ = modelo.estimators_[:len(modelo.estimators_) // 2]
+    modelo.n_estimators = len(modelo.estimators_)
+    return modelo
+
+
+def test_cambiar_el_pkl_recarga_el_modelo_y_descarta_compacto_y_tabla(tmp_path):
+    copiar_artefactos(tmp_path)
+    ruta = tmp_path / ARCHIVOS["proyecto"]
+    registro = RegistroModelos(ruta_base=tmp_path, archivos=ARCHIVOS, intervalo_verificacion=0)
+    tablas = RegistroTablas(tmp_path, ARCHIVOS, intervalo_verificacion=0)
+    X = combinaciones(dominios_componente("proyecto"))
+
+    registro.obtener_compilado("proyecto")
+    original = calcular_checksum(ruta)
+    assert registro.metricas()["proyecto"]["compilado"] == "compacto"
+    assert registro.version_compilado("proyecto") == original
+    assert tablas.obtener("proyecto") is not None
+
+    # Se publica otro .pkl en el mismo lugar mientras el proceso sigue en marcha
+    nuevo = reentrenado(ruta)
+    joblib.dump(nuevo, ruta)
+    compilado = registro.obtener_compilado("proyecto")
+    metricas = registro.metricas()["proyecto"]
+    assert registro.version_compilado("proyecto") == calcular_checksum(ruta) != original
+    # El compacto corresponde al .pkl anterior: el bosque se compila a partir del modelo de sklearn nuevo
+    assert metricas["compilado"] == "sklearn" and metricas["cargas"] == 1
+    np.testing.assert_array_equal(compilado.predict(X), nuevo.predict(pd.DataFrame(X, columns=nuevo.feature_names_in_)))
+    assert len(compilado.raices) == nuevo.n_estimators
+    # La tabla se calculó con el modelo anterior: deja de usarse
+    assert tablas.obtener("proyecto") is None
+
+    # Al volver al .pkl original, el compacto y la tabla vuelven a ser vigentes
+    shutil.copy(RUTA_BASE / ARCHIVOS["proyecto"], ruta)
+    registro.obtener_compilado("proyecto")
+    assert registro.version_compilado("proyecto") == original
+    assert registro.metricas()["proyecto"]["compilado"] == "compacto"
+    assert tablas.obtener("proyecto") is not None
+
+
+def test_pkl_tocado_sin_cambios_no_recarga(tmp_path):
+    copiar_artefactos(tmp_path)
+    ruta = tmp_path / ARCHIVOS["proyecto"]
+    registro = RegistroModelos(ruta_base=tmp_path, archivos=ARCHIVOS, intervalo_verificacion=0)
+    registro.obtener("proyecto")
+    compilado = registro.obtener_compilado("proyecto")
+    ruta.write_bytes(ruta.read_bytes())  # nueva fecha, mismo contenido
+    assert registro.obtener_compilado("proyecto") is compilado
+    assert registro.metricas()["proyecto"]["cargas"] == 1
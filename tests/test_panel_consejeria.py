@@ -0,0 +1,26 @@
+import pytest
+from streamlit.testing.v1 import AppTest
+
+CLAVE = "contraseña"
+
+
+@pytest.fixture
+def panel(tmp_path, monkeypatch):
+    monkeypatch.setenv("SAT_CLAVE_PANEL", CLAVE)
+    monkeypatch.setenv("SAT_AGREGADOS", str(tmp_path / "agregados.sqlite"))
+    return AppTest.from_file("../pages/panel_consejeria.py", default_timeout=30).run()
+
+
+@pytest.mark.parametrize("ingresada", ["contrasena", "contraseñа", "ñ"])
+def test_clave_incorrecta_se_rechaza(panel, ingresada):
+    panel.text_input[0].input(ingresada).run()
+    assert not panel.exception
+    assert [error.value for error in panel.error] == ["Clave incorrecta."]
+    assert "panel_autorizado" not in panel.session_state
+
+
+def test_clave_correcta_con_caracteres_no_ascii(panel):
+    panel.text_input[0].input(CLAVE).run()
+    assert not panel.exception
+    assert panel.session_state["panel_autorizado"]
+    assert not panel.error
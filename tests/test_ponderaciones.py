@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sat.cuestionario import PREGUNTAS_CUESTIONARIO
+from sat.ponderaciones import PREGUNTAS, PUNTUACIONES
+
+# Tabla de ponderaciones que usaba el df_numeric original (ver tests/test_puntaje.py)
+ORIGINAL = pd.read_csv(Path(__file__).parent / "datos" / "ponderaciones_original.csv", sep=";", engine="python")
+PREGUNTA_SITUACIONES = "¿Actualmente en su familia se presentan algunas de las siguientes situaciones?"
+PUNTUADAS = [pregunta for pregunta in PREGUNTAS_CUESTIONARIO if pregunta.componente is not None]
+
+
+def puntuacion_original(pregunta, texto):
+    # La selección múltiple no se puntuaba con la tabla: "Ninguna" valía 1 y cualquier otra situación 5
+    if pregunta.columna == PREGUNTA_SITUACIONES:
+        return 1 if texto in ("Ninguna", "Ninguno") else 5
+    filas = ORIGINAL[(ORIGINAL["PREGUNTA"] == pregunta.columna) & (ORIGINAL["RESPUESTA"] == texto)]
+    return filas["PUNTUACION"].item() if len(filas) else None
+
+
+def test_preguntas_iguales_a_la_tabla_original():
+    for componente, preguntas in PREGUNTAS.items():
+        assert list(preguntas) == ORIGINAL.loc[ORIGINAL["CARACTERISTICA"] == componente, "PREGUNTA"].unique().tolist()
+
+
+@pytest.mark.parametrize("pregunta", PUNTUADAS, ids=lambda pregunta: f"{pregunta.componente[:10]}-{pregunta.posicion}")
+def test_cada_opcion_y_alias_tiene_la_puntuacion_original(pregunta):
+    tabla = PUNTUACIONES[pregunta.componente][pregunta.columna]
+    for opcion in pregunta.opciones:
+        textos = (opcion.texto, *opcion.alias)
+        originales = {puntuacion_original(pregunta, texto) for texto in textos} - {None}
+        # Al menos una escritura de la opción estaba en la tabla original, todas con la misma puntuación
+        assert originales == {opcion.puntuacion}, textos
+        for texto in textos:
+            assert tabla[texto] == opcion.puntuacion, texto
+
+
+def test_la_tabla_original_queda_cubierta():
+    # Toda respuesta de la tabla original sigue teniendo su puntuación, como opción o como alias
+    for pregunta, respuesta, puntuacion, componente in ORIGINAL.itertuples(index=False):
+        assert PUNTUACIONES[componente][pregunta][respuesta] == puntuacion, (pregunta, respuesta)
+
+
+@pytest.mark.parametrize("pregunta, texto, alias", [
+    ("¿Cuál era el nombre de la mujer que protagoniza la historia?", "Aura", "Aura."),
+    (PREGUNTA_SITUACIONES, "Ninguna", "Ninguno"),
+    ("Elija la opción que mejor refleje su entorno familiar:",
+     "En mi hogar no hay establecidas normas de convivencia", "En mi casa no hay establecidas normas de convivencia"),
+])
+def test_alias_conocidos(pregunta, texto, alias):
+    tabla = next(PUNTUACIONES[p.componente][p.columna] for p in PUNTUADAS if p.columna == pregunta)
+    assert tabla[texto] == tabla[alias]
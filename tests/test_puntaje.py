@@ -0,0 +1,146 @@
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sat.modelos import registro
+from sat.puntaje import (
+    COLUMNAS_RIESGO,
+    COMPONENTES,
+    Asignacion_SAT,
+    clasificar_respuestas,
+    codificar_lote,
+    codificar_respuestas,
+    codificar_situaciones,
+    df_numeric,
+    mapa_etiquetas,
+    selected_questions_economico,
+    selected_questions_familiar,
+    selected_questions_proyecto,
+    selected_questions_psico,
+)
+from sat.sinteticos import generar_filas, generar_indices
+
+# Tabla de ponderaciones que la aplicación original tenía como texto CSV dentro de Asignacion_SAT
+PONDERACIONES_ORIGINAL = Path(__file__).parent / "datos" / "ponderaciones_original.csv"
+PREGUNTA_SITUACIONES = "¿Actualmente en su familia se presentan algunas de las siguientes situaciones?"
+# Opciones que los widgets de la aplicación original escribían distinto que la tabla (y que por eso no se podían
+# puntuar): se escriben como en la tabla antes de aplicar la codificación original
+ESCRITURA_ORIGINAL = {
+    "Aura": "Aura.",
+    "En mi hogar las normas se establecen a través de la negociación":
+        "En casa, mis padres (o acudientes) establecen las normas a través de la negociación.",
+    "Las normas del hogar ya están establecidas y todos las cumplimos":
+        "Mis padres establecen las normas del hogar y todos las cumplimos.",
+    "Hay normas establecidas, pero no las cumplo porque no estoy de acuerdo":
+        "Hay normas establecidas por mis padres (o acudientes), pero no las cumplo porque no estoy de acuerdo.",
+    "No me quedan muy claras cuáles son las normas de convivencia que hay en el hogar":
+        "No me quedan muy claras cuáles son las normas de convivencia que hay en casa",
+    "En mi hogar no hay establecidas normas de convivencia": "En mi casa no hay establecidas normas de convivencia",
+    "Más de 2 y menos de 3 salarios mensuales mínimos legales vigentes.":
+        "Más de 2 y menos de 3 salarios mensuales  mínimos legales vigentes.",
+}
+FILAS = 600
+SEMILLA = 7
+
+
+def ponderaciones_original():
+    return pd.read_csv(PONDERACIONES_ORIGINAL, sep=";", engine="python")
+
+
+def df_numeric_original(X):
+    # Codificación de la aplicación original: reemplazo de textos por puntuaciones, pregunta por pregunta
+    ponderaciones = ponderaciones_original()
+    X = X.replace(ESCRITURA_ORIGINAL)
+
+    def componente(caracteristica, seleccionadas, como_texto=False):
+        preguntas = ponderaciones.loc[ponderaciones["CARACTERISTICA"] == caracteristica, "PREGUNTA"].unique()
+        df = X[preguntas].astype(str).copy() if como_texto else X[preguntas].copy()
+        expandidas = None
+        for pregunta in preguntas:
+            if como_texto and pregunta == PREGUNTA_SITUACIONES:
+                expandidas = df[pregunta].apply(lambda texto: ([frase.strip() for frase in texto.split(",")]
+                                                               + [None] * 9)[:9]).apply(pd.Series)
+                expandidas = expandidas.apply(lambda columna: columna.map(
+                    lambda valor: 0 if pd.isna(valor) or valor == "" else 1 if valor == "Ninguna" else 5))
+                df = df.drop(columns=[pregunta])
+                continue
+            reemplazos = ponderaciones.loc[ponderaciones["PREGUNTA"] == pregunta, "RESPUESTA"].values.tolist()
+            puntuaciones = ponderaciones.loc[ponderaciones["PREGUNTA"] == pregunta, "PUNTUACION"].values.tolist()
+            df.loc[:, pregunta] = df.loc[:, pregunta].replace(reemplazos, puntuaciones).infer_objects(copy=False)
+        if expandidas is not None:
+            df = pd.concat([df, expandidas], axis=1)
+        df.columns = [f"Pregunta{i + 1}" for i in range(df.shape[1])]
+        return df[seleccionadas].astype(float)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return (componente("PROYECTO DE VIDA ACADEMICA-PROFESIONAL", selected_questions_proyecto),
+                componente("FAMILIAR", selected_questions_familiar, como_texto=True),
+                componente("ECONOMICA", selected_questions_economico),
+                componente("PSICOSOCIAL", selected_questions_psico))
+
+
+def asignacion_original(X):
+    # Asignacion_SAT original: los modelos de sklearn sobre la codificación original
+    return tuple(np.vectorize(mapa_etiquetas.get)(registro.obtener(nombre).predict(df))
+                 for (nombre, _), df in zip(COMPONENTES, df_numeric_original(X)))
+
+
+@pytest.fixture(scope="module")
+def filas():
+    return generar_filas(FILAS, semilla=SEMILLA)
+
+
+@pytest.fixture(scope="module")
+def indices():
+    # Las mismas respuestas que `filas`, como índices de opción de los widgets
+    return generar_indices(FILAS, semilla=SEMILLA)
+
+
+@pytest.fixture(scope="module")
+def esperado(filas):
+    return df_numeric_original(filas)
+
+
+def test_codificar_lote_igual_a_la_codificacion_original(filas, esperado):
+    for matriz, original in zip(codificar_lote(filas), esperado):
+        np.testing.assert_array_equal(matriz, original.to_numpy())
+    for df, original in zip(df_numeric(filas), esperado):
+        pd.testing.assert_frame_equal(df, original)
+
+
+def test_codificar_respuestas_igual_a_la_codificacion_original(indices, esperado):
+    for matriz, original in zip(codificar_respuestas(indices), esperado):
+        np.testing.assert_array_equal(matriz, original.to_numpy())
+
+
+def test_codificar_situaciones_igual_a_la_expansion_original(filas):
+    # Celdas de la hoja y casos que los widgets no producen: vacía, opciones desconocidas y más de 9 opciones
+    celdas = filas[PREGUNTA_SITUACIONES].tolist() + ["", "Otra situación", "Ninguna, Otra", ",".join(["Ninguna"] * 12)]
+    X = pd.DataFrame({PREGUNTA_SITUACIONES: celdas})
+    expandidas = X[PREGUNTA_SITUACIONES].apply(lambda texto: ([frase.strip() for frase in texto.split(",")]
+                                                              + [None] * 9)[:9]).apply(pd.Series)
+    original = expandidas.apply(lambda columna: columna.map(
+        lambda valor: 0 if pd.isna(valor) or valor == "" else 1 if valor == "Ninguna" else 5))
+    np.testing.assert_array_equal(codificar_situaciones(X[PREGUNTA_SITUACIONES].to_numpy()), original.to_numpy())
+
+
+def test_etiquetas_iguales_a_la_asignacion_original(filas, indices):
+    original = asignacion_original(filas)
+    # Ruta de texto en un lote grande (sklearn) y en uno pequeño (bosque compilado y caché)
+    for etiquetas, esperadas in zip(Asignacion_SAT(filas), original):
+        np.testing.assert_array_equal(etiquetas, esperadas)
+    for etiquetas, esperadas in zip(Asignacion_SAT(filas.iloc[:50]), original):
+        np.testing.assert_array_equal(etiquetas, esperadas[:50])
+    # Ruta de índices en lotes pequeños
+    por_indices = pd.concat([clasificar_respuestas(indices[inicio:inicio + 50])
+                             for inicio in range(0, FILAS, 50)], ignore_index=True)
+    for columna, esperadas in zip(COLUMNAS_RIESGO, original):
+        np.testing.assert_array_equal(por_indices[columna].to_numpy(), esperadas)
+    # Ruta de índices en un solo lote grande
+    grande = clasificar_respuestas(indices)
+    for columna, etiquetas in zip(COLUMNAS_RIESGO, Asignacion_SAT(filas)):
+        np.testing.assert_array_equal(grande[columna].to_numpy(), etiquetas)
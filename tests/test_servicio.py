@@ -0,0 +1,111 @@
+import threading
+from concurrent.futures import TimeoutError
+
+import pandas as pd
+import pytest
+
+from sat.puntaje import CODIFICACION, COLUMNAS_RIESGO, clasificar_respuestas
+from sat.servicio import ServicioClasificacion
+from sat.sinteticos import generar_indices
+
+RESPUESTAS = generar_indices(8, semilla=3)
+
+
+def esperado(respuesta):
+    return clasificar_respuestas([respuesta]).iloc[0].tolist()
+
+
+class ClasificadorControlado:
+    """Clasificador de prueba: falla con las respuestas marcadas y puede retener los lotes hasta que se libere."""
+
+    def __init__(self):
+        self.liberar = threading.Event()
+        self.liberar.set()
+        self.empezo = threading.Event()
+        self.lotes = []
+
+    def __call__(self, respuestas):
+        self.lotes.append(len(respuestas))
+        self.empezo.set()
+        self.liberar.wait()
+        if any(respuesta == "inválida" for respuesta in respuestas):
+            raise ValueError("respuesta sin ponderación")
+        return pd.DataFrame([[str(respuesta)] * len(COLUMNAS_RIESGO) for respuesta in respuestas],
+                            columns=COLUMNAS_RIESGO)
+
+
+def test_agrupa_y_clasifica_como_clasificar_respuestas():
+    servicio = ServicioClasificacion(espera_maxima=0.05)
+    futuros = [servicio.enviar(respuesta) for respuesta in RESPUESTAS]
+    assert [futuro.result(30) for futuro in futuros] == [esperado(respuesta) for respuesta in RESPUESTAS]
+    assert servicio.estadisticas()["solicitudes"] == len(RESPUESTAS)
+    assert servicio.detener(timeout=5)
+
+
+def test_respuesta_invalida_solo_falla_su_solicitud():
+    clasificador = ClasificadorControlado()
+    clasificador.liberar.clear()
+    servicio = ServicioClasificacion(clasificar=clasificador)
+    bloqueante = servicio.enviar("primera")
+    clasificador.empezo.wait(5)
+    # Mientras se clasifica la primera, las demás se acumulan en un solo lote con una respuesta inválida
+    futuros = [servicio.enviar(respuesta) for respuesta in ("a", "inválida", "b")]
+    clasificador.liberar.set()
+    assert bloqueante.result(5) == ["primera"] * len(COLUMNAS_RIESGO)
+    assert futuros[0].result(5) == ["a"] * len(COLUMNAS_RIESGO)
+    with pytest.raises(ValueError, match="sin ponderación"):
+        futuros[1].result(5)
+    assert futuros[2].result(5) == ["b"] * len(COLUMNAS_RIESGO)
+    # El lote de tres falló y cada solicitud se reintentó sola
+    assert clasificador.lotes == [1, 3, 1, 1, 1]
+    # El hilo sigue atendiendo solicitudes después del error
+    assert servicio.clasificar("c", timeout=5) == ["c"] * len(COLUMNAS_RIESGO)
+    assert servicio.detener(timeout=5)
+
+
+def test_respuesta_invalida_con_los_modelos():
+    servicio = ServicioClasificacion(espera_maxima=0.05)
+    invalida = list(RESPUESTAS[0])
+    posicion, _, _ = CODIFICACION["proyecto"][0]
+    invalida[posicion] = 99  # índice de opción inexistente en una pregunta que usa el modelo
+    futuros = [servicio.enviar(RESPUESTAS[1]), servicio.enviar(invalida), servicio.enviar(RESPUESTAS[2])]
+    assert futuros[0].result(30) == esperado(RESPUESTAS[1])
+    with pytest.raises(IndexError):
+        futuros[1].result(30)
+    assert futuros[2].result(30) == esperado(RESPUESTAS[2])
+    servicio.detener(timeout=5)
+
+
+def test_tiempo_agotado_cancela_la_solicitud():
+    clasificador = ClasificadorControlado()
+    clasificador.liberar.clear()
+    servicio = ServicioClasificacion(clasificar=clasificador)
+    bloqueante = servicio.enviar("primera")
+    clasificador.empezo.wait(5)
+    with pytest.raises(TimeoutError):
+        servicio.clasificar("tardía", timeout=0.05)
+    clasificador.liberar.set()
+    assert bloqueante.result(5) == ["primera"] * len(COLUMNAS_RIESGO)
+    # La solicitud cancelada no se clasifica ni detiene el hilo
+    assert servicio.clasificar("siguiente", timeout=5) == ["siguiente"] * len(COLUMNAS_RIESGO)
+    assert clasificador.lotes == [1, 1]
+    assert servicio.detener(timeout=5)
+
+
+def test_detener_clasifica_lo_pendiente_y_rechaza_solicitudes_nuevas():
+    clasificador = ClasificadorControlado()
+    clasificador.liberar.clear()
+    servicio = ServicioClasificacion(clasificar=clasificador)
+    futuros = [servicio.enviar("primera")]
+    clasificador.empezo.wait(5)
+    futuros += [servicio.enviar(respuesta) for respuesta in ("a", "b")]
+    assert not servicio.detener(timeout=0.05)  # el lote en curso sigue retenido
+    clasificador.liberar.set()
+    assert servicio.detener(timeout=5)
+    assert [futuro.result(0) for futuro in futuros] == [[r] * len(COLUMNAS_RIESGO) for r in ("primera", "a", "b")]
+    with pytest.raises(RuntimeError, match="detenido"):
+        servicio.enviar("c")
+
+
+def test_detener_sin_solicitudes():
+    assert ServicioClasificacion().detener(timeout=1)
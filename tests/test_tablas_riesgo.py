@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sat.modelos import RUTA_BASE, registro
+from sat.tablas_riesgo import archivo_tabla, cargar_tabla, combinaciones, dominios_componente
+
+# Componentes con tabla publicada junto a los .pkl (psicosocial se clasifica con el bosque)
+NOMBRES = [nombre for nombre in registro.nombres() if (RUTA_BASE / archivo_tabla(nombre)).exists()]
+
+
+def test_hay_tablas_publicadas():
+    assert set(NOMBRES) == {"proyecto", "familiar", "economica"}
+
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_tabla_igual_a_sklearn_en_todo_el_dominio(nombre):
+    tabla = cargar_tabla(RUTA_BASE / archivo_tabla(nombre))
+    assert tabla.checksum == registro.checksum(nombre)
+    for dominio, esperado in zip(tabla.dominios, dominios_componente(nombre)):
+        np.testing.assert_array_equal(dominio, esperado)
+
+    modelo = registro.obtener(nombre)
+    X = combinaciones(tabla.dominios)
+    np.testing.assert_array_equal(tabla.clasificar(X), modelo.predict(pd.DataFrame(X, columns=modelo.feature_names_in_)))
+
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_tabla_no_cubre_valores_fuera_del_dominio(nombre):
+    tabla = cargar_tabla(RUTA_BASE / archivo_tabla(nombre))
+    X = combinaciones(tabla.dominios)[:10].copy()
+    X[:, 0] = tabla.dominios[0].max() + 0.5
+    assert (tabla.clasificar(X) == -1).all()